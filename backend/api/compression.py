@@ -0,0 +1,190 @@
+"""
+Response Compression Middleware
+
+Purpose:
+    Compresses API responses with brotli (when installed) or gzip, chosen from
+    the client's Accept-Encoding. Small bodies are sent as-is, since below a
+    few hundred bytes compression costs more than it saves. Responses that
+    already carry a Content-Encoding (the gzipped export, precompressed cache
+    blobs) and already-compressed media types are passed through untouched.
+    Streaming responses are compressed chunk by chunk.
+
+Usage:
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, gzip_level=6)
+
+Requires (optional, for Content-Encoding: br):
+    pip install brotli
+"""
+
+import zlib
+from typing import Dict, Optional, Set
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Media types that are already compressed
+EXCLUDED_CONTENT_TYPES = {
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/zstd",
+    "audio/*",
+    "image/*",
+    "video/*",
+    "text/event-stream",
+}
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into encoding -> q-value.
+    
+    Args:
+        header: Header value, e.g. "gzip, br;q=0.9, *;q=0"
+    
+    Returns:
+        Dict of lower-cased encoding names to their q-values
+    """
+    encodings = {}
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        encodings[name] = q
+    return encodings
+
+
+def accepted_encodings(header: str) -> Set[str]:
+    """Encodings a client explicitly accepts (q > 0)."""
+    return {name for name, q in parse_accept_encoding(header).items() if q > 0 and name != "*"}
+
+
+class _StreamCompressor:
+    """Incremental gzip/brotli compressor for one response body."""
+    
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compress a chunk; intermediate chunks are flushed so clients can decode them as they arrive."""
+        if self.encoding == "br":
+            return self._compressor.process(data) + (self._compressor.finish() if final else self._compressor.flush())
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with brotli or gzip."""
+    
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        """
+        Args:
+            app: ASGI application
+            minimum_size: Smallest body (bytes) worth compressing; streaming
+                responses are always compressed
+            gzip_level: zlib compression level (1-9)
+            brotli_quality: Brotli quality (0-11)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+    
+    def choose_encoding(self, header: str) -> Optional[str]:
+        """Preferred supported encoding for an Accept-Encoding header, or None."""
+        encodings = parse_accept_encoding(header)
+        wildcard = encodings.get("*", 0.0)
+        candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+        best, best_q = None, 0.0
+        for encoding in candidates:
+            q = encodings.get(encoding, wildcard)
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = self.choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message = None
+        compressor = None
+        passthrough = False
+        
+        async def send_compressed(message) -> None:
+            nonlocal start_message, compressor, passthrough
+            
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+                passthrough = (
+                    "content-encoding" in headers
+                    or message["status"] in (204, 206, 304)
+                    or media_type in EXCLUDED_CONTENT_TYPES
+                    or media_type.partition("/")[0] + "/*" in EXCLUDED_CONTENT_TYPES
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    # Headers depend on the first body chunk
+                    start_message = message
+                return
+            
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                
+                compressor = _StreamCompressor(encoding, self.gzip_level, self.brotli_quality)
+                body = compressor.compress(body, final=not more_body)
+                headers["Content-Encoding"] = encoding
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                start_message = None
+            else:
+                body = compressor.compress(body, final=not more_body)
+            
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+        
+        await self.app(scope, receive, send_compressed)
@@ -9,34 +9,64 @@ ENDPOINTS:
     GET /api/health - Health check
     GET /api/companies - List all companies with data
     GET /api/news/{company} - Get news articles for a company
+    GET /api/export/{company} - Stream all articles for a company (NDJSON/CSV)
     GET /api/sentiment/{company} - Get sentiment timeline
     GET /api/correlation/{company} - Get news-to-price correlation
     GET /api/impact-events/{company} - Get high-impact news events
     GET /api/sentiment-distribution - Get overall sentiment distribution
+    GET /api/dashboard - Companies, sentiment distribution and top timelines in one call
+    GET /api/batch/sentiment?companies=A,B - Sentiment timelines for many companies
+    GET /api/batch/chart-events?companies=A,B - Chart events for many companies
 
 USAGE:
     uvicorn api.main:app --reload --host 0.0.0.0 --port 8000
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from pydantic import BaseModel
+import asyncio
+import base64
+import binascii
+import csv
+import functools
+import inspect
+import io
+import json
+import logging
+import os
 import sys
+import time
+import zlib
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ingestion.elastic_client import get_es_client
-from cache.redis_client import get_redis_client
+from ingestion.elastic_client import get_async_es_client
+from api.compression import CompressionMiddleware, accepted_encodings
+from api.queries import (
+    CHART_EVENTS_CACHE_MAX_EVENTS, CHART_EVENTS_DEFAULT_LIMIT, RESPONSE_CACHE_TTLS,
+    chart_events_query, company_filter, fetch_chart_events, fetch_companies, fetch_dashboard,
+    fetch_sentiment_timeline, fill_chart_events, params_hash, parse_chart_event_page,
+    parse_sentiment_distribution, parse_sentiment_timeline, refresh_chart_events,
+    serialize_body, sentiment_timeline_query
+)
+from api.responses import ORJSONResponse, dumps
+from cache.redis_client import get_redis_client, to_epoch_ms
+from cache.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="News Analytics API",
     description="REST API for NIFTY50 news sentiment analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration for React frontend
@@ -48,16 +78,349 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# brotli/gzip for responses of at least RESPONSE_COMPRESSION_MIN_SIZE bytes;
+# responses that already set Content-Encoding are sent as-is
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024")),
+    gzip_level=int(os.getenv("RESPONSE_GZIP_LEVEL", "6")),
+    brotli_quality=int(os.getenv("RESPONSE_BROTLI_QUALITY", "4")),
+)
+
 # Initialize Elasticsearch client
 es = None
 cache = None
+# Concurrent identical cache misses in this worker share one load
+single_flight = SingleFlight()
+
+# Pre-populate the cache in the background once the API has started
+CACHE_WARM_ON_STARTUP = os.getenv("CACHE_WARM_ON_STARTUP", "true").lower() == "true"
+warm_task = None
+
+# Write chart-event cache fills after the response is sent instead of inline
+CACHE_FILL_IN_BACKGROUND = os.getenv("CACHE_FILL_IN_BACKGROUND", "false").lower() == "true"
+
+# Browsers and proxies may reuse a response for this long, then revalidate it
+# with If-None-Match; ETags change only when the data generation does
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))
+
+# Cross-worker fill lock: the holder queries Elasticsearch while other workers
+# poll Redis for its result, falling back to their own query after the wait
+CACHE_FILL_LOCK_TTL_MS = int(os.getenv("CACHE_FILL_LOCK_TTL_MS", "10000"))
+CACHE_FILL_WAIT_MS = int(os.getenv("CACHE_FILL_WAIT_MS", "3000"))
+CACHE_FILL_POLL_MS = int(os.getenv("CACHE_FILL_POLL_MS", "50"))
+
+# How long a /api/news point-in-time stays open between page requests
+NEWS_PIT_KEEP_ALIVE = os.getenv("NEWS_PIT_KEEP_ALIVE", "1m")
+
+# Most companies accepted by one /api/batch request
+BATCH_MAX_COMPANIES = int(os.getenv("BATCH_MAX_COMPANIES", "50"))
+
+# Bulk export: parallel PIT slices, hits per search page and gzip level
+EXPORT_SLICES = int(os.getenv("EXPORT_SLICES", "2"))
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", "1000"))
+EXPORT_GZIP_LEVEL = int(os.getenv("EXPORT_GZIP_LEVEL", "6"))
+EXPORT_PIT_KEEP_ALIVE = os.getenv("EXPORT_PIT_KEEP_ALIVE", "2m")
+
+# Fields each read endpoint returns (and the default projection for `fields=`).
+# Only these are requested in _source, so large fields such as the embedding
+# never leave Elasticsearch.
+NEWS_ARTICLE_FIELDS = [
+    "title", "url", "company", "sentiment_label", "sentiment_score", "seendate",
+    "domain", "language", "sourceCountry", "impact_score"
+]
+IMPACT_EVENT_FIELDS = [
+    "title", "url", "sentiment_label", "sentiment_score", "impact_score",
+    "seendate", "price_change_pct", "domain"
+]
+# Event detail response field -> stock_news field
+EVENT_DETAIL_FIELDS = {
+    "timestamp": "seendate",
+    "title": "title",
+    "sentiment_label": "sentiment_label",
+    "sentiment_score": "sentiment_score",
+    "impact_score": "impact_score",
+    "price_change_pct": "price_change_pct",
+    "price_before": "price_before",
+    "price_after": "price_after",
+    "url": "url",
+    "domain": "domain",
+    "related_entities": "related_entities",
+}
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize Elasticsearch and Redis connections on startup."""
-    global es, cache
-    es = get_es_client()
-    cache = get_redis_client()
+    """Initialize Elasticsearch and Redis connections on startup, then warm the cache."""
+    global es, cache, warm_task
+    es = await get_async_es_client()
+    cache = get_redis_client(async_client=True)
+    await cache.connect()
+    
+    if CACHE_WARM_ON_STARTUP and cache.enabled:
+        from api.warmer import warm_cache
+        warm_task = asyncio.create_task(warm_cache(es, cache))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled Elasticsearch and Redis connections on shutdown."""
+    if warm_task is not None and not warm_task.done():
+        warm_task.cancel()
+    if es is not None:
+        await es.close()
+    if cache is not None:
+        await cache.close()
+
+
+async def coalesced_fetch(
+    flight_key: tuple,
+    fetch,
+    fill=None,
+    read_cached=None,
+    background_tasks: Optional[BackgroundTasks] = None
+):
+    """
+    Load a missed cache entry once across concurrent requests and workers.
+    
+    Requests in this worker sharing flight_key await a single load. When fill
+    and read_cached are given, workers also race for a short Redis lock: the
+    holder runs fetch and fills the cache before releasing it, the others poll
+    read_cached until CACHE_FILL_WAIT_MS and only then run fetch themselves.
+    
+    Args:
+        flight_key: Identity of the load (route, scope, generation, params)
+        fetch: Coroutine function querying Elasticsearch
+        fill: Coroutine function storing fetch's result in the cache
+        read_cached: Coroutine function returning the cached value or None
+        background_tasks: Run fill (and the lock release) after the response
+            is sent when CACHE_FILL_IN_BACKGROUND is set
+    
+    Returns:
+        Result of fetch, or the value another worker cached
+    """
+    async def load():
+        if fill is None or read_cached is None or not cache.enabled:
+            return await fetch()
+        
+        lock_name = ":".join(str(part) for part in flight_key)
+        token = await cache.acquire_lock(lock_name, CACHE_FILL_LOCK_TTL_MS)
+        if token is None:
+            deadline = time.monotonic() + CACHE_FILL_WAIT_MS / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(CACHE_FILL_POLL_MS / 1000)
+                cached_value = await read_cached()
+                if cached_value is not None:
+                    return cached_value
+            return await fetch()
+        
+        async def fill_and_release(value):
+            try:
+                await fill(value)
+            finally:
+                await cache.release_lock(lock_name, token)
+        
+        try:
+            value = await fetch()
+        except BaseException:
+            await cache.release_lock(lock_name, token)
+            raise
+        
+        if CACHE_FILL_IN_BACKGROUND and background_tasks is not None:
+            background_tasks.add_task(fill_and_release, value)
+        else:
+            await fill_and_release(value)
+        return value
+    
+    return await single_flight.do(flight_key, load)
+
+
+def news_conditions(
+    company: str,
+    sentiment: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Query clauses for the /api/news filters (shared with the bulk export)."""
+    must_conditions = [
+        company_filter(company)
+    ]
+    
+    if sentiment:
+        must_conditions.append({"term": {"sentiment_label": sentiment}})
+    
+    if start_date or end_date:
+        date_range = {}
+        if start_date:
+            date_range["gte"] = start_date
+        if end_date:
+            date_range["lte"] = end_date
+        must_conditions.append({"range": {"seendate": date_range}})
+    
+    return must_conditions
+
+
+def news_article(doc: Dict[str, Any], fields: List[str] = NEWS_ARTICLE_FIELDS) -> Dict[str, Any]:
+    """Shape a stock_news document as a /api/news article with the given fields."""
+    article = {field: doc.get(field) for field in fields}
+    if "impact_score" in article:
+        article["impact_score"] = doc.get("impact_score", 0.0)
+    return article
+
+
+def parse_fields_param(fields: Optional[str], allowed: List[str]) -> List[str]:
+    """
+    Resolve a comma-separated `fields` parameter against the fields an endpoint returns.
+    
+    Args:
+        fields: Requested fields, or None for all of them
+        allowed: Fields the endpoint can return, in response order
+    
+    Returns:
+        Selected fields
+    
+    Raises:
+        HTTPException: 400 if a requested field is unknown
+    """
+    if not fields:
+        return list(allowed)
+    
+    requested = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = [field for field in requested if field not in allowed]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Choose from: {', '.join(allowed)}"
+        )
+    return requested
+
+
+def generation_etag(route: str, key_hash: str, generations: List[int]) -> str:
+    """
+    Weak ETag for a response computed from the given data generations.
+    
+    Generations only change when new data is indexed or the cache is
+    invalidated, so the same ETag means the same data.
+    
+    Args:
+        route: Route name
+        key_hash: Hash of the normalized query parameters
+        generations: Generation of each company (or global) scope the response reads
+    """
+    return f'W/"{route}-{key_hash}-g{".".join(str(g) for g in generations)}"'
+
+
+def etag_matches(request: Optional[Request], etag: str) -> bool:
+    """Whether the request's If-None-Match header covers the ETag (weak comparison)."""
+    header = request.headers.get("if-none-match") if request is not None else None
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag.removeprefix("W/") in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def http_cache_headers(etag: str) -> Dict[str, str]:
+    """ETag and Cache-Control headers for a generation-validated response."""
+    return {"ETag": etag, "Cache-Control": f"public, max-age={HTTP_CACHE_MAX_AGE}"}
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a request whose cached copy is still current."""
+    return Response(status_code=304, headers=http_cache_headers(etag))
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Pack pagination state into an opaque, URL-safe cursor."""
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Unpack a cursor from encode_cursor(); None if missing or malformed."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+    except (binascii.Error, ValueError):
+        return None
+    if not isinstance(state, dict) or not isinstance(state.get("after"), list):
+        return None
+    return state
+
+
+def cached_response(route: str, bypass=None):
+    """
+    Cache an endpoint's serialized JSON body in Redis.
+    
+    The key is built from the route, the company (or global) generation and
+    the normalized parameters, and the stored body is returned as-is on a hit,
+    skipping Elasticsearch, model validation and serialization. TTLs come from
+    RESPONSE_CACHE_TTLS. Concurrent misses for the same key are coalesced
+    (see coalesced_fetch).
+    
+    Responses carry an ETag built from the same generation and parameters;
+    a request whose If-None-Match still matches gets a 304 before Redis or
+    Elasticsearch is touched.
+    
+    Args:
+        route: Route name (key in RESPONSE_CACHE_TTLS)
+        bypass: Optional predicate on the endpoint parameters; requests it
+            returns True for are never cached
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(**kwargs):
+            request = kwargs.pop("request", None)
+            if cache is None or not cache.enabled or (bypass is not None and bypass(kwargs)):
+                return await func(**kwargs)
+            
+            company = kwargs.get("company")
+            generation = await cache.get_generation(company)
+            key_hash = params_hash(kwargs)
+            
+            etag = generation_etag(route, key_hash, [generation])
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            
+            # zstd-compressed cache entries go out as stored to clients that accept zstd
+            body, encoding = await cache.get_encoded_response(
+                route, company, key_hash, generation,
+                accepted_encodings(request.headers.get("accept-encoding", "")) if request is not None else ()
+            )
+            if body is not None:
+                headers = {"X-Cache": "HIT", **http_cache_headers(etag)}
+                if encoding is not None:
+                    headers.update({"Content-Encoding": encoding, "Vary": "Accept-Encoding"})
+                return Response(content=body, media_type="application/json", headers=headers)
+            
+            async def fetch():
+                return serialize_body(await func(**kwargs))
+            
+            async def fill(value):
+                await cache.set_response(route, company, key_hash, generation, value, RESPONSE_CACHE_TTLS[route])
+            
+            async def read_cached():
+                return await cache.get_response(route, company, key_hash, generation)
+            
+            scope = company.strip().lower() if company else None
+            body = await coalesced_fetch(
+                ("response", route, scope, generation, key_hash),
+                fetch, fill, read_cached
+            )
+            return Response(
+                content=body, media_type="application/json",
+                headers={"X-Cache": "MISS", **http_cache_headers(etag)}
+            )
+        
+        # Have FastAPI pass the request (for If-None-Match) without adding it to the endpoint
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+        ])
+        return wrapper
+    return decorator
 
 
 # Pydantic models
@@ -95,7 +458,7 @@ class CompanyInfo(BaseModel):
 async def health_check():
     """Check API and Elasticsearch health."""
     try:
-        es_info = es.info()
+        es_info = await es.info()
         return {
             "status": "healthy",
             "elasticsearch": {
@@ -109,95 +472,70 @@ async def health_check():
 
 
 # Get all companies with data
-@app.get("/api/companies", response_model=List[CompanyInfo])
+# Models document the schema only; results are plain dicts serialized by orjson
+@app.get("/api/companies", responses={200: {"model": List[CompanyInfo]}})
+@cached_response("companies")
 async def get_companies():
     """Get list of all companies with article counts and avg sentiment."""
     try:
-        query = {
-            "size": 0,
-            "aggs": {
-                "companies": {
-                    "terms": {
-                        "field": "company",
-                        "size": 100
-                    },
-                    "aggs": {
-                        "avg_sentiment": {
-                            "avg": {
-                                "field": "sentiment_score"
-                            }
-                        },
-                        "latest_date": {
-                            "max": {
-                                "field": "seendate"
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        
-        result = es.search(index="stock_news", body=query)
-        
-        companies = []
-        for bucket in result['aggregations']['companies']['buckets']:
-            companies.append(CompanyInfo(
-                name=bucket['key'],
-                article_count=bucket['doc_count'],
-                avg_sentiment=bucket['avg_sentiment']['value'] or 0.5,
-                latest_article_date=bucket['latest_date']['value_as_string'] if bucket['latest_date']['value'] else None
-            ))
-        
-        # Sort by article count descending
-        companies.sort(key=lambda x: x.article_count, reverse=True)
-        
-        return companies
+        return await fetch_companies(es)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Get news articles for a company
+def uses_point_in_time(params: Dict[str, Any]) -> bool:
+    """Whether a /api/news request reads through a point-in-time (never cached)."""
+    state = decode_cursor(params.get("cursor"))
+    return bool(params.get("consistent") or (state and state.get("pit")))
+
+
 @app.get("/api/news/{company}")
+@cached_response("news", bypass=uses_point_in_time)
 async def get_company_news(
     company: str,
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
     sentiment: Optional[str] = Query(None, regex="^(positive|negative|neutral)$"),
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    cursor: Optional[str] = None,
+    consistent: bool = False,
+    fields: Optional[str] = None
 ):
     """
     Get news articles for a specific company.
     
+    Pages can be walked with offset, or with the returned next_cursor, which
+    resumes after the last article (search_after) so every page costs the
+    same at any depth. Cursor requests must repeat the original filters.
+    
     Args:
         company: Company name
         limit: Number of articles to return (default: 50, max: 500)
-        offset: Pagination offset (default: 0)
+        offset: Pagination offset (default: 0, ignored with a cursor)
         sentiment: Filter by sentiment (positive/negative/neutral)
         start_date: Start date filter (ISO format)
         end_date: End date filter (ISO format)
+        cursor: next_cursor from the previous page
+        consistent: Open a point-in-time so following pages ignore newly
+            indexed articles (carried in the cursor)
+        fields: Comma-separated article fields to return (default: all)
     """
+    selected_fields = parse_fields_param(fields, NEWS_ARTICLE_FIELDS)
+    cursor_state = decode_cursor(cursor)
+    if cursor and cursor_state is None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    pit_id = cursor_state.get("pit") if cursor_state else None
+    
     try:
         # Build query
-        must_conditions = [
-            {"match": {"company": company}}
-        ]
-        
-        if sentiment:
-            must_conditions.append({"term": {"sentiment_label": sentiment}})
-        
-        if start_date or end_date:
-            date_range = {}
-            if start_date:
-                date_range["gte"] = start_date
-            if end_date:
-                date_range["lte"] = end_date
-            must_conditions.append({"range": {"seendate": date_range}})
+        must_conditions = news_conditions(company, sentiment, start_date, end_date)
         
         query = {
-            "from": offset,
             "size": limit,
+            "_source": selected_fields,
             "query": {
                 "bool": {
                     "must": must_conditions
@@ -205,41 +543,200 @@ async def get_company_news(
             },
             "sort": [
                 {"seendate": {"order": "desc"}},
-                {"sentiment_score": {"order": "desc"}}
+                {"sentiment_score": {"order": "desc"}},
+                # Unique tiebreaker (document _id is derived from the url)
+                {"url": {"order": "asc"}}
             ]
         }
+        if cursor_state:
+            query["search_after"] = cursor_state["after"]
+        else:
+            query["from"] = offset
         
-        result = es.search(index="stock_news", body=query)
+        if consistent and pit_id is None:
+            pit = await es.open_point_in_time(index="stock_news", keep_alive=NEWS_PIT_KEEP_ALIVE)
+            pit_id = pit["id"]
         
-        articles = []
-        for hit in result['hits']['hits']:
-            doc = hit['_source']
-            articles.append({
-                "title": doc.get("title"),
-                "url": doc.get("url"),
-                "company": doc.get("company"),
-                "sentiment_label": doc.get("sentiment_label"),
-                "sentiment_score": doc.get("sentiment_score"),
-                "seendate": doc.get("seendate"),
-                "domain": doc.get("domain"),
-                "language": doc.get("language"),
-                "sourceCountry": doc.get("sourceCountry"),
-                "impact_score": doc.get("impact_score", 0.0)
-            })
+        if pit_id:
+            query["pit"] = {"id": pit_id, "keep_alive": NEWS_PIT_KEEP_ALIVE}
+            result = await es.search(body=query)
+            pit_id = result.get("pit_id", pit_id)
+        else:
+            result = await es.search(index="stock_news", body=query)
+        
+        hits = result['hits']['hits']
+        next_cursor = None
+        if len(hits) == limit:
+            state = {"after": hits[-1]["sort"]}
+            if pit_id:
+                state["pit"] = pit_id
+            next_cursor = encode_cursor(state)
+        elif pit_id:
+            # Last page: release the point-in-time
+            await es.close_point_in_time(id=pit_id)
+        
+        articles = [news_article(hit['_source'], selected_fields) for hit in hits]
         
         return {
             "total": result['hits']['total']['value'],
             "articles": articles,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def walk_export_slice(query: Dict[str, Any], pit_id: str, slice_id: int, pages: asyncio.Queue) -> None:
+    """Page through one PIT slice with search_after, handing each page to the queue."""
+    body = dict(query)
+    body["size"] = EXPORT_PAGE_SIZE
+    body["sort"] = ["_shard_doc"]
+    if EXPORT_SLICES > 1:
+        body["slice"] = {"id": slice_id, "max": EXPORT_SLICES}
+    
+    try:
+        while True:
+            body["pit"] = {"id": pit_id, "keep_alive": EXPORT_PIT_KEEP_ALIVE}
+            result = await es.search(body=body)
+            pit_id = result.get("pit_id", pit_id)
+            hits = result['hits']['hits']
+            if hits:
+                await pages.put([hit['_source'] for hit in hits])
+            if len(hits) < EXPORT_PAGE_SIZE:
+                break
+            body["search_after"] = hits[-1]["sort"]
+        await pages.put(None)
+    except Exception as e:
+        await pages.put(e)
+
+
+async def stream_export(
+    query: Dict[str, Any],
+    pit_id: str,
+    export_format: str,
+    gzip_output: bool,
+    fields: List[str]
+):
+    """
+    Yield exported rows page by page while the slices are still being read.
+    
+    The page queue holds at most one page per slice, so memory stays flat no
+    matter how many documents are exported.
+    """
+    pages = asyncio.Queue(maxsize=max(1, EXPORT_SLICES))
+    walkers = [
+        asyncio.create_task(walk_export_slice(query, pit_id, slice_id, pages))
+        for slice_id in range(max(1, EXPORT_SLICES))
+    ]
+    compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 31) if gzip_output else None
+    
+    def encode(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+    
+    try:
+        if export_format == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(fields)
+            yield encode(buffer.getvalue().encode("utf-8"))
+        
+        remaining = len(walkers)
+        while remaining:
+            page = await pages.get()
+            if page is None:
+                remaining -= 1
+                continue
+            if isinstance(page, Exception):
+                logger.error(f"Export aborted: {page}")
+                raise page
+            
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+                writer.writerows(news_article(doc, fields) for doc in page)
+                data = buffer.getvalue().encode("utf-8")
+            else:
+                data = b"".join(dumps(news_article(doc, fields)) + b"\n" for doc in page)
+            chunk = encode(data)
+            if chunk:
+                yield chunk
+        
+        if compressor:
+            yield compressor.flush()
+    finally:
+        for walker in walkers:
+            walker.cancel()
+        try:
+            await es.close_point_in_time(id=pit_id)
+        except Exception as e:
+            logger.warning(f"Could not close export point-in-time: {e}")
+
+
+# Stream every matching article for bulk downloads
+@app.get("/api/export/{company}")
+async def export_company_news(
+    request: Request,
+    company: str,
+    format: str = Query("ndjson", regex="^(ndjson|csv)$"),
+    sentiment: Optional[str] = Query(None, regex="^(positive|negative|neutral)$"),
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """
+    Stream all news articles for a company as NDJSON or CSV.
+    
+    Walks a point-in-time in parallel slices with search_after and writes rows
+    as pages arrive, so exports of any size never sit in API memory. The body
+    is gzipped on the fly when the client sends Accept-Encoding: gzip. Rows are
+    in index order, not by date.
+    
+    Args:
+        company: Company name
+        format: ndjson (default) or csv
+        sentiment: Filter by sentiment (positive/negative/neutral)
+        start_date: Start date filter (ISO format)
+        end_date: End date filter (ISO format)
+        fields: Comma-separated article fields to export (default: all)
+    """
+    selected_fields = parse_fields_param(fields, NEWS_ARTICLE_FIELDS)
+    
+    try:
+        pit = await es.open_point_in_time(index="stock_news", keep_alive=EXPORT_PIT_KEEP_ALIVE)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    query = {
+        "_source": selected_fields,
+        "query": {
+            "bool": {
+                "must": news_conditions(company, sentiment, start_date, end_date)
+            }
+        }
+    }
+    gzip_output = "gzip" in accepted_encodings(request.headers.get("accept-encoding", ""))
+    
+    filename = "".join(ch if ch.isalnum() else "_" for ch in company)
+    extension = "csv" if format == "csv" else "ndjson"
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{extension}"',
+        "Vary": "Accept-Encoding",
+    }
+    if gzip_output:
+        headers["Content-Encoding"] = "gzip"
+    
+    return StreamingResponse(
+        stream_export(query, pit["id"], format, gzip_output, selected_fields),
+        media_type="text/csv" if format == "csv" else "application/x-ndjson",
+        headers=headers
+    )
+
+
 # Get sentiment timeline for a company
-@app.get("/api/sentiment/{company}", response_model=List[SentimentPoint])
+@app.get("/api/sentiment/{company}", responses={200: {"model": List[SentimentPoint]}})
+@cached_response("sentiment")
 async def get_sentiment_timeline(
     company: str,
     interval: str = Query("1w", regex="^(1d|1w|1M)$"),
@@ -256,66 +753,7 @@ async def get_sentiment_timeline(
         end_date: End date filter (ISO format)
     """
     try:
-        # Build query
-        must_conditions = [{"match": {"company": company}}]
-        
-        if start_date or end_date:
-            date_range = {}
-            if start_date:
-                date_range["gte"] = start_date
-            if end_date:
-                date_range["lte"] = end_date
-            must_conditions.append({"range": {"seendate": date_range}})
-        
-        query = {
-            "size": 0,
-            "query": {
-                "bool": {
-                    "must": must_conditions
-                }
-            },
-            "aggs": {
-                "timeline": {
-                    "date_histogram": {
-                        "field": "seendate",
-                        "calendar_interval": interval,
-                        "min_doc_count": 1
-                    },
-                    "aggs": {
-                        "avg_sentiment": {
-                            "avg": {"field": "sentiment_score"}
-                        },
-                        "sentiment_breakdown": {
-                            "terms": {"field": "sentiment_label"}
-                        }
-                    }
-                }
-            }
-        }
-        
-        result = es.search(index="stock_news", body=query)
-        
-        timeline = []
-        for bucket in result['aggregations']['timeline']['buckets']:
-            # Count sentiments
-            sentiment_counts = {
-                "positive": 0,
-                "negative": 0,
-                "neutral": 0
-            }
-            for sent_bucket in bucket['sentiment_breakdown']['buckets']:
-                sentiment_counts[sent_bucket['key']] = sent_bucket['doc_count']
-            
-            timeline.append(SentimentPoint(
-                date=bucket['key_as_string'],
-                sentiment_avg=bucket['avg_sentiment']['value'] or 0.5,
-                article_count=bucket['doc_count'],
-                positive_count=sentiment_counts['positive'],
-                negative_count=sentiment_counts['negative'],
-                neutral_count=sentiment_counts['neutral']
-            ))
-        
-        return timeline
+        return await fetch_sentiment_timeline(es, company, interval, start_date, end_date)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -323,10 +761,12 @@ async def get_sentiment_timeline(
 
 # Get high-impact news events
 @app.get("/api/impact-events/{company}")
+@cached_response("impact-events")
 async def get_impact_events(
     company: str,
     limit: int = Query(20, ge=1, le=100),
-    min_impact_score: float = Query(0.05, ge=0.0, le=1.0)
+    min_impact_score: float = Query(0.05, ge=0.0, le=1.0),
+    fields: Optional[str] = None
 ):
     """
     Get high-impact news events sorted by impact score.
@@ -335,14 +775,18 @@ async def get_impact_events(
         company: Company name
         limit: Number of events to return
         min_impact_score: Minimum impact score threshold
+        fields: Comma-separated event fields to return (default: all)
     """
+    selected_fields = parse_fields_param(fields, IMPACT_EVENT_FIELDS)
+    
     try:
         query = {
             "size": limit,
+            "_source": selected_fields,
             "query": {
                 "bool": {
                     "must": [
-                        {"match": {"company": company}}
+                        company_filter(company)
                     ],
                     "filter": [
                         {"range": {"impact_score": {"gte": min_impact_score}}}
@@ -355,21 +799,12 @@ async def get_impact_events(
             ]
         }
         
-        result = es.search(index="stock_news", body=query)
+        result = await es.search(index="stock_news", body=query)
         
         events = []
         for hit in result['hits']['hits']:
             doc = hit['_source']
-            events.append({
-                "title": doc.get("title"),
-                "url": doc.get("url"),
-                "sentiment_label": doc.get("sentiment_label"),
-                "sentiment_score": doc.get("sentiment_score"),
-                "impact_score": doc.get("impact_score"),
-                "seendate": doc.get("seendate"),
-                "price_change_pct": doc.get("price_change_pct"),
-                "domain": doc.get("domain")
-            })
+            events.append({field: doc.get(field) for field in selected_fields})
         
         return {
             "company": company,
@@ -381,13 +816,55 @@ async def get_impact_events(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def revalidate_chart_events(company: str, generation: int):
+    """
+    Refetch a company's cached chart events once their soft TTL has passed.
+    
+    The refill is staged and swapped in atomically by set_news_events, so
+    readers keep getting the stale events until the new set is complete.
+    """
+    if await cache.claim_refresh(company, generation, CACHE_FILL_LOCK_TTL_MS):
+        await refresh_chart_events(es, cache, company, generation)
+
+
+async def fill_chart_events_after_miss(
+    company: str,
+    generation: int,
+    page: Dict[str, Any],
+    background_tasks: BackgroundTasks
+):
+    """
+    Cache a company's chart events after an unfiltered miss was served its first page.
+    
+    A first page holding the whole history is cached as-is; a longer history
+    is read page by page after the response is sent, by whichever request
+    claims the refresh. Companies with more than CHART_EVENTS_CACHE_MAX_EVENTS
+    events are never cached, so each of their misses costs a single search.
+    
+    Args:
+        page: parse_chart_event_page result for the miss
+    """
+    if not page["events"] or page["total"] > CHART_EVENTS_CACHE_MAX_EVENTS:
+        return
+    if not page["complete"]:
+        background_tasks.add_task(revalidate_chart_events, company, generation)
+    elif CACHE_FILL_IN_BACKGROUND:
+        background_tasks.add_task(fill_chart_events, cache, company, generation, page["events"])
+    else:
+        await fill_chart_events(cache, company, generation, page["events"])
+
+
 # Get news events for chart markers
 @app.get("/api/chart-events/{company}")
 async def get_chart_events(
     company: str,
+    background_tasks: BackgroundTasks,
+    request: Request,
+    response: Response,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    min_impact_score: float = Query(0.0, ge=0.0)
+    min_impact_score: float = Query(0.0, ge=0.0),
+    limit: Optional[int] = Query(None, ge=1, le=1000)
 ):
     """
     Get news events optimized for chart markers with Redis caching.
@@ -395,90 +872,95 @@ async def get_chart_events(
     On first request: Fetches from Elasticsearch and caches in Redis
     On subsequent requests: Returns from Redis cache (fast!)
     
+    Cached events live in a sorted set scored by timestamp, so a zoomed-in
+    chart only transfers and decodes the events inside its window. Events past
+    their soft TTL are still served while one background request refreshes them.
+    
     Args:
         company: Company name (e.g., "Reliance Industries")
-        start_date: Start date filter (ISO format or Unix timestamp)
-        end_date: End date filter (ISO format or Unix timestamp)
+        start_date: Start date filter (ISO format or epoch milliseconds)
+        end_date: End date filter (ISO format or epoch milliseconds)
         min_impact_score: Minimum impact score (default: 0.0)
+        limit: Maximum number of events to return (default and max: 1000)
     """
     try:
+        start_ms = to_epoch_ms(start_date)
+        end_ms = to_epoch_ms(end_date, round_up=True)
+        # Unparseable dates skip the cache and let Elasticsearch interpret them
+        dates_parsed = (start_date is None or start_ms is not None) and \
+            (end_date is None or end_ms is not None)
+        
+        # Read the generation before Elasticsearch so a fill racing an ingest
+        # is written under the old generation and never served as fresh
+        generation = await cache.get_generation(company) if cache.enabled else 0
+        
+        if cache.enabled:
+            etag = generation_etag("chart-events", params_hash({
+                "company": company, "start_date": start_date, "end_date": end_date,
+                "min_impact_score": min_impact_score, "limit": limit
+            }), [generation])
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            response.headers.update(http_cache_headers(etag))
+        
         # Try to get from cache first
-        cached_events = cache.get_news_events(company) if cache.enabled else None
+        cached_events = None
+        if cache.enabled and dates_parsed:
+            cached_events = await cache.get_news_events(
+                company,
+                start_ms=start_ms,
+                end_ms=end_ms,
+                min_impact_score=min_impact_score,
+                limit=limit or CHART_EVENTS_DEFAULT_LIMIT,
+                generation=generation
+            )
         
         if cached_events is not None:
-            # Filter cached events by date range and impact score
-            filtered_events = cached_events
-            
-            if start_date or end_date or min_impact_score > 0:
-                filtered_events = []
-                for event in cached_events:
-                    # Check impact score
-                    if min_impact_score > 0 and event.get("impact_score", 0) < min_impact_score:
-                        continue
-                    
-                    # Check date range (if needed, implement date filtering here)
-                    filtered_events.append(event)
-            
+            # Popularity drives the order of the cache warmer
+            background_tasks.add_task(cache.record_access, company)
+            background_tasks.add_task(revalidate_chart_events, company, generation)
             return {
                 "company": company,
-                "total_events": len(filtered_events),
-                "events": filtered_events,
+                "total_events": len(cached_events),
+                "events": cached_events,
                 "cached": True
             }
         
-        # Cache miss - fetch from Elasticsearch
-        must_conditions = [{"match": {"company": company}}]
-        
-        filter_conditions = []
-        if min_impact_score > 0:
-            filter_conditions.append({"range": {"impact_score": {"gte": min_impact_score}}})
-        
-        if start_date or end_date:
-            date_range = {}
-            if start_date:
-                date_range["gte"] = start_date
-            if end_date:
-                date_range["lte"] = end_date
-            must_conditions.append({"range": {"seendate": date_range}})
-        
-        query = {
-            "size": 1000,  # Limit to 1000 events for performance
-            "_source": [
-                "title", "seendate", "sentiment_label", "sentiment_score",
-                "impact_score", "price_change_pct", "url", "domain"
-            ],
-            "query": {
-                "bool": {
-                    "must": must_conditions,
-                    "filter": filter_conditions
-                }
-            },
-            "sort": [
-                {"seendate": {"order": "asc"}}  # Chronological order
-            ]
-        }
+        async def fetch():
+            return await fetch_chart_events(es, company, start_date, end_date, min_impact_score, limit)
         
-        result = es.search(index="stock_news", body=query)
+        # Unfiltered misses are answered from one search and then fill the
+        # cache, since the cached set must hold every event for the company
+        is_unfiltered = not (start_date or end_date or min_impact_score > 0 or limit)
+        if is_unfiltered:
+            async def fetch_page():
+                query = chart_events_query(company, None, None, 0.0, None)
+                return parse_chart_event_page(await es.search(index="stock_news", body=query))
+            
+            async def fill(page):
+                await fill_chart_events_after_miss(company, generation, page, background_tasks)
+            
+            async def read_cached():
+                cached = await cache.get_news_events(
+                    company, limit=CHART_EVENTS_DEFAULT_LIMIT, generation=generation
+                )
+                return {"events": cached} if cached is not None else None
+            
+            page = await coalesced_fetch(
+                ("chart-events", company, generation),
+                fetch_page, fill, read_cached, background_tasks
+            )
+            events = page["events"]
+        else:
+            events = await coalesced_fetch(
+                ("chart-events", company, generation,
+                 start_date, end_date, min_impact_score, limit),
+                fetch
+            )
         
-        events = []
-        for hit in result['hits']['hits']:
-            doc = hit['_source']
-            # Only include events with valid dates
-            if doc.get("seendate"):
-                events.append({
-                    "timestamp": doc.get("seendate"),
-                    "title": doc.get("title", "")[:200],  # Truncate for performance
-                    "sentiment_label": doc.get("sentiment_label", "neutral"),
-                    "sentiment_score": doc.get("sentiment_score", 0.5),
-                    "impact_score": doc.get("impact_score", 0.0),
-                    "price_change_pct": doc.get("price_change_pct"),
-                    "url": doc.get("url"),
-                    "domain": doc.get("domain")
-                })
-        
-        # Cache the events for 1 hour (3600 seconds)
-        if cache.enabled and events:
-            cache.set_news_events(company, events, ttl=3600)
+        # Names without events (typos, unknown companies) are not counted
+        if events:
+            background_tasks.add_task(cache.record_access, company)
         
         return {
             "company": company,
@@ -491,58 +973,281 @@ async def get_chart_events(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def parse_companies_param(companies: str) -> List[str]:
+    """Split a comma-separated companies parameter, dropping blanks and duplicates."""
+    names = list(dict.fromkeys(name.strip() for name in companies.split(",") if name.strip()))
+    if not names:
+        raise HTTPException(status_code=400, detail="No companies given")
+    if len(names) > BATCH_MAX_COMPANIES:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_COMPANIES} companies per request")
+    return names
+
+
+async def msearch(queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run several stock_news searches in one _msearch round-trip; responses in order."""
+    searches = []
+    for query in queries:
+        searches.append({"index": "stock_news"})
+        searches.append(query)
+    result = await es.msearch(searches=searches)
+    return result['responses']
+
+
+def msearch_error(response: Dict[str, Any]) -> Optional[str]:
+    """Error message of a failed _msearch sub-response, or None."""
+    error = response.get("error")
+    if error is None:
+        return None
+    return error.get("reason", str(error)) if isinstance(error, dict) else str(error)
+
+
+# Sentiment timelines for several companies in one request
+@app.get("/api/batch/sentiment")
+async def get_batch_sentiment(
+    companies: str,
+    request: Request,
+    interval: str = Query("1w", regex="^(1d|1w|1M)$"),
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+):
+    """
+    Get sentiment timelines for several companies.
+    
+    Cached timelines are read with one MGET (the same entries as
+    /api/sentiment/{company}); the rest are computed in one _msearch.
+    
+    Args:
+        companies: Comma-separated company names
+        interval: Aggregation interval (1d=daily, 1w=weekly, 1M=monthly)
+        start_date: Start date filter (ISO format)
+        end_date: End date filter (ISO format)
+    
+    Returns:
+        {"results": {company: timeline}, "errors": {company: message}}
+    """
+    names = parse_companies_param(companies)
+    
+    try:
+        bodies: Dict[str, str] = {}
+        hashes = {
+            name: params_hash({"company": name, "interval": interval, "start_date": start_date, "end_date": end_date})
+            for name in names
+        }
+        generations = {name: 0 for name in names}
+        cache_headers = {}
+        if cache.enabled:
+            generations = await cache.get_generations(names)
+            etag = generation_etag("batch-sentiment", params_hash({
+                "companies": names, "interval": interval, "start_date": start_date, "end_date": end_date
+            }), [generations[name] for name in names])
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            cache_headers = http_cache_headers(etag)
+            cached_bodies = await cache.get_responses(
+                "sentiment", [(name, hashes[name], generations[name]) for name in names]
+            )
+            for name, body in zip(names, cached_bodies):
+                if body is not None:
+                    bodies[name] = body
+        
+        errors = {}
+        missing = [name for name in names if name not in bodies]
+        if missing:
+            responses = await msearch([
+                sentiment_timeline_query(name, interval, start_date, end_date) for name in missing
+            ])
+            fills = []
+            for name, response in zip(missing, responses):
+                error = msearch_error(response)
+                if error is not None:
+                    errors[name] = error
+                    continue
+                bodies[name] = serialize_body(parse_sentiment_timeline(response))
+                fills.append((name, hashes[name], generations[name], bodies[name]))
+            if cache.enabled:
+                await cache.set_responses("sentiment", fills, RESPONSE_CACHE_TTLS["sentiment"])
+        
+        # Cached bodies are spliced in as-is instead of being decoded and re-encoded
+        results = b",".join(dumps(name) + b":" + bodies[name] for name in names if name in bodies)
+        content = b'{"results":{' + results + b'},"errors":' + dumps(errors) + b"}"
+        return Response(content=content, media_type="application/json", headers=cache_headers)
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Chart events for several companies in one request
+@app.get("/api/batch/chart-events")
+async def get_batch_chart_events(
+    companies: str,
+    background_tasks: BackgroundTasks,
+    request: Request,
+    http_response: Response,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    min_impact_score: float = Query(0.0, ge=0.0),
+    limit: Optional[int] = Query(None, ge=1, le=1000)
+):
+    """
+    Get chart marker events for several companies.
+    
+    Generations are read with one MGET and cached events with one pipelined
+    round-trip; companies not in the cache are fetched with one _msearch.
+    
+    Args:
+        companies: Comma-separated company names
+        start_date: Start date filter (ISO format or epoch milliseconds)
+        end_date: End date filter (ISO format or epoch milliseconds)
+        min_impact_score: Minimum impact score (default: 0.0)
+        limit: Maximum number of events per company (default and max: 1000)
+    
+    Returns:
+        {"results": {company: chart events response}, "errors": {company: message}}
+    """
+    names = parse_companies_param(companies)
+    
+    try:
+        start_ms = to_epoch_ms(start_date)
+        end_ms = to_epoch_ms(end_date, round_up=True)
+        dates_parsed = (start_date is None or start_ms is not None) and \
+            (end_date is None or end_ms is not None)
+        
+        generations = {name: 0 for name in names}
+        cached_events = {}
+        if cache.enabled:
+            generations = await cache.get_generations(names)
+            etag = generation_etag("batch-chart-events", params_hash({
+                "companies": names, "start_date": start_date, "end_date": end_date,
+                "min_impact_score": min_impact_score, "limit": limit
+            }), [generations[name] for name in names])
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            http_response.headers.update(http_cache_headers(etag))
+            if dates_parsed:
+                cached_events = await cache.get_news_events_many(
+                    generations,
+                    start_ms=start_ms,
+                    end_ms=end_ms,
+                    min_impact_score=min_impact_score,
+                    limit=limit or CHART_EVENTS_DEFAULT_LIMIT
+                )
+        
+        results = {}
+        for name in names:
+            events = cached_events.get(name)
+            if events is not None:
+                background_tasks.add_task(cache.record_access, name)
+                background_tasks.add_task(revalidate_chart_events, name, generations[name])
+                results[name] = {
+                    "company": name,
+                    "total_events": len(events),
+                    "events": events,
+                    "cached": True
+                }
+        
+        errors = {}
+        missing = [name for name in names if name not in results]
+        if missing:
+            responses = await msearch([
+                chart_events_query(name, start_date, end_date, min_impact_score, limit) for name in missing
+            ])
+            is_unfiltered = not (start_date or end_date or min_impact_score > 0 or limit)
+            for name, response in zip(missing, responses):
+                error = msearch_error(response)
+                if error is not None:
+                    errors[name] = error
+                    continue
+                page = parse_chart_event_page(response)
+                if page["events"]:
+                    background_tasks.add_task(cache.record_access, name)
+                results[name] = {
+                    "company": name,
+                    "total_events": len(page["events"]),
+                    "events": page["events"],
+                    "cached": False
+                }
+                if cache.enabled and is_unfiltered:
+                    await fill_chart_events_after_miss(name, generations[name], page, background_tasks)
+        
+        return {
+            "results": {name: results[name] for name in names if name in results},
+            "errors": errors
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def search_event_detail(company: str, timestamp: str, fields: List[str]) -> Optional[Dict[str, Any]]:
+    """Read the given event detail fields from Elasticsearch; None if the event is not indexed."""
+    query = {
+        "size": 1,
+        "_source": [EVENT_DETAIL_FIELDS[field] for field in fields],
+        "query": {
+            "bool": {
+                "must": [
+                    company_filter(company),
+                    {"term": {"seendate": timestamp}}
+                ]
+            }
+        }
+    }
+    
+    result = await es.search(index="stock_news", body=query)
+    if result['hits']['total']['value'] == 0:
+        return None
+    
+    doc = result['hits']['hits'][0]['_source']
+    event_detail = {field: doc.get(EVENT_DETAIL_FIELDS[field]) for field in fields}
+    if "related_entities" in event_detail:
+        event_detail["related_entities"] = doc.get("related_entities", [])
+    return event_detail
+
+
 # Get specific event details (for hover tooltip)
 @app.get("/api/event-detail/{company}/{timestamp}")
-async def get_event_detail(company: str, timestamp: str):
+async def get_event_detail(company: str, timestamp: str, fields: Optional[str] = None):
     """
     Get detailed information for a specific news event.
     Used when hovering over a chart marker.
     
+    Cached details hold the chart marker fields only; requested fields they
+    lack (e.g. price_before, related_entities) are read from Elasticsearch.
+    
     Args:
         company: Company name
         timestamp: Event timestamp (ISO format)
+        fields: Comma-separated event fields to return (default: all)
     """
+    selected_fields = parse_fields_param(fields, list(EVENT_DETAIL_FIELDS))
+    
     try:
         # Try cache first
-        cached_detail = cache.get_event_detail(company, timestamp) if cache.enabled else None
+        cached_detail = await cache.get_event_detail(company, timestamp) if cache.enabled else None
         
         if cached_detail:
+            if not fields:
+                return {
+                    "event": cached_detail,
+                    "cached": True
+                }
+            
+            # Copied: the cached dict may be shared with the L1 tier
+            event_detail = {field: cached_detail[field] for field in selected_fields if field in cached_detail}
+            missing = [field for field in selected_fields if field not in event_detail]
+            if missing:
+                event_detail.update(
+                    await search_event_detail(company, timestamp, missing)
+                    or {field: [] if field == "related_entities" else None for field in missing}
+                )
             return {
-                "event": cached_detail,
-                "cached": True
+                "event": {field: event_detail[field] for field in selected_fields},
+                "cached": not missing
             }
         
         # Cache miss - fetch from Elasticsearch
-        query = {
-            "size": 1,
-            "query": {
-                "bool": {
-                    "must": [
-                        {"match": {"company": company}},
-                        {"term": {"seendate": timestamp}}
-                    ]
-                }
-            }
-        }
-        
-        result = es.search(index="stock_news", body=query)
-        
-        if result['hits']['total']['value'] > 0:
-            doc = result['hits']['hits'][0]['_source']
-            event_detail = {
-                "timestamp": doc.get("seendate"),
-                "title": doc.get("title"),
-                "sentiment_label": doc.get("sentiment_label"),
-                "sentiment_score": doc.get("sentiment_score"),
-                "impact_score": doc.get("impact_score"),
-                "price_change_pct": doc.get("price_change_pct"),
-                "price_before": doc.get("price_before"),
-                "price_after": doc.get("price_after"),
-                "url": doc.get("url"),
-                "domain": doc.get("domain"),
-                "related_entities": doc.get("related_entities", [])
-            }
-            
+        event_detail = await search_event_detail(company, timestamp, selected_fields)
+        if event_detail is not None:
             return {
                 "event": event_detail,
                 "cached": False
@@ -559,7 +1264,7 @@ async def get_event_detail(company: str, timestamp: str):
 async def invalidate_cache(company: str):
     """Invalidate cached events for a company."""
     if cache.enabled:
-        success = cache.invalidate_company(company)
+        success = await cache.invalidate_company(company)
         return {"success": success, "company": company}
     else:
         return {"success": False, "message": "Cache not enabled"}
@@ -569,13 +1274,14 @@ async def invalidate_cache(company: str):
 async def get_cache_stats():
     """Get cache statistics."""
     if cache.enabled:
-        return cache.get_cache_stats()
+        return await cache.get_cache_stats()
     else:
         return {"enabled": False}
 
 
 # Get overall sentiment distribution
 @app.get("/api/sentiment-distribution")
+@cached_response("sentiment-distribution")
 async def get_sentiment_distribution(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None
@@ -620,26 +1326,37 @@ async def get_sentiment_distribution(
             }
         }
         
-        result = es.search(index="stock_news", body=query)
-        
-        sentiment_counts = {}
-        for bucket in result['aggregations']['sentiments']['buckets']:
-            sentiment_counts[bucket['key']] = bucket['doc_count']
-        
-        top_companies = []
-        for bucket in result['aggregations']['companies']['buckets']:
-            top_companies.append({
-                "company": bucket['key'],
-                "article_count": bucket['doc_count'],
-                "avg_sentiment": bucket['avg_sentiment']['value']
-            })
+        result = await es.search(index="stock_news", body=query)
+        return parse_sentiment_distribution(result, result['aggregations']['companies']['buckets'])
         
-        return {
-            "total_articles": result['hits']['total']['value'],
-            "sentiment_counts": sentiment_counts,
-            "avg_sentiment_score": result['aggregations']['avg_sentiment_score']['value'],
-            "top_companies": top_companies
-        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Landing dashboard bundle
+@app.get("/api/dashboard")
+@cached_response("dashboard")
+async def get_dashboard(
+    interval: str = Query("1w", regex="^(1d|1w|1M)$"),
+    top: int = Query(5, ge=0, le=20)
+):
+    """
+    Get everything the landing dashboard renders in one call.
+    
+    One aggregation pass builds the companies list, the sentiment distribution
+    (whose top companies reuse the companies buckets) and sentiment timelines
+    for the `top` companies by article count. The combined body is cached as
+    a single entry under the global generation.
+    
+    Args:
+        interval: Timeline interval (1d=daily, 1w=weekly, 1M=monthly)
+        top: Number of companies to include timelines for (default: 5)
+    
+    Returns:
+        {"companies": [...], "sentiment_distribution": {...}, "timelines": {company: [...]}}
+    """
+    try:
+        return await fetch_dashboard(es, interval, top)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
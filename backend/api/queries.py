@@ -0,0 +1,480 @@
+"""
+Elasticsearch Queries and Cache Fills
+
+Purpose:
+    Builds the Elasticsearch queries behind the read endpoints, turns their
+    responses into API results and fills the chart-event cache. Every
+    function takes the Elasticsearch client and cache it should use, so the
+    API routes and the cache warmer (inside or outside the API process)
+    share them without touching each other's connections.
+
+Usage:
+    events = await fetch_chart_events(es, "RELIANCE.NS", None, None, 0.0, 100)
+    await refresh_chart_events(es, cache, "RELIANCE.NS", generation)
+    key_hash = params_hash({"company": "RELIANCE.NS", "interval": "1w"})
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from api.responses import dumps
+from cache.redis_client import to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+# Cache TTLs (seconds). Cache keys embed the company/global generation that
+# run_pipeline.py bumps after indexing, so fresh data is picked up right away
+# and these TTLs only bound how long unchanged data stays in Redis.
+CHART_EVENTS_CACHE_TTL = int(os.getenv("CHART_EVENTS_CACHE_TTL", "86400"))
+# Past CHART_EVENTS_CACHE_TTL, cached events are served stale for this long
+# while a single background request refreshes them
+CHART_EVENTS_STALE_TTL = int(os.getenv("CHART_EVENTS_STALE_TTL", "86400"))
+# Chart-event responses hold at most this many events when no limit is given
+CHART_EVENTS_DEFAULT_LIMIT = 1000
+# The chart-event cache holds a company's full history, read from Elasticsearch
+# in pages of CHART_EVENTS_DEFAULT_LIMIT; companies with more events than this
+# are not cached and always read from Elasticsearch
+CHART_EVENTS_CACHE_MAX_EVENTS = int(os.getenv("CHART_EVENTS_CACHE_MAX_EVENTS", "20000"))
+RESPONSE_CACHE_TTLS = {
+    "companies": int(os.getenv("RESPONSE_CACHE_TTL_COMPANIES", "86400")),
+    "sentiment": int(os.getenv("RESPONSE_CACHE_TTL_SENTIMENT", "86400")),
+    "sentiment-distribution": int(os.getenv("RESPONSE_CACHE_TTL_DISTRIBUTION", "86400")),
+    "impact-events": int(os.getenv("RESPONSE_CACHE_TTL_IMPACT", "86400")),
+    "news": int(os.getenv("RESPONSE_CACHE_TTL_NEWS", "86400")),
+    "dashboard": int(os.getenv("RESPONSE_CACHE_TTL_DASHBOARD", "86400")),
+}
+
+
+def company_filter(company: str) -> Dict[str, Any]:
+    """Exact, case-insensitive match on the company keyword field."""
+    return {"term": {"company": {"value": company, "case_insensitive": True}}}
+
+
+def normalize_query_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Canonicalize endpoint parameters for use in a cache key.
+    
+    Company is stripped and lower-cased, dates are converted to epoch
+    milliseconds (so "2024-01-01" and "2024-01-01T00:00:00" share a key) and
+    unset parameters are dropped.
+    """
+    normalized = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if name == "company":
+            value = value.strip().lower()
+        elif name == "fields":
+            value = ",".join(sorted(field.strip() for field in value.split(",") if field.strip()))
+        elif name.endswith("_date"):
+            epoch_ms = to_epoch_ms(value, round_up=(name == "end_date"))
+            value = epoch_ms if epoch_ms is not None else str(value).strip()
+        normalized[name] = value
+    return normalized
+
+
+def params_hash(params: Dict[str, Any]) -> str:
+    """Short, stable hash of normalized endpoint parameters for cache keys."""
+    return hashlib.sha1(
+        json.dumps(normalize_query_params(params), sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+
+
+def serialize_body(result: Any) -> bytes:
+    """Serialize an endpoint result to the compact JSON body stored in the cache."""
+    return dumps(result)
+
+
+def parse_company_buckets(buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn company terms buckets (avg_sentiment, latest_date) into CompanyInfo-shaped dicts."""
+    companies = []
+    for bucket in buckets:
+        companies.append({
+            "name": bucket['key'],
+            "article_count": bucket['doc_count'],
+            "avg_sentiment": bucket['avg_sentiment']['value'] or 0.5,
+            "latest_article_date": bucket['latest_date']['value_as_string'] if bucket['latest_date']['value'] else None
+        })
+    
+    # Sort by article count descending
+    companies.sort(key=lambda x: x["article_count"], reverse=True)
+    
+    return companies
+
+
+def parse_sentiment_distribution(result: Dict[str, Any], company_buckets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the sentiment distribution from the sentiments/avg_sentiment_score aggregations."""
+    sentiment_counts = {}
+    for bucket in result['aggregations']['sentiments']['buckets']:
+        sentiment_counts[bucket['key']] = bucket['doc_count']
+    
+    top_companies = []
+    for bucket in company_buckets:
+        top_companies.append({
+            "company": bucket['key'],
+            "article_count": bucket['doc_count'],
+            "avg_sentiment": bucket['avg_sentiment']['value']
+        })
+    
+    return {
+        "total_articles": result['hits']['total']['value'],
+        "sentiment_counts": sentiment_counts,
+        "avg_sentiment_score": result['aggregations']['avg_sentiment_score']['value'],
+        "top_companies": top_companies
+    }
+
+
+def sentiment_timeline_query(
+    company: str,
+    interval: str,
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Dict[str, Any]:
+    """Elasticsearch query for a company's sentiment timeline."""
+    must_conditions = [company_filter(company)]
+    
+    if start_date or end_date:
+        date_range = {}
+        if start_date:
+            date_range["gte"] = start_date
+        if end_date:
+            date_range["lte"] = end_date
+        must_conditions.append({"range": {"seendate": date_range}})
+    
+    query = {
+        "size": 0,
+        "query": {
+            "bool": {
+                "must": must_conditions
+            }
+        },
+        "aggs": {
+            "timeline": {
+                "date_histogram": {
+                    "field": "seendate",
+                    "calendar_interval": interval,
+                    "min_doc_count": 1
+                },
+                "aggs": {
+                    "avg_sentiment": {
+                        "avg": {"field": "sentiment_score"}
+                    },
+                    "sentiment_breakdown": {
+                        "terms": {"field": "sentiment_label"}
+                    }
+                }
+            }
+        }
+    }
+    
+    return query
+
+
+def parse_sentiment_timeline(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Turn a sentiment_timeline_query response into timeline points."""
+    return parse_timeline_buckets(result['aggregations']['timeline']['buckets'])
+
+
+def parse_timeline_buckets(buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn date_histogram buckets (avg_sentiment, sentiment_breakdown) into SentimentPoint-shaped dicts."""
+    timeline = []
+    for bucket in buckets:
+        # Count sentiments
+        sentiment_counts = {
+            "positive": 0,
+            "negative": 0,
+            "neutral": 0
+        }
+        for sent_bucket in bucket['sentiment_breakdown']['buckets']:
+            sentiment_counts[sent_bucket['key']] = sent_bucket['doc_count']
+        
+        timeline.append({
+            "date": bucket['key_as_string'],
+            "sentiment_avg": bucket['avg_sentiment']['value'] or 0.5,
+            "article_count": bucket['doc_count'],
+            "positive_count": sentiment_counts['positive'],
+            "negative_count": sentiment_counts['negative'],
+            "neutral_count": sentiment_counts['neutral']
+        })
+    
+    return timeline
+
+
+async def fetch_companies(es) -> List[Dict[str, Any]]:
+    """Query Elasticsearch for all companies with article counts and avg sentiment."""
+    query = {
+        "size": 0,
+        "aggs": {
+            "companies": {
+                "terms": {
+                    "field": "company",
+                    "size": 100
+                },
+                "aggs": {
+                    "avg_sentiment": {
+                        "avg": {
+                            "field": "sentiment_score"
+                        }
+                    },
+                    "latest_date": {
+                        "max": {
+                            "field": "seendate"
+                        }
+                    }
+                }
+            }
+        }
+    }
+    
+    result = await es.search(index="stock_news", body=query)
+    return parse_company_buckets(result['aggregations']['companies']['buckets'])
+
+
+async def fetch_sentiment_timeline(
+    es,
+    company: str,
+    interval: str,
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Query Elasticsearch for a company's sentiment timeline."""
+    query = sentiment_timeline_query(company, interval, start_date, end_date)
+    result = await es.search(index="stock_news", body=query)
+    return parse_sentiment_timeline(result)
+
+
+async def fetch_dashboard(es, interval: str, top: int) -> Dict[str, Any]:
+    """
+    Query Elasticsearch for the landing dashboard bundle in one aggregation pass.
+    
+    Returns:
+        {"companies": [...], "sentiment_distribution": {...}, "timelines": {company: [...]}}
+    """
+    aggs = {
+        "companies": {
+            "terms": {
+                "field": "company",
+                "size": 100
+            },
+            "aggs": {
+                "avg_sentiment": {
+                    "avg": {"field": "sentiment_score"}
+                },
+                "latest_date": {
+                    "max": {"field": "seendate"}
+                }
+            }
+        },
+        "sentiments": {
+            "terms": {"field": "sentiment_label"}
+        },
+        "avg_sentiment_score": {
+            "avg": {"field": "sentiment_score"}
+        }
+    }
+    if top > 0:
+        aggs["top_timelines"] = {
+            "terms": {
+                "field": "company",
+                "size": top
+            },
+            "aggs": {
+                "timeline": {
+                    "date_histogram": {
+                        "field": "seendate",
+                        "calendar_interval": interval,
+                        "min_doc_count": 1
+                    },
+                    "aggs": {
+                        "avg_sentiment": {
+                            "avg": {"field": "sentiment_score"}
+                        },
+                        "sentiment_breakdown": {
+                            "terms": {"field": "sentiment_label"}
+                        }
+                    }
+                }
+            }
+        }
+    
+    query = {
+        "size": 0,
+        "query": {"match_all": {}},
+        "aggs": aggs
+    }
+    
+    result = await es.search(index="stock_news", body=query)
+    
+    company_buckets = result['aggregations']['companies']['buckets']
+    timelines = {}
+    if top > 0:
+        for bucket in result['aggregations']['top_timelines']['buckets']:
+            timelines[bucket['key']] = parse_timeline_buckets(bucket['timeline']['buckets'])
+    
+    return {
+        "companies": parse_company_buckets(company_buckets),
+        "sentiment_distribution": parse_sentiment_distribution(result, company_buckets[:10]),
+        "timelines": timelines
+    }
+
+
+def chart_events_query(
+    company: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    min_impact_score: float,
+    limit: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Elasticsearch query for chart marker events in chronological order.
+    
+    Queries without date or impact filters also count the company's events
+    up to just past CHART_EVENTS_CACHE_MAX_EVENTS (see parse_chart_event_page).
+    """
+    must_conditions = [company_filter(company)]
+    
+    filter_conditions = []
+    if min_impact_score > 0:
+        filter_conditions.append({"range": {"impact_score": {"gte": min_impact_score}}})
+    
+    if start_date or end_date:
+        date_range = {}
+        if start_date:
+            date_range["gte"] = start_date
+        if end_date:
+            date_range["lte"] = end_date
+        must_conditions.append({"range": {"seendate": date_range}})
+    
+    query = {
+        "size": limit or CHART_EVENTS_DEFAULT_LIMIT,  # Capped for performance
+        "_source": [
+            "title", "seendate", "sentiment_label", "sentiment_score",
+            "impact_score", "price_change_pct", "url", "domain"
+        ],
+        "query": {
+            "bool": {
+                "must": must_conditions,
+                "filter": filter_conditions
+            }
+        },
+        "sort": [
+            {"seendate": {"order": "asc"}},  # Chronological order
+            # Unique tiebreaker, so history pages can continue with search_after
+            {"url": {"order": "asc"}}
+        ]
+    }
+    if not filter_conditions and len(must_conditions) == 1:
+        query["track_total_hits"] = CHART_EVENTS_CACHE_MAX_EVENTS + 1
+    
+    return query
+
+
+def parse_chart_events(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Turn a chart_events_query response into chart marker events."""
+    events = []
+    for hit in result['hits']['hits']:
+        doc = hit['_source']
+        # Only include events with valid dates
+        if doc.get("seendate"):
+            events.append({
+                "timestamp": doc.get("seendate"),
+                "title": doc.get("title", "")[:200],  # Truncate for performance
+                "sentiment_label": doc.get("sentiment_label", "neutral"),
+                "sentiment_score": doc.get("sentiment_score", 0.5),
+                "impact_score": doc.get("impact_score", 0.0),
+                "price_change_pct": doc.get("price_change_pct"),
+                "url": doc.get("url"),
+                "domain": doc.get("domain")
+            })
+    
+    return events
+
+
+def parse_chart_event_page(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn the response to an unfiltered chart_events_query into its first page.
+    
+    Returns:
+        {"events": [...], "total": company event count (capped just past
+        CHART_EVENTS_CACHE_MAX_EVENTS), "complete": whether the page holds them all}
+    """
+    total = result['hits']['total']['value']
+    return {
+        "events": parse_chart_events(result),
+        "total": total,
+        "complete": len(result['hits']['hits']) >= total
+    }
+
+
+async def fetch_chart_events(
+    es,
+    company: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    min_impact_score: float,
+    limit: Optional[int]
+) -> List[Dict[str, Any]]:
+    """Query Elasticsearch for chart marker events in chronological order."""
+    query = chart_events_query(company, start_date, end_date, min_impact_score, limit)
+    result = await es.search(index="stock_news", body=query)
+    return parse_chart_events(result)
+
+
+async def fetch_chart_event_history(es, company: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Query Elasticsearch for all of a company's chart marker events, oldest first.
+    
+    Pages through the history with search_after. Companies with more than
+    CHART_EVENTS_CACHE_MAX_EVENTS events (too many to cache) cost one search.
+    
+    Returns:
+        List of events, or None if the company has too many to cache
+    """
+    query = chart_events_query(company, None, None, 0.0, CHART_EVENTS_DEFAULT_LIMIT)
+    result = await es.search(index="stock_news", body=query)
+    if result['hits']['total']['value'] > CHART_EVENTS_CACHE_MAX_EVENTS:
+        return None
+    
+    events = parse_chart_events(result)
+    query.pop("track_total_hits")
+    while len(result['hits']['hits']) == CHART_EVENTS_DEFAULT_LIMIT:
+        query["search_after"] = result['hits']['hits'][-1]["sort"]
+        result = await es.search(index="stock_news", body=query)
+        events.extend(parse_chart_events(result))
+    return events
+
+
+async def fill_chart_events(
+    cache,
+    company: str,
+    generation: int,
+    events: List[Dict[str, Any]]
+) -> bool:
+    """
+    Cache a company's full chart-event history (see fetch_chart_event_history).
+    
+    Returns:
+        bool: True if the events were cached
+    """
+    if not events:
+        return False
+    return await cache.set_news_events(
+        company, events, ttl=CHART_EVENTS_CACHE_TTL,
+        generation=generation, stale_ttl=CHART_EVENTS_STALE_TTL
+    )
+
+
+async def refresh_chart_events(es, cache, company: str, generation: int) -> bool:
+    """Fetch and cache a company's full chart-event history."""
+    try:
+        events = await fetch_chart_event_history(es, company)
+        if events is None:
+            logger.info(f"{company} has over {CHART_EVENTS_CACHE_MAX_EVENTS} chart events; not caching")
+            return False
+        return await fill_chart_events(cache, company, generation, events)
+    except Exception as e:
+        logger.error(f"Error refreshing cached chart events for {company}: {e}")
+        return False
@@ -0,0 +1,42 @@
+"""
+orjson Response Encoding
+
+Purpose:
+    Serializes API results with orjson instead of the stdlib json module.
+    Endpoints return plain dicts/lists, so nothing is validated or rebuilt
+    as Pydantic objects on the way out, and the same bytes are what the
+    response cache stores and serves back unchanged.
+
+Usage:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    body = dumps(result)   # bytes, ready for Redis or Response(content=body)
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize a result to compact JSON bytes.
+    
+    Types orjson does not handle natively (e.g. Pydantic models) are passed
+    through FastAPI's jsonable_encoder.
+    
+    Args:
+        content: Result to serialize
+    
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(content, default=jsonable_encoder)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
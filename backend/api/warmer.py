@@ -0,0 +1,187 @@
+"""
+Cache Warmer
+
+Purpose:
+    Pre-populates the Redis cache so the first user to open a company does not
+    pay the full Elasticsearch latency. Fills the companies list and the
+    dashboard bundle, then chart events and sentiment timelines per company,
+    most read companies first (access counts are recorded per company by
+    /api/chart-events).
+
+Usage:
+    # Inside the API (runs at startup, on the API's connections)
+    stats = await warm_cache(es, cache)
+    
+    # From another process, e.g. the last stage of run_pipeline.py
+    stats = asyncio.run(warm_cache_standalone())
+
+Settings (environment):
+    CACHE_WARM_MAX_COMPANIES - companies to warm (default: 50)
+    CACHE_WARM_CONCURRENCY - companies warmed in parallel (default: 4)
+    CACHE_WARM_SENTIMENT_INTERVALS - sentiment intervals to warm (default: 1w)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+from api.queries import (
+    RESPONSE_CACHE_TTLS, fetch_companies, fetch_dashboard, fetch_sentiment_timeline,
+    params_hash, refresh_chart_events, serialize_body
+)
+from cache.redis_client import get_redis_client
+from ingestion.elastic_client import get_async_es_client
+
+logger = logging.getLogger(__name__)
+
+CACHE_WARM_MAX_COMPANIES = int(os.getenv("CACHE_WARM_MAX_COMPANIES", "50"))
+CACHE_WARM_CONCURRENCY = int(os.getenv("CACHE_WARM_CONCURRENCY", "4"))
+CACHE_WARM_SENTIMENT_INTERVALS = [
+    interval.strip()
+    for interval in os.getenv("CACHE_WARM_SENTIMENT_INTERVALS", "1w").split(",")
+    if interval.strip()
+]
+
+
+async def warm_chart_events(es, cache, company: str) -> int:
+    """
+    Fill a company's chart events unless they are already cached.
+    
+    Returns:
+        int: Number of cache entries filled (0 or 1)
+    """
+    generation = await cache.get_generation(company)
+    if await cache.get_news_events(company, limit=1, generation=generation) is not None:
+        return 0
+    
+    filled = await refresh_chart_events(es, cache, company, generation)
+    return int(filled)
+
+
+async def warm_response(cache, route: str, fetch, params: Dict[str, Any]) -> Tuple[int, bytes]:
+    """
+    Fill a cached_response entry under the key a default request reads.
+    
+    Args:
+        cache: AsyncNewsCache to fill
+        route: Route name (key in RESPONSE_CACHE_TTLS)
+        fetch: Coroutine function computing the endpoint result
+        params: Every endpoint parameter, as the route handler receives them
+    
+    Returns:
+        (entries filled (0 or 1), serialized body)
+    """
+    company = params.get("company")
+    generation = await cache.get_generation(company)
+    key_hash = params_hash(params)
+    body = await cache.get_response(route, company, key_hash, generation)
+    if body is not None:
+        return 0, body
+    
+    body = serialize_body(await fetch())
+    await cache.set_response(route, company, key_hash, generation, body, RESPONSE_CACHE_TTLS[route])
+    return 1, body
+
+
+async def warm_company(es, cache, company: str, semaphore: asyncio.Semaphore, counts: Dict[str, int]) -> None:
+    """Warm every cached view of one company, logging instead of raising on failure."""
+    async with semaphore:
+        try:
+            filled = await warm_chart_events(es, cache, company)
+            counts["chart-events"] += filled
+            for interval in CACHE_WARM_SENTIMENT_INTERVALS:
+                filled, _ = await warm_response(
+                    cache, "sentiment",
+                    lambda: fetch_sentiment_timeline(es, company, interval, None, None),
+                    {"company": company, "interval": interval, "start_date": None, "end_date": None}
+                )
+                counts["sentiment"] += filled
+        except Exception as e:
+            logger.error(f"Error warming cache for {company}: {e}")
+
+
+async def warm_cache(
+    es,
+    cache,
+    companies: Optional[List[str]] = None,
+    max_companies: int = CACHE_WARM_MAX_COMPANIES,
+    concurrency: int = CACHE_WARM_CONCURRENCY
+) -> Dict[str, Any]:
+    """
+    Warm the cache, most read companies first.
+    
+    Args:
+        es: AsyncElasticsearch client to read from
+        cache: AsyncNewsCache to fill
+        companies: Companies to warm after the most read ones
+            (default: every company in the companies list)
+        max_companies: Maximum number of companies to warm
+        concurrency: Companies warmed in parallel
+    
+    Returns:
+        Dict with companies warmed, entries filled per route and elapsed seconds
+    """
+    start_time = time.perf_counter()
+    counts = {"companies": 0, "dashboard": 0, "chart-events": 0, "sentiment": 0}
+    
+    if cache is None or not cache.enabled:
+        logger.info("Cache not enabled; skipping cache warm-up")
+        return {"companies_warmed": 0, "filled": counts, "elapsed_seconds": 0.0}
+    
+    counts["companies"], body = await warm_response(
+        cache, "companies", lambda: fetch_companies(es), {}
+    )
+    counts["dashboard"], _ = await warm_response(
+        cache, "dashboard", lambda: fetch_dashboard(es, "1w", 5), {"interval": "1w", "top": 5}
+    )
+    if companies is None:
+        companies = [company["name"] for company in orjson.loads(body)]
+    
+    # Most read first, then the rest in the given order. Access counts are kept
+    # under normalized names; warm them under the names as listed, since cached
+    # events are keyed by the name a client requests.
+    listed = {company.strip().lower(): company for company in companies}
+    ordered = {}
+    for company in await cache.get_popular_companies(max_companies) + list(companies):
+        ordered.setdefault(company.strip().lower(), listed.get(company.strip().lower(), company))
+    ordered = list(ordered.values())[:max_companies]
+    
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    await asyncio.gather(*[warm_company(es, cache, company, semaphore, counts) for company in ordered])
+    
+    elapsed = time.perf_counter() - start_time
+    logger.info(
+        f"Cache warm-up: {len(ordered)} companies, {sum(counts.values())} entries filled "
+        f"({counts}) in {elapsed:.2f}s"
+    )
+    return {
+        "companies_warmed": len(ordered),
+        "filled": counts,
+        "elapsed_seconds": round(elapsed, 3),
+    }
+
+
+async def warm_cache_standalone(companies: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Warm the cache from outside the API process (e.g. after an ingest run).
+    
+    Opens its own Elasticsearch and Redis connections and closes them afterwards.
+    
+    Args:
+        companies: Companies to warm after the most read ones
+    
+    Returns:
+        Dict with warm-up stats (see warm_cache)
+    """
+    es = await get_async_es_client()
+    cache = get_redis_client(async_client=True)
+    await cache.connect()
+    try:
+        return await warm_cache(es, cache, companies)
+    finally:
+        await es.close()
+        await cache.close()
@@ -0,0 +1,129 @@
+"""
+Benchmark NewsCache Bulk Writes
+
+Purpose:
+    Compare the old one-SETEX-per-key cache fill against the pipelined
+    NewsCache.set_news_events at 100, 1k and 10k events.
+    Reports Redis round-trips (counted on the connection) and wall time for
+    each path.
+
+USAGE:
+    python benchmark_cache_writes.py
+    python benchmark_cache_writes.py --sizes 100,1000,10000 --batch-size 500
+
+REQUIREMENTS:
+    - Redis running at localhost:6379 (or set REDIS_HOST/REDIS_PORT)
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+from cache.redis_client import NewsCache
+
+BENCH_COMPANY = "__benchmark__"
+# Full-list string key written by the old cache fill
+LEGACY_EVENTS_KEY = f"news:events:{BENCH_COMPANY}"
+
+
+def make_events(count: int) -> list:
+    """Build synthetic chart events shaped like /api/chart-events output."""
+    base = datetime(2020, 1, 1)
+    return [
+        {
+            "timestamp": (base + timedelta(minutes=i)).isoformat(),
+            "title": f"Benchmark headline number {i} about quarterly results"[:200],
+            "sentiment_label": "positive",
+            "sentiment_score": 0.75,
+            "impact_score": 0.1,
+            "price_change_pct": 1.2,
+            "url": f"https://example.com/article/{i}",
+            "domain": "example.com"
+        }
+        for i in range(count)
+    ]
+
+
+def count_round_trips(cache: NewsCache) -> dict:
+    """
+    Count requests sent to Redis from now on.
+    
+    Every command, and every pipeline or MULTI/EXEC block, goes to the server
+    in one send on its connection, so sends are round-trips.
+    
+    Returns:
+        dict: {"round_trips": n}, updated as commands are sent
+    """
+    counter = {"round_trips": 0}
+    pool = cache.redis_client.connection_pool
+    get_connection = pool.get_connection
+    
+    def counted_connection(*args, **kwargs):
+        connection = get_connection(*args, **kwargs)
+        if not getattr(connection, "_round_trips_counted", False):
+            send = connection.send_packed_command
+            
+            def counted_send(command, check_health=True):
+                counter["round_trips"] += 1
+                return send(command, check_health)
+            
+            connection.send_packed_command = counted_send
+            connection._round_trips_counted = True
+        return connection
+    
+    pool.get_connection = counted_connection
+    return counter
+
+
+def fill_sequential(cache: NewsCache, events: list, ttl: int) -> None:
+    """Old cache fill: one SETEX round-trip per key."""
+    cache.redis_client.setex(LEGACY_EVENTS_KEY, ttl, json.dumps(events))
+    for event in events:
+        key = cache._get_legacy_event_detail_key(BENCH_COMPANY, event["timestamp"])
+        cache.redis_client.setex(key, ttl, json.dumps(event))
+
+
+def fill_pipelined(cache: NewsCache, events: list, ttl: int) -> None:
+    """Current cache fill via set_news_events (generation read, staged batches, swap)."""
+    cache.set_news_events(BENCH_COMPANY, events, ttl=ttl)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NewsCache bulk writes")
+    parser.add_argument("--sizes", type=str, default="100,1000,10000")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--ttl", type=int, default=60)
+    args = parser.parse_args()
+    
+    cache = NewsCache(write_batch_size=args.batch_size)
+    if not cache.enabled:
+        print("Redis not available. Start Redis and retry.")
+        return
+    
+    counter = count_round_trips(cache)
+    
+    print(f"\n{'events':>8} | {'path':>10} | {'round-trips':>11} | {'wall ms':>9}")
+    print("-" * 48)
+    
+    for size in [int(s) for s in args.sizes.split(",")]:
+        events = make_events(size)
+        
+        for name, fill in [("sequential", fill_sequential), ("pipelined", fill_pipelined)]:
+            # Fold leftover per-event keys into the hash so one DEL clears them
+            cache.migrate_legacy_event_keys()
+            cache.invalidate_company(BENCH_COMPANY)
+            cache.redis_client.delete(LEGACY_EVENTS_KEY)
+            counter["round_trips"] = 0
+            start = time.perf_counter()
+            fill(cache, events, args.ttl)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"{size:>8} | {name:>10} | {counter['round_trips']:>11} | {elapsed_ms:>9.1f}")
+    
+    cache.migrate_legacy_event_keys()
+    cache.invalidate_company(BENCH_COMPANY)
+    cache.redis_client.delete(LEGACY_EVENTS_KEY)
+
+
+if __name__ == "__main__":
+    main()
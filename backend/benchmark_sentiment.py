@@ -0,0 +1,88 @@
+"""
+Benchmark Batched FinBERT Sentiment
+
+Purpose:
+    Compare the per-title get_sentiment_finbert loop against batched
+    get_sentiments_finbert at batch sizes 1, 16, 64 and 256.
+    Reports titles/sec for each path and checks that batched labels and scores
+    match the per-title path on the headline fixture.
+
+USAGE:
+    python benchmark_sentiment.py
+    python benchmark_sentiment.py --titles 2048 --batch-sizes 1,16,64,256
+    FINBERT_NUM_THREADS=4 python benchmark_sentiment.py
+
+REQUIREMENTS:
+    - transformers and torch installed, ProsusAI/finbert downloadable or cached
+"""
+
+import argparse
+import csv
+import time
+from pathlib import Path
+
+from ingestion import news_ingestor
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "sentiment_headlines.csv"
+
+
+def load_titles(path: Path = FIXTURE_PATH) -> list:
+    """Headlines from the labeled fixture, in file order."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [row["title"] for row in csv.DictReader(f)]
+
+
+def check_parity(titles: list, batch_size: int) -> tuple:
+    """
+    Compare batched results against the per-title path.
+    
+    Returns:
+        (labels that agree, max absolute score difference)
+    """
+    single = [news_ingestor.get_sentiment_finbert(title) for title in titles]
+    batched = news_ingestor.get_sentiments_finbert(titles, batch_size=batch_size, use_cache=False)
+    agree = sum(1 for (a, _), (b, _) in zip(single, batched) if a == b)
+    max_diff = max(abs(a - b) for (_, a), (_, b) in zip(single, batched))
+    return agree, max_diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched FinBERT sentiment")
+    parser.add_argument("--titles", type=int, default=1024)
+    parser.add_argument("--batch-sizes", type=str, default="1,16,64,256")
+    parser.add_argument("--baseline-titles", type=int, default=256,
+                        help="Titles scored one at a time for the per-title baseline")
+    args = parser.parse_args()
+    
+    if not news_ingestor.FINBERT_AVAILABLE:
+        print("FinBERT not available. Install transformers/torch and retry.")
+        return
+    
+    fixture = load_titles()
+    titles = (fixture * (args.titles // len(fixture) + 1))[:args.titles]
+    batch_sizes = [int(n) for n in args.batch_sizes.split(",")]
+    
+    print(f"\nParity on {len(fixture)} fixture headlines (per-title vs batched):")
+    for batch_size in batch_sizes:
+        agree, max_diff = check_parity(fixture, batch_size)
+        print(f"  batch {batch_size:>4}: {agree}/{len(fixture)} labels agree, max score diff {max_diff:.2e}")
+    
+    print(f"\n{'path':>16} | {'titles':>7} | {'seconds':>8} | {'titles/sec':>10}")
+    print("-" * 52)
+    
+    baseline = titles[:args.baseline_titles]
+    start = time.perf_counter()
+    for title in baseline:
+        news_ingestor.get_sentiment_finbert(title)
+    elapsed = time.perf_counter() - start
+    print(f"{'per-title':>16} | {len(baseline):>7} | {elapsed:>8.2f} | {len(baseline) / elapsed:>10.1f}")
+    
+    for batch_size in batch_sizes:
+        start = time.perf_counter()
+        news_ingestor.get_sentiments_finbert(titles, batch_size=batch_size, use_cache=False)
+        elapsed = time.perf_counter() - start
+        print(f"{f'batch {batch_size}':>16} | {len(titles):>7} | {elapsed:>8.2f} | {len(titles) / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark FinBERT Backends
+
+Purpose:
+    Compare the PyTorch and int8 ONNX Runtime FinBERT backends on load time,
+    single-headline latency and batched throughput.
+    Load time covers the tokenizer and model/session; the first ONNX run also
+    exports and quantizes the model, which is reported separately.
+
+USAGE:
+    python benchmark_sentiment_backends.py
+    python benchmark_sentiment_backends.py --backends torch,onnx --titles 1024 --batch-size 64
+    FINBERT_NUM_THREADS=4 python benchmark_sentiment_backends.py
+"""
+
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+
+from check_sentiment_parity import load_fixture
+from ingestion.sentiment_backends import load_finbert_backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FinBERT backends")
+    parser.add_argument("--model", type=str, default="ProsusAI/finbert")
+    parser.add_argument("--onnx-path", type=str, default="models/finbert-int8.onnx")
+    parser.add_argument("--backends", type=str, default="torch,onnx")
+    parser.add_argument("--titles", type=int, default=1024)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+    
+    fixture = [title for title, _ in load_fixture()]
+    titles = (fixture * (args.titles // len(fixture) + 1))[:args.titles]
+    num_threads = int(os.getenv("FINBERT_NUM_THREADS", "0"))
+    
+    print(
+        f"\n{'backend':>8} | {'load s':>7} | {'engine s':>8} | {'p50 ms':>7} | "
+        f"{'p95 ms':>7} | {f'titles/sec @{args.batch_size}':>17}"
+    )
+    print("-" * 72)
+    
+    for name in args.backends.split(","):
+        if name == "onnx" and not Path(args.onnx_path).exists():
+            start = time.perf_counter()
+            load_finbert_backend("onnx", args.model, onnx_path=args.onnx_path)
+            print(f"(exported and quantized ONNX model in {time.perf_counter() - start:.1f}s)")
+        
+        start = time.perf_counter()
+        backend = load_finbert_backend(name, args.model, num_threads=num_threads, onnx_path=args.onnx_path)
+        load_seconds = time.perf_counter() - start
+        
+        # Warm-up so one-time allocations are not counted as latency
+        backend.predict(fixture[:2])
+        
+        latencies = []
+        for title in fixture:
+            start = time.perf_counter()
+            backend.predict([title])
+            latencies.append((time.perf_counter() - start) * 1000)
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        
+        start = time.perf_counter()
+        for i in range(0, len(titles), args.batch_size):
+            backend.predict(titles[i:i + args.batch_size])
+        throughput = len(titles) / (time.perf_counter() - start)
+        
+        print(
+            f"{name:>8} | {load_seconds:>7.2f} | {backend.load_seconds:>8.2f} | {p50:>7.1f} | "
+            f"{p95:>7.1f} | {throughput:>17.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the Lexicon -> FinBERT Sentiment Cascade
+
+Purpose:
+    Compare get_sentiments_cascade at several confidence margins against the
+    pure batched FinBERT path on the labeled headline fixture. For each margin
+    reports the share of titles sent to FinBERT, label agreement with pure
+    FinBERT, accuracy against the fixture labels, titles/sec and speedup,
+    so the margin for a large backfill can be chosen from the trade-off.
+
+USAGE:
+    python benchmark_sentiment_cascade.py
+    python benchmark_sentiment_cascade.py --margins 0.3,0.5,0.6,0.7 --titles 2048
+
+REQUIREMENTS:
+    - transformers and torch installed, ProsusAI/finbert downloadable or cached
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from check_sentiment_parity import load_fixture
+from ingestion import news_ingestor
+from ingestion.sentiment_lexicon import score_titles_lexicon
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lexicon/FinBERT sentiment cascade")
+    parser.add_argument("--margins", type=str, default="0,0.5,0.6,0.7,1")
+    parser.add_argument("--titles", type=int, default=1024,
+                        help="Titles timed per path (the fixture repeated)")
+    parser.add_argument("--batch-size", type=int, default=news_ingestor.FINBERT_BATCH_SIZE)
+    args = parser.parse_args()
+    
+    if not news_ingestor.FINBERT_AVAILABLE:
+        print("FinBERT not available. Install transformers/torch and retry.")
+        return
+    
+    fixture = load_fixture()
+    titles = pd.Series([title for title, _ in fixture])
+    expected = [label for _, label in fixture]
+    timed = pd.Series((titles.tolist() * (args.titles // len(titles) + 1))[:args.titles])
+    margins = [float(m) for m in args.margins.split(",")]
+    
+    # Pure FinBERT reference (cache bypassed so every title is inferred)
+    finbert_labels = [label for label, _ in news_ingestor.get_sentiments_finbert(
+        titles.tolist(), batch_size=args.batch_size, use_cache=False
+    )]
+    start = time.perf_counter()
+    news_ingestor.get_sentiments_finbert(timed.tolist(), batch_size=args.batch_size, use_cache=False)
+    finbert_seconds = time.perf_counter() - start
+    finbert_accuracy = sum(a == b for a, b in zip(finbert_labels, expected)) / len(expected)
+    
+    confidence = score_titles_lexicon(titles)["confidence"]
+    
+    print(f"\nPure FinBERT: {len(timed) / finbert_seconds:.1f} titles/sec, "
+          f"accuracy {finbert_accuracy:.1%} on {len(fixture)} labeled headlines")
+    print(f"\n{'margin':>6} | {'to FinBERT':>10} | {'agreement':>9} | {'accuracy':>8} | "
+          f"{'titles/sec':>10} | {'speedup':>7}")
+    print("-" * 66)
+    
+    for margin in margins:
+        labels = [label for label, _ in news_ingestor.get_sentiments_cascade(
+            titles, margin=margin, batch_size=args.batch_size, use_cache=False
+        )]
+        agreement = sum(a == b for a, b in zip(labels, finbert_labels)) / len(labels)
+        accuracy = sum(a == b for a, b in zip(labels, expected)) / len(labels)
+        routed = (confidence < margin).mean()
+        
+        start = time.perf_counter()
+        news_ingestor.get_sentiments_cascade(timed, margin=margin, batch_size=args.batch_size, use_cache=False)
+        elapsed = time.perf_counter() - start
+        
+        print(f"{margin:>6.2f} | {routed:>10.1%} | {agreement:>9.1%} | {accuracy:>8.1%} | "
+              f"{len(timed) / elapsed:>10.1f} | {finbert_seconds / elapsed:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
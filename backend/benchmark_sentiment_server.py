@@ -0,0 +1,68 @@
+"""
+Benchmark the Sentiment Server's Micro-Batching
+
+Purpose:
+    Send single-headline requests to a running sentiment server from several
+    concurrent callers and report titles/sec, p50/p95 request latency and the
+    mean number of texts the server put in each FinBERT batch. Shows how much
+    cross-caller micro-batching gains over one caller at a time.
+
+USAGE:
+    python -m ingestion.sentiment_server --port 8765     # in another shell
+    python benchmark_sentiment_server.py --url http://127.0.0.1:8765
+    python benchmark_sentiment_server.py --concurrency 1,8,32 --titles 512
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from check_sentiment_parity import load_fixture
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentiment server micro-batching")
+    parser.add_argument("--url", type=str, default="http://127.0.0.1:8765")
+    parser.add_argument("--concurrency", type=str, default="1,8,32")
+    parser.add_argument("--titles", type=int, default=512)
+    args = parser.parse_args()
+    
+    url = args.url.rstrip("/")
+    try:
+        requests.get(f"{url}/health", timeout=2).raise_for_status()
+    except requests.RequestException as e:
+        print(f"Sentiment server not reachable at {url}: {e}")
+        return
+    
+    fixture = [title for title, _ in load_fixture()]
+    titles = (fixture * (args.titles // len(fixture) + 1))[:args.titles]
+    session = requests.Session()
+    session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=64))
+    
+    def score(title: str) -> float:
+        start = time.perf_counter()
+        session.post(f"{url}/sentiment", json={"texts": [title], "use_cache": False}, timeout=60).raise_for_status()
+        return time.perf_counter() - start
+    
+    print(f"\n{'callers':>7} | {'titles/sec':>10} | {'p50 ms':>7} | {'p95 ms':>7} | {'texts/batch':>11}")
+    print("-" * 56)
+    
+    for concurrency in [int(n) for n in args.concurrency.split(",")]:
+        before = session.get(f"{url}/health", timeout=5).json()["batching"]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = sorted(executor.map(score, titles))
+        elapsed = time.perf_counter() - start
+        after = session.get(f"{url}/health", timeout=5).json()["batching"]
+        
+        batches = after["batches"] - before["batches"]
+        texts_per_batch = (after["texts"] - before["texts"]) / batches if batches else 0.0
+        p50 = latencies[len(latencies) // 2] * 1000
+        p95 = latencies[int(len(latencies) * 0.95)] * 1000
+        print(f"{concurrency:>7} | {len(titles) / elapsed:>10.1f} | {p50:>7.1f} | {p95:>7.1f} | {texts_per_batch:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark Response Serialization
+
+Purpose:
+    Compare the old response path (Pydantic response_model validation,
+    jsonable_encoder and stdlib json) against the orjson path used by the API
+    at 1k and 10k events, for both a cache miss (serialize a result) and a
+    cache hit (turn a cached payload into a response body).
+    Reports milliseconds per response for each path.
+
+USAGE:
+    python benchmark_serialization.py
+    python benchmark_serialization.py --sizes 1000,10000 --repeat 20
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from api.main import SentimentPoint
+from api.responses import dumps
+
+
+def make_events(count: int) -> list:
+    """Build synthetic chart events shaped like /api/chart-events output."""
+    base = datetime(2020, 1, 1)
+    return [
+        {
+            "timestamp": (base + timedelta(minutes=i)).isoformat(),
+            "title": f"Benchmark headline number {i} about quarterly results",
+            "sentiment_label": "positive",
+            "sentiment_score": 0.75,
+            "impact_score": 0.1,
+            "price_change_pct": 1.2,
+            "url": f"https://example.com/article/{i}",
+            "domain": "example.com"
+        }
+        for i in range(count)
+    ]
+
+
+def make_points(count: int) -> list:
+    """Build synthetic timeline points shaped like /api/sentiment output."""
+    base = datetime(2020, 1, 1)
+    return [
+        {
+            "date": (base + timedelta(days=i)).isoformat(),
+            "sentiment_avg": 0.55,
+            "article_count": 12,
+            "positive_count": 6,
+            "negative_count": 2,
+            "neutral_count": 4
+        }
+        for i in range(count)
+    ]
+
+
+def stdlib_dumps(content) -> bytes:
+    """Old body encoding: jsonable_encoder, then stdlib json."""
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def time_ms(fn, repeat: int) -> float:
+    """Average wall time of fn in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response serialization")
+    parser.add_argument("--sizes", type=str, default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    
+    timeline_adapter = TypeAdapter(List[SentimentPoint])
+    
+    print(f"\n{'events':>8} | {'path':>28} | {'ms/response':>11} | {'bytes':>9}")
+    print("-" * 66)
+    
+    for size in [int(s) for s in args.sizes.split(",")]:
+        events = make_events(size)
+        points = make_points(size)
+        cached = dumps(events)
+        
+        paths = [
+            ("events miss: json", lambda: stdlib_dumps(events)),
+            ("events miss: orjson", lambda: dumps(events)),
+            ("timeline miss: model + json", lambda: stdlib_dumps(timeline_adapter.validate_python(points))),
+            ("timeline miss: orjson", lambda: dumps(points)),
+            ("cache hit: loads + dumps", lambda: stdlib_dumps(json.loads(cached))),
+            ("cache hit: bytes passthrough", lambda: bytes(cached)),
+        ]
+        for name, fn in paths:
+            elapsed_ms = time_ms(fn, args.repeat)
+            print(f"{size:>8} | {name:>28} | {elapsed_ms:>11.3f} | {len(fn()):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark Cache Miss Coalescing
+
+Purpose:
+    Fire N concurrent /api/chart-events requests at a cold cache and count how
+    many Elasticsearch searches they cause. With single-flight coalescing and
+    the Redis fill lock, a cold stampede should cost about one search per
+    API worker instead of one per request.
+
+USAGE:
+    python benchmark_single_flight.py
+    python benchmark_single_flight.py --company "Infosys" --concurrency 1,10,50,100
+
+REQUIREMENTS:
+    - API running at http://localhost:8000 (or pass --base-url)
+    - Elasticsearch and Redis reachable with the same settings as the API
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from dotenv import load_dotenv
+
+from ingestion.elastic_client import get_es_client
+
+
+def search_count(es) -> int:
+    """Total searches executed against the stock_news index so far."""
+    stats = es.indices.stats(index="stock_news", metric="search")
+    return stats["_all"]["total"]["search"]["query_total"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache miss coalescing")
+    parser.add_argument("--base-url", type=str, default="http://localhost:8000")
+    parser.add_argument("--company", type=str, default="Reliance Industries")
+    parser.add_argument("--concurrency", type=str, default="1,10,50,100")
+    args = parser.parse_args()
+    
+    load_dotenv()
+    es = get_es_client()
+    chart_url = f"{args.base_url}/api/chart-events/{args.company}"
+    invalidate_url = f"{args.base_url}/api/cache/invalidate/{args.company}"
+    
+    print(f"\n{'requests':>8} | {'ES searches':>11} | {'errors':>6} | {'wall ms':>9}")
+    print("-" * 45)
+    
+    for concurrency in [int(n) for n in args.concurrency.split(",")]:
+        requests.post(invalidate_url, timeout=10).raise_for_status()
+        # Let the API's locally remembered generation expire
+        time.sleep(1.1)
+        
+        before = search_count(es)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            statuses = list(pool.map(
+                lambda _: requests.get(chart_url, timeout=30).status_code,
+                range(concurrency)
+            ))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        searches = search_count(es) - before
+        errors = sum(1 for status in statuses if status != 200)
+        print(f"{concurrency:>8} | {searches:>11} | {errors:>6} | {elapsed_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Cache Payload Compression
+
+Purpose:
+    Optionally compresses cached values (event payloads and response bodies)
+    with zstd or lz4 before they are written to Redis, so every company and a
+    longer history fit in the Redis memory budget.
+    Payloads shorter than the threshold are stored as plain JSON. Compressed
+    payloads start with a one-byte codec marker (JSON never starts with a
+    control byte), so entries written with a different setting stay readable.
+
+Usage:
+    codec = PayloadCodec("zstd", threshold=256)
+    stored = codec.encode(orjson.dumps(event))
+    event = orjson.loads(codec.decode(stored))
+    codec.stats()   # raw vs stored bytes written by this process
+
+Requires (only for the codec chosen):
+    zstd: pip install zstandard
+    lz4:  pip install lz4
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+logger = logging.getLogger(__name__)
+
+ZSTD_MARKER = b"\x01"
+LZ4_MARKER = b"\x02"
+
+
+class PayloadCodec:
+    """Threshold-based zstd/lz4 compression for cached payloads."""
+    
+    def __init__(self, codec: str = "none", threshold: int = 256, level: int = 3):
+        """
+        Initialize the codec.
+        
+        Falls back to no compression (with a warning) if the library for the
+        requested codec is not installed.
+        
+        Args:
+            codec: "zstd", "lz4" or "none"
+            threshold: Minimum payload size in bytes worth compressing
+            level: Compression level passed to the codec
+        """
+        codec = (codec or "none").lower()
+        if codec == "zstd" and zstandard is None:
+            logger.warning("CACHE_COMPRESSION=zstd but zstandard is not installed; compression disabled")
+            codec = "none"
+        elif codec == "lz4" and lz4_frame is None:
+            logger.warning("CACHE_COMPRESSION=lz4 but lz4 is not installed; compression disabled")
+            codec = "none"
+        elif codec not in ("zstd", "lz4", "none"):
+            logger.warning(f"Unknown cache compression codec '{codec}'; compression disabled")
+            codec = "none"
+        
+        self.codec = codec
+        self.threshold = max(0, threshold)
+        self.level = level
+        self._zstd_compressor = zstandard.ZstdCompressor(level=level) if codec == "zstd" else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+        self.payloads = 0
+        self.compressed = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+    
+    def encode(self, payload: bytes) -> bytes:
+        """
+        Compress a payload if compression is on and it reaches the threshold.
+        
+        Args:
+            payload: Serialized JSON
+        
+        Returns:
+            Bytes to store in Redis (the payload itself if left uncompressed)
+        """
+        stored = payload
+        if self.codec != "none" and len(payload) >= self.threshold:
+            if self.codec == "zstd":
+                candidate = ZSTD_MARKER + self._zstd_compressor.compress(payload)
+            else:
+                candidate = LZ4_MARKER + lz4_frame.compress(payload, compression_level=self.level)
+            # Incompressible payloads are kept as-is
+            if len(candidate) < len(payload):
+                stored = candidate
+                self.compressed += 1
+        
+        self.payloads += 1
+        self.raw_bytes += len(payload)
+        self.stored_bytes += len(stored)
+        return stored
+    
+    def decode(self, stored: bytes) -> bytes:
+        """
+        Undo encode(); uncompressed payloads are returned unchanged.
+        
+        Args:
+            stored: Bytes read from Redis
+        
+        Returns:
+            Serialized JSON
+        """
+        marker = stored[:1]
+        if marker == ZSTD_MARKER:
+            if self._zstd_decompressor is None:
+                raise ValueError("Cached payload is zstd-compressed but zstandard is not installed")
+            return self._zstd_decompressor.decompress(stored[1:])
+        if marker == LZ4_MARKER:
+            if lz4_frame is None:
+                raise ValueError("Cached payload is lz4-compressed but lz4 is not installed")
+            return lz4_frame.decompress(stored[1:])
+        return stored
+    
+    def content_encoding(self, stored: bytes) -> Optional[str]:
+        """
+        HTTP Content-Encoding a stored payload can be sent in without decoding.
+        
+        zstd frames are a valid `Content-Encoding: zstd` body once the codec
+        marker is dropped; lz4 has no HTTP encoding.
+        
+        Args:
+            stored: Bytes read from Redis
+        
+        Returns:
+            "zstd", or None if the payload must be decoded first
+        """
+        return "zstd" if stored[:1] == ZSTD_MARKER else None
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get compression counters for payloads written by this process.
+        
+        Returns:
+            Dict with codec settings, payload counts, bytes and raw/stored ratio
+        """
+        return {
+            "codec": self.codec,
+            "threshold": self.threshold,
+            "payloads": self.payloads,
+            "compressed": self.compressed,
+            "raw_bytes": self.raw_bytes,
+            "stored_bytes": self.stored_bytes,
+            "ratio": round(self.raw_bytes / self.stored_bytes, 3) if self.stored_bytes else None,
+        }
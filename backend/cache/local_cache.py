@@ -0,0 +1,155 @@
+"""
+In-Process L1 Cache
+
+Purpose:
+    Size-bounded LRU cache with per-entry TTL that sits in front of Redis.
+    Holds already-decoded objects so repeated hits (chart loads, hover
+    tooltips) skip both the Redis round-trip and json.loads.
+
+Usage:
+    l1 = LocalLRUCache(max_entries=10000, max_bytes=64 * 1024 * 1024, ttl=30)
+    l1.set(("detail", company, timestamp), event, size=len(payload), tag=company)
+    event = l1.get(("detail", company, timestamp))
+    l1.invalidate_tag(company)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+
+class LocalLRUCache:
+    """LRU + TTL cache bounded by entry count and approximate byte size."""
+    
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, ttl: float = 30.0):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries: Maximum number of entries held
+            max_bytes: Maximum total size (sum of sizes passed to set())
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (value, size, expires_at, tag)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float, Optional[str]]]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        if entry[2] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    
+    def set(self, key: Hashable, value: Any, size: int, tag: Optional[str] = None) -> bool:
+        """
+        Store a value, evicting least recently used entries to stay within bounds.
+        
+        Args:
+            key: Cache key
+            value: Decoded object to store
+            size: Approximate size in bytes (e.g. length of the encoded payload)
+            tag: Optional group name used by invalidate_tag()
+        
+        Returns:
+            bool: False if the value is larger than the whole cache budget
+        """
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return False
+        
+        if key in self._entries:
+            self._remove(key)
+        
+        self._entries[key] = (value, size, time.monotonic() + self.ttl, tag)
+        self.current_bytes += size
+        if tag is not None:
+            self._tags.setdefault(tag, set()).add(key)
+        
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        
+        return True
+    
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        Drop every entry stored with the given tag.
+        
+        Args:
+            tag: Group name passed to set()
+        
+        Returns:
+            int: Number of entries removed
+        """
+        keys = self._tags.pop(tag, set())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+    
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+        self._tags.clear()
+        self.current_bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss/eviction counters and current usage.
+        
+        Returns:
+            Dict with cache stats
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+    
+    def _remove(self, key: Hashable) -> None:
+        """Remove one entry and its tag membership."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.current_bytes -= entry[1]
+        tag = entry[3]
+        if tag is not None:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
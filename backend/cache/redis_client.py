@@ -4,28 +4,293 @@ Redis Cache Client for News Events
 Purpose:
     Provides caching layer for news events to optimize chart marker performance.
     Stores events in Redis with automatic expiration for freshness.
+    Keys embed a per-company generation counter that the ingestion pipeline
+    bumps after indexing, so new data is visible immediately.
 
 Usage:
     cache = get_redis_client()
     cache.set_news_events("RELIANCE.NS", events_data, ttl=3600)
     cached_events = cache.get_news_events("RELIANCE.NS")
+    cache.bump_generation("RELIANCE.NS")   # after indexing new articles
+
+    # Inside the API (asyncio, pooled connections)
+    cache = get_redis_client(async_client=True)
+    await cache.connect()
+    cached_events = await cache.get_news_events("RELIANCE.NS")
 """
 
-import json
 import logging
 import os
-from typing import Optional, List, Dict, Any
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Collection, Tuple, Union
+import orjson
 import redis
+import redis.asyncio as aioredis
 from redis.exceptions import RedisError
 
+from .codec import PayloadCodec
+from .local_cache import LocalLRUCache
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Event details were stored as one key per event before moving into a hash
+LEGACY_EVENT_DETAIL_PREFIX = "news:event:"
+
+# Generation scope bumped on every ingest; used by cross-company routes
+GLOBAL_SCOPE = "__all__"
+
+# Delete a lock only if it still holds the caller's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+def to_epoch_ms(value: Any, round_up: bool = False) -> Optional[int]:
+    """
+    Convert an ISO date/datetime string or epoch timestamp to epoch milliseconds.
+    
+    Args:
+        value: ISO string or epoch milliseconds (number or numeric string);
+            numbers are read as milliseconds, like Elasticsearch's epoch_millis
+        round_up: For date-only strings, return the last millisecond of that day
+            (matches Elasticsearch's handling of missing components in 'lte')
+    
+    Returns:
+        int epoch milliseconds, or None if the value is empty or unparseable
+    """
+    if value is None or value == "":
+        return None
+    
+    text = str(value).strip()
+    try:
+        return int(float(text))
+    except ValueError:
+        pass
+    
+    try:
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    if round_up and len(text) == 10:
+        dt = dt + timedelta(days=1) - timedelta(milliseconds=1)
+    return int(dt.timestamp() * 1000)
+
+
+class _NewsCacheKeys:
+    """
+    Key layout and payload handling shared by the sync and async caches.
+    
+    Every data key embeds the company's generation counter. Ingest bumps the
+    counter, so readers move to fresh keys immediately and the previous
+    generation is left to expire; no keys need to be found and deleted.
+    """
+    
+    def _get_generation_key(self, scope: str) -> str:
+        """Generate Redis key for a scope's generation counter."""
+        return f"news:gen:{scope}"
+    
+    @staticmethod
+    def _scope(company: Optional[str]) -> str:
+        """Normalize a company into a generation scope (lower-cased, or global)."""
+        return company.strip().lower() if company else GLOBAL_SCOPE
+    
+    def _get_timeline_key(self, company: str, generation: int) -> str:
+        """Generate Redis key for the company's events sorted set (score = epoch ms)."""
+        return f"news:timeline:{company}:g{generation}"
+    
+    def _get_impact_index_key(self, company: str, generation: int) -> str:
+        """Generate Redis key for the impact index (member = event payload, score = impact)."""
+        return f"news:impact:{company}:g{generation}"
+    
+    def _get_event_details_key(self, company: str, generation: int) -> str:
+        """Generate Redis key for the per-company event detail hash (field = timestamp)."""
+        return f"news:event_details:{company}:g{generation}"
+    
+    def _get_legacy_event_detail_key(self, company: str, timestamp: str) -> str:
+        """Per-event key used before details moved into one hash per company."""
+        return f"{LEGACY_EVENT_DETAIL_PREFIX}{company}:{timestamp}"
+    
+    def _get_response_key(self, route: str, scope: str, generation: int, params_hash: str) -> str:
+        """Generate Redis key for a cached, pre-serialized API response."""
+        return f"news:response:{route}:{scope}:g{generation}:{params_hash}"
+    
+    def _get_fresh_key(self, company: str, generation: int) -> str:
+        """Generate Redis key marking cached events as fresh (expires at the soft TTL)."""
+        return f"news:fresh:{company}:g{generation}"
+    
+    def _get_popularity_key(self) -> str:
+        """Generate Redis key for the company access counts (member = company)."""
+        return "news:popularity"
+    
+    def _get_lock_key(self, name: str) -> str:
+        """Generate Redis key for a short-lived cache fill lock."""
+        return f"news:lock:{name}"
+    
+    def _company_keys(self, company: str, generation: int) -> List[str]:
+        """All keys holding cached events for a company generation."""
+        return [
+            self._get_timeline_key(company, generation),
+            self._get_impact_index_key(company, generation),
+            self._get_event_details_key(company, generation),
+        ]
+    
+    def _jittered_ttl(self, ttl: int) -> int:
+        """Spread a TTL by +/- ttl_jitter so entries written together expire apart."""
+        if ttl <= 0 or self.ttl_jitter <= 0:
+            return ttl
+        return max(1, round(ttl * random.uniform(1 - self.ttl_jitter, 1 + self.ttl_jitter)))
+    
+    def _build_event_writes(
+        self,
+        company: str,
+        events: List[Dict[str, Any]],
+        ttl: int,
+        generation: int,
+        stale_ttl: int = 0
+    ) -> list:
+        """
+        Queue a cache fill into pipelines of at most write_batch_size events each.
+        
+        Each event is serialized once and written to the timeline sorted set,
+        the impact index and the detail hash. Events without a parseable
+        timestamp are skipped. The batches go to staging keys; the last
+        pipeline is a MULTI/EXEC that renames them over the live keys and sets
+        the fresh marker, so readers see either the previous events or the
+        complete new set, never a partial fill. The fresh marker expires at the
+        (jittered) soft TTL; the data keys live stale_ttl seconds longer.
+        
+        Args:
+            company: Company name/symbol
+            events: List of event dictionaries
+            ttl: Soft time to live in seconds
+            generation: Company generation the events were read under
+            stale_ttl: Extra seconds stale events may still be served
+            
+        Returns:
+            List of pipelines to execute in order (one round-trip each)
+        """
+        soft_ttl = self._jittered_ttl(ttl)
+        hard_ttl = soft_ttl + max(0, stale_ttl)
+        company_keys = self._company_keys(company, generation)
+        token = uuid.uuid4().hex
+        staging_keys = [f"{key}:tmp:{token}" for key in company_keys]
+        timeline_key, impact_key, details_key = staging_keys
+        
+        indexed = []
+        for event in events:
+            timestamp = event.get("timestamp")
+            score = to_epoch_ms(timestamp)
+            if timestamp and score is not None:
+                impact = float(event.get("impact_score") or 0.0)
+                indexed.append((timestamp, score, impact, self.codec.encode(orjson.dumps(event))))
+        
+        pipelines = []
+        for start in range(0, len(indexed), self.write_batch_size):
+            chunk = indexed[start:start + self.write_batch_size]
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zadd(timeline_key, {payload: score for _, score, _, payload in chunk})
+            pipe.zadd(impact_key, {payload: impact for _, _, impact, payload in chunk})
+            pipe.hset(details_key, mapping={timestamp: payload for timestamp, _, _, payload in chunk})
+            # Staging keys carry the final TTL (RENAME keeps it) and expire on their own if the fill dies
+            for key in staging_keys:
+                pipe.expire(key, hard_ttl)
+            pipelines.append(pipe)
+        
+        # Swap in the complete set and mark it fresh in one transaction
+        swap = self.redis_client.pipeline(transaction=True)
+        if indexed:
+            for staging_key, key in zip(staging_keys, company_keys):
+                swap.rename(staging_key, key)
+        else:
+            swap.delete(*company_keys)
+        swap.set(self._get_fresh_key(company, generation), 1, ex=soft_ttl)
+        pipelines.append(swap)
+        return pipelines
+    
+    def _queue_events_range(
+        self,
+        pipe,
+        company: str,
+        generation: int,
+        start_ms: Optional[int],
+        end_ms: Optional[int],
+        min_impact_score: float,
+        limit: Optional[int]
+    ) -> None:
+        """
+        Queue the server-side range read for get_news_events onto a pipeline.
+        
+        Both sets hold the encoded event payloads, so the read returns events
+        ready for _decode_events. Impact-only queries read every qualifying
+        event from the impact index and _decode_events keeps the earliest
+        `limit` of them, matching Elasticsearch's impact filter followed by a
+        chronological limit. Everything else is a ZRANGEBYSCORE over the
+        timeline.
+        """
+        if min_impact_score > 0 and start_ms is None and end_ms is None:
+            pipe.zrangebyscore(
+                self._get_impact_index_key(company, generation),
+                min_impact_score,
+                "+inf"
+            )
+            return
+        
+        # With an impact filter the limit is applied after filtering
+        range_kwargs = {"start": 0, "num": limit} if limit and min_impact_score <= 0 else {}
+        pipe.zrangebyscore(
+            self._get_timeline_key(company, generation),
+            start_ms if start_ms is not None else "-inf",
+            end_ms if end_ms is not None else "+inf",
+            **range_kwargs
+        )
+    
+    def _decode_events(
+        self,
+        payloads: List[Optional[Union[str, bytes]]],
+        min_impact_score: float,
+        limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Decode cached event payloads, apply the impact filter and limit, in time order."""
+        events = [orjson.loads(self.codec.decode(payload)) for payload in payloads if payload]
+        if min_impact_score > 0:
+            events = [e for e in events if (e.get("impact_score") or 0.0) >= min_impact_score]
+        events.sort(key=lambda e: to_epoch_ms(e.get("timestamp")) or 0)
+        if limit:
+            events = events[:limit]
+        return events
+    
+    @staticmethod
+    def _parse_legacy_event_detail_key(key: str) -> Optional[Tuple[str, str]]:
+        """Split a legacy 'news:event:{company}:{timestamp}' key into (company, timestamp)."""
+        if not key.startswith(LEGACY_EVENT_DETAIL_PREFIX):
+            return None
+        company, sep, timestamp = key[len(LEGACY_EVENT_DETAIL_PREFIX):].partition(":")
+        if not sep or not company or not timestamp:
+            return None
+        return company, timestamp
+
 
-class NewsCache:
+class NewsCache(_NewsCacheKeys):
     """Redis cache manager for news events."""
     
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        write_batch_size: int = 500,
+        ttl_jitter: float = 0.1,
+        codec: Optional[PayloadCodec] = None
+    ):
         """
         Initialize Redis connection.
         
@@ -33,13 +298,20 @@ class NewsCache:
             host: Redis server host
             port: Redis server port
             db: Redis database number
+            write_batch_size: Max events written per pipeline round-trip
+            ttl_jitter: Fraction by which TTLs are randomly spread (0 = exact)
+            codec: Compression applied to cached payloads (default: none)
         """
+        self.write_batch_size = max(1, write_batch_size)
+        self.ttl_jitter = ttl_jitter
+        self.codec = codec or PayloadCodec()
         try:
             self.redis_client = redis.Redis(
                 host=host,
                 port=port,
                 db=db,
-                decode_responses=True,
+                # Binary-safe: cached payloads may be compressed
+                decode_responses=False,
                 socket_connect_timeout=5,
                 socket_timeout=5
             )
@@ -52,19 +324,60 @@ class NewsCache:
             self.enabled = False
             self.redis_client = None
     
-    def _get_events_key(self, company: str) -> str:
-        """Generate Redis key for company news events."""
-        return f"news:events:{company}"
+    def get_generation(self, company: Optional[str] = None) -> int:
+        """
+        Get the current generation counter for a company (or the global scope).
+        
+        Args:
+            company: Company name/symbol, or None for the global scope
+            
+        Returns:
+            int: Current generation (0 if never bumped or Redis unavailable)
+        """
+        if not self.enabled:
+            return 0
+        
+        try:
+            value = self.redis_client.get(self._get_generation_key(self._scope(company)))
+            return int(value or 0)
+        except RedisError as e:
+            logger.error(f"Error reading cache generation for {company}: {e}")
+            return 0
     
-    def _get_event_detail_key(self, company: str, timestamp: str) -> str:
-        """Generate Redis key for specific event details."""
-        return f"news:event:{company}:{timestamp}"
+    def bump_generation(self, company: str) -> Optional[int]:
+        """
+        Advance the company and global generations after new data is indexed.
+        
+        Readers switch to the new generation's keys on their next lookup; the
+        previous generation is never read again and expires on its own TTL.
+        
+        Args:
+            company: Company name/symbol
+            
+        Returns:
+            int: New company generation, or None if Redis is unavailable
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.incr(self._get_generation_key(self._scope(company)))
+            pipe.incr(self._get_generation_key(GLOBAL_SCOPE))
+            generation, _ = pipe.execute()
+            logger.info(f"Bumped cache generation for {company} to {generation}")
+            return generation
+        except RedisError as e:
+            logger.error(f"Error bumping cache generation for {company}: {e}")
+            return None
     
     def set_news_events(
         self, 
         company: str, 
         events: List[Dict[str, Any]], 
-        ttl: int = 3600
+        ttl: int = 3600,
+        generation: Optional[int] = None,
+        stale_ttl: int = 0
     ) -> bool:
         """
         Cache news events for a company.
@@ -72,7 +385,11 @@ class NewsCache:
         Args:
             company: Company name/symbol
             events: List of event dictionaries
-            ttl: Time to live in seconds (default: 1 hour)
+            ttl: Soft time to live in seconds, jittered by ttl_jitter (default: 1 hour)
+            generation: Generation read before the events were fetched
+                (default: current generation)
+            stale_ttl: Seconds past the soft TTL during which the events are
+                still served while one caller refreshes them (default: 0)
             
         Returns:
             bool: True if cached successfully, False otherwise
@@ -81,55 +398,69 @@ class NewsCache:
             return False
         
         try:
-            # Store the full events list
-            events_key = self._get_events_key(company)
-            self.redis_client.setex(
-                events_key,
-                ttl,
-                json.dumps(events)
-            )
+            if generation is None:
+                generation = self.get_generation(company)
             
-            # Also cache individual event details for quick lookup
-            for event in events:
-                timestamp = event.get("timestamp")
-                if timestamp:
-                    detail_key = self._get_event_detail_key(company, timestamp)
-                    self.redis_client.setex(
-                        detail_key,
-                        ttl,
-                        json.dumps(event)
-                    )
-            
-            logger.info(f"Cached {len(events)} events for {company} (TTL: {ttl}s)")
+            # Timeline, impact index and detail hash, staged in capped pipeline batches and swapped in
+            for pipe in self._build_event_writes(company, events, ttl, generation, stale_ttl):
+                pipe.execute()
+            
+            logger.info(
+                f"Cached {len(events)} events for {company} "
+                f"(TTL: {ttl}s + {stale_ttl}s stale, generation: {generation})"
+            )
             return True
             
         except RedisError as e:
             logger.error(f"Error caching events for {company}: {e}")
             return False
     
-    def get_news_events(self, company: str) -> Optional[List[Dict[str, Any]]]:
+    def get_news_events(
+        self,
+        company: str,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        min_impact_score: float = 0.0,
+        limit: Optional[int] = None,
+        generation: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
         """
-        Get cached news events for a company.
+        Get cached news events for a company, optionally limited to a time window.
+        
+        The window is resolved server-side with ZRANGEBYSCORE, so only the
+        visible events are transferred and decoded.
         
         Args:
             company: Company name/symbol
+            start_ms: Window start in epoch milliseconds (inclusive)
+            end_ms: Window end in epoch milliseconds (inclusive)
+            min_impact_score: Minimum impact score (0 = no filter)
+            limit: Maximum number of events to return
+            generation: Company generation to read (default: current generation)
             
         Returns:
-            List of events or None if not cached
+            List of events in chronological order, or None if not cached
         """
         if not self.enabled:
             return None
         
         try:
-            events_key = self._get_events_key(company)
-            cached_data = self.redis_client.get(events_key)
+            if generation is None:
+                generation = self.get_generation(company)
             
-            if cached_data:
-                logger.info(f"Cache hit for {company} events")
-                return json.loads(cached_data)
-            else:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.exists(self._get_timeline_key(company, generation))
+            self._queue_events_range(
+                pipe, company, generation, start_ms, end_ms, min_impact_score, limit
+            )
+            exists, members = pipe.execute()
+            
+            if not exists:
                 logger.info(f"Cache miss for {company} events")
                 return None
+            
+            logger.info(f"Cache hit for {company} events")
+            return self._decode_events(members, min_impact_score, limit)
                 
         except RedisError as e:
             logger.error(f"Error retrieving cached events for {company}: {e}")
@@ -154,12 +485,12 @@ class NewsCache:
             return None
         
         try:
-            detail_key = self._get_event_detail_key(company, timestamp)
-            cached_data = self.redis_client.get(detail_key)
+            details_key = self._get_event_details_key(company, self.get_generation(company))
+            cached_data = self.redis_client.hget(details_key, timestamp)
             
             if cached_data:
                 logger.debug(f"Cache hit for event at {timestamp}")
-                return json.loads(cached_data)
+                return orjson.loads(self.codec.decode(cached_data))
             else:
                 logger.debug(f"Cache miss for event at {timestamp}")
                 return None
@@ -172,43 +503,106 @@ class NewsCache:
         """
         Invalidate all cached data for a company.
         
+        Bumps the company generation (a single INCR) instead of deleting keys.
+        
         Args:
             company: Company name/symbol
             
         Returns:
             bool: True if invalidated successfully
         """
-        if not self.enabled:
+        generation = self.bump_generation(company)
+        if generation is None:
             return False
         
+        logger.info(f"Invalidated cache for {company} (generation {generation})")
+        return True
+    
+    def migrate_legacy_event_keys(self, scan_count: int = 500) -> int:
+        """
+        Move per-event 'news:event:{company}:{timestamp}' keys into the detail hashes.
+        
+        One-off migration for caches written before the hash layout. Each legacy
+        value is copied into its company's current-generation hash (keeping the
+        longest remaining TTL) and the legacy key is deleted.
+        
+        Args:
+            scan_count: SCAN COUNT hint per iteration
+            
+        Returns:
+            int: Number of legacy keys migrated
+        """
+        if not self.enabled:
+            return 0
+        
+        migrated = 0
         try:
-            # Delete main events list
-            events_key = self._get_events_key(company)
-            self.redis_client.delete(events_key)
-            
-            # Delete all event details (using pattern matching)
-            pattern = f"news:event:{company}:*"
-            cursor = 0
-            deleted_count = 0
-            
-            while True:
-                cursor, keys = self.redis_client.scan(
-                    cursor=cursor,
-                    match=pattern,
-                    count=100
-                )
-                if keys:
-                    self.redis_client.delete(*keys)
-                    deleted_count += len(keys)
-                if cursor == 0:
-                    break
+            batch = []
+            for key in self.redis_client.scan_iter(
+                match=f"{LEGACY_EVENT_DETAIL_PREFIX}*",
+                count=scan_count
+            ):
+                batch.append(key.decode())
+                if len(batch) >= self.write_batch_size:
+                    migrated += self._migrate_legacy_batch(batch)
+                    batch = []
+            if batch:
+                migrated += self._migrate_legacy_batch(batch)
             
-            logger.info(f"Invalidated cache for {company} ({deleted_count} keys deleted)")
-            return True
+            logger.info(f"Migrated {migrated} legacy event detail keys")
+            return migrated
             
         except RedisError as e:
-            logger.error(f"Error invalidating cache for {company}: {e}")
-            return False
+            logger.error(f"Error migrating legacy event keys: {e}")
+            return migrated
+    
+    def _migrate_legacy_batch(self, keys: List[str]) -> int:
+        """Copy one batch of legacy detail keys into hashes and delete them."""
+        parsed = [(key, self._parse_legacy_event_detail_key(key)) for key in keys]
+        parsed = [(key, p) for key, p in parsed if p is not None]
+        companies = sorted({company for _, (company, _) in parsed})
+        
+        generation_values = self.redis_client.mget(
+            [self._get_generation_key(self._scope(company)) for company in companies]
+        ) if companies else []
+        details_keys = {
+            company: self._get_event_details_key(company, int(value or 0))
+            for company, value in zip(companies, generation_values)
+        }
+        
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key, _ in parsed:
+            pipe.get(key)
+            pipe.pttl(key)
+        for company in companies:
+            pipe.pttl(details_keys[company])
+        results = pipe.execute()
+        
+        current_ttls = {
+            details_keys[company]: ttl
+            for company, ttl in zip(companies, results[2 * len(parsed):])
+        }
+        target_ttls: Dict[str, int] = {}
+        
+        pipe = self.redis_client.pipeline(transaction=False)
+        migrated = 0
+        for i, (key, (company, timestamp)) in enumerate(parsed):
+            value, pttl = results[2 * i], results[2 * i + 1]
+            if value is None:
+                continue
+            details_key = details_keys[company]
+            pipe.hset(details_key, timestamp, value)
+            pipe.delete(key)
+            if pttl and pttl > 0:
+                target_ttls[details_key] = max(target_ttls.get(details_key, 0), pttl)
+            migrated += 1
+        
+        # Keep the longest remaining TTL seen for each hash
+        for details_key, pttl in target_ttls.items():
+            if pttl > current_ttls.get(details_key, -2):
+                pipe.pexpire(details_key, pttl)
+        pipe.execute()
+        return migrated
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -229,34 +623,840 @@ class NewsCache:
                 "total_commands_processed": info.get("total_commands_processed"),
                 "keyspace_hits": info.get("keyspace_hits", 0),
                 "keyspace_misses": info.get("keyspace_misses", 0),
+                "compression": self.codec.stats(),
             }
         except RedisError as e:
             logger.error(f"Error getting cache stats: {e}")
             return {"enabled": True, "error": str(e)}
 
 
-# Global cache instance
+class AsyncNewsCache(_NewsCacheKeys):
+    """
+    asyncio Redis cache manager for news events.
+    
+    Mirrors the public methods of NewsCache as coroutines so API handlers never
+    block the event loop on a Redis round-trip. Connections come from a bounded
+    pool: callers wait for a free connection instead of opening new sockets.
+    
+    An optional in-process L1 tier (LocalLRUCache) holds decoded results of
+    get_news_events/get_event_detail, so repeated reads skip Redis entirely.
+    """
+    
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        max_connections: int = 50,
+        pool_timeout: float = 5.0,
+        health_check_interval: int = 30,
+        write_batch_size: int = 500,
+        local_cache: Optional[LocalLRUCache] = None,
+        generation_check_interval: float = 1.0,
+        ttl_jitter: float = 0.1,
+        codec: Optional[PayloadCodec] = None
+    ):
+        """
+        Create the connection pool (no I/O until connect() is awaited).
+        
+        Args:
+            host: Redis server host
+            port: Redis server port
+            db: Redis database number
+            max_connections: Upper bound on pooled connections
+            pool_timeout: Seconds to wait for a free pooled connection
+            health_check_interval: Seconds between PINGs on idle connections
+            write_batch_size: Max events written per pipeline round-trip
+            local_cache: Optional in-process L1 tier in front of Redis
+            generation_check_interval: Seconds a generation value is reused
+                before it is re-read from Redis
+            ttl_jitter: Fraction by which TTLs are randomly spread (0 = exact)
+            codec: Compression applied to cached payloads (default: none)
+        """
+        self.host = host
+        self.port = port
+        self.write_batch_size = max(1, write_batch_size)
+        self.local_cache = local_cache
+        self.generation_check_interval = generation_check_interval
+        self.ttl_jitter = ttl_jitter
+        self.codec = codec or PayloadCodec()
+        # scope -> (generation, reuse until monotonic time)
+        self._generations: Dict[str, Tuple[int, float]] = {}
+        # (company, generation) -> monotonic time the cached events turn stale
+        self._fresh_until: Dict[Tuple[str, int], float] = {}
+        self.pool = aioredis.BlockingConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            # Payloads stay bytes end to end: they may be compressed, orjson
+            # decodes them and cached response bodies are sent to clients as-is
+            decode_responses=False,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            socket_keepalive=True,
+            health_check_interval=health_check_interval
+        )
+        self.redis_client = aioredis.Redis(connection_pool=self.pool)
+        self.enabled = False
+    
+    async def connect(self) -> bool:
+        """
+        Verify the Redis connection and enable caching if reachable.
+        
+        Returns:
+            bool: True if Redis is reachable
+        """
+        try:
+            await self.redis_client.ping()
+            logger.info(
+                f"Successfully connected to Redis at {self.host}:{self.port} "
+                f"(async, max_connections={self.pool.max_connections})"
+            )
+            self.enabled = True
+        except RedisError as e:
+            logger.warning(f"Redis not available: {e}. Caching disabled.")
+            self.enabled = False
+        return self.enabled
+    
+    async def close(self) -> None:
+        """Release all pooled connections."""
+        # The pool was passed in explicitly, so Redis.aclose() would leave it open
+        await self.redis_client.aclose(close_connection_pool=True)
+    
+    async def get_generation(self, company: Optional[str] = None) -> int:
+        """
+        Get the current generation counter for a company (or the global scope).
+        
+        Values are remembered for generation_check_interval seconds so hot
+        paths (L1 hits, hover tooltips) do not pay a Redis round-trip each time.
+        
+        Args:
+            company: Company name/symbol, or None for the global scope
+            
+        Returns:
+            int: Current generation (0 if never bumped or Redis unavailable)
+        """
+        if not self.enabled:
+            return 0
+        
+        scope = self._scope(company)
+        known = self._generations.get(scope)
+        if known is not None and known[1] > time.monotonic():
+            return known[0]
+        
+        try:
+            value = await self.redis_client.get(self._get_generation_key(scope))
+            generation = int(value or 0)
+            self._generations[scope] = (generation, time.monotonic() + self.generation_check_interval)
+            return generation
+        except RedisError as e:
+            logger.error(f"Error reading cache generation for {company}: {e}")
+            return known[0] if known is not None else 0
+    
+    async def get_generations(self, companies: List[Optional[str]]) -> Dict[Optional[str], int]:
+        """
+        Get generation counters for several companies with one MGET.
+        
+        Args:
+            companies: Company names/symbols (None for the global scope)
+            
+        Returns:
+            Dict mapping each company to its current generation
+        """
+        if not self.enabled:
+            return {company: 0 for company in companies}
+        
+        now = time.monotonic()
+        generations = {}
+        stale = []
+        for company in companies:
+            known = self._generations.get(self._scope(company))
+            if known is not None and known[1] > now:
+                generations[company] = known[0]
+            else:
+                stale.append(company)
+        
+        if stale:
+            try:
+                values = await self.redis_client.mget(
+                    [self._get_generation_key(self._scope(company)) for company in stale]
+                )
+                expires_at = time.monotonic() + self.generation_check_interval
+                for company, value in zip(stale, values):
+                    generations[company] = int(value or 0)
+                    self._generations[self._scope(company)] = (generations[company], expires_at)
+            except RedisError as e:
+                logger.error(f"Error reading cache generations: {e}")
+                for company in stale:
+                    known = self._generations.get(self._scope(company))
+                    generations[company] = known[0] if known is not None else 0
+        
+        return generations
+    
+    async def bump_generation(self, company: str) -> Optional[int]:
+        """
+        Advance the company and global generations after new data is indexed.
+        
+        Args:
+            company: Company name/symbol
+            
+        Returns:
+            int: New company generation, or None if Redis is unavailable
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.incr(self._get_generation_key(self._scope(company)))
+            pipe.incr(self._get_generation_key(GLOBAL_SCOPE))
+            generation, global_generation = await pipe.execute()
+            
+            expires_at = time.monotonic() + self.generation_check_interval
+            self._generations[self._scope(company)] = (generation, expires_at)
+            self._generations[GLOBAL_SCOPE] = (global_generation, expires_at)
+            logger.info(f"Bumped cache generation for {company} to {generation}")
+            return generation
+        except RedisError as e:
+            logger.error(f"Error bumping cache generation for {company}: {e}")
+            return None
+    
+    async def set_news_events(
+        self, 
+        company: str, 
+        events: List[Dict[str, Any]], 
+        ttl: int = 3600,
+        generation: Optional[int] = None,
+        stale_ttl: int = 0
+    ) -> bool:
+        """
+        Cache news events for a company.
+        
+        Args:
+            company: Company name/symbol
+            events: List of event dictionaries
+            ttl: Soft time to live in seconds, jittered by ttl_jitter (default: 1 hour)
+            generation: Generation read before the events were fetched
+                (default: current generation)
+            stale_ttl: Seconds past the soft TTL during which the events are
+                still served while one caller refreshes them (default: 0)
+            
+        Returns:
+            bool: True if cached successfully, False otherwise
+        """
+        if not self.enabled:
+            return False
+        
+        try:
+            if generation is None:
+                generation = await self.get_generation(company)
+            
+            # Timeline, impact index and detail hash, staged in capped pipeline batches and swapped in
+            for pipe in self._build_event_writes(company, events, ttl, generation, stale_ttl):
+                await pipe.execute()
+            
+            # Dropped after the swap: reads during the fill may have put the
+            # previous events back into L1
+            if self.local_cache is not None:
+                self.local_cache.invalidate_tag(company)
+            self._fresh_until.pop((company, generation), None)
+            
+            logger.info(
+                f"Cached {len(events)} events for {company} "
+                f"(TTL: {ttl}s + {stale_ttl}s stale, generation: {generation})"
+            )
+            return True
+            
+        except RedisError as e:
+            logger.error(f"Error caching events for {company}: {e}")
+            return False
+    
+    async def get_news_events(
+        self,
+        company: str,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        min_impact_score: float = 0.0,
+        limit: Optional[int] = None,
+        generation: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached news events for a company, optionally limited to a time window.
+        
+        The window is resolved server-side with ZRANGEBYSCORE, so only the
+        visible events are transferred and decoded.
+        
+        Args:
+            company: Company name/symbol
+            start_ms: Window start in epoch milliseconds (inclusive)
+            end_ms: Window end in epoch milliseconds (inclusive)
+            min_impact_score: Minimum impact score (0 = no filter)
+            limit: Maximum number of events to return
+            generation: Company generation to read (default: current generation)
+            
+        Returns:
+            List of events in chronological order, or None if not cached
+        """
+        if not self.enabled:
+            return None
+        
+        if generation is None:
+            generation = await self.get_generation(company)
+        
+        l1_key = ("events", company, generation, start_ms, end_ms, min_impact_score, limit)
+        if self.local_cache is not None:
+            cached_events = self.local_cache.get(l1_key)
+            if cached_events is not None:
+                return cached_events
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.exists(self._get_timeline_key(company, generation))
+            self._queue_events_range(
+                pipe, company, generation, start_ms, end_ms, min_impact_score, limit
+            )
+            exists, members = await pipe.execute()
+            
+            if not exists:
+                logger.info(f"Cache miss for {company} events")
+                return None
+            
+            logger.info(f"Cache hit for {company} events")
+            events = self._decode_events(members, min_impact_score, limit)
+            if self.local_cache is not None:
+                payload_size = sum(len(member) for member in members if member)
+                self.local_cache.set(l1_key, events, size=payload_size, tag=company)
+            return events
+                
+        except RedisError as e:
+            logger.error(f"Error retrieving cached events for {company}: {e}")
+            return None
+    
+    async def get_news_events_many(
+        self,
+        generations: Dict[str, int],
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        min_impact_score: float = 0.0,
+        limit: Optional[int] = None
+    ) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Get cached news events for several companies in one pipelined round-trip.
+        
+        Args:
+            generations: Company -> generation to read (see get_generations)
+            start_ms: Window start in epoch milliseconds (inclusive)
+            end_ms: Window end in epoch milliseconds (inclusive)
+            min_impact_score: Minimum impact score (0 = no filter)
+            limit: Maximum number of events per company
+            
+        Returns:
+            Dict mapping each company to its events, or None if not cached
+        """
+        results: Dict[str, Optional[List[Dict[str, Any]]]] = {company: None for company in generations}
+        if not self.enabled:
+            return results
+        
+        pending = []
+        for company, generation in generations.items():
+            l1_key = ("events", company, generation, start_ms, end_ms, min_impact_score, limit)
+            cached_events = self.local_cache.get(l1_key) if self.local_cache is not None else None
+            if cached_events is not None:
+                results[company] = cached_events
+            else:
+                pending.append((company, generation, l1_key))
+        if not pending:
+            return results
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for company, generation, _ in pending:
+                pipe.exists(self._get_timeline_key(company, generation))
+                self._queue_events_range(
+                    pipe, company, generation, start_ms, end_ms, min_impact_score, limit
+                )
+            replies = await pipe.execute()
+            
+            found = []
+            for index, (company, generation, l1_key) in enumerate(pending):
+                exists, members = replies[2 * index], replies[2 * index + 1]
+                if exists:
+                    found.append((company, generation, l1_key, members))
+            
+            for company, generation, l1_key, members in found:
+                events = self._decode_events(members, min_impact_score, limit)
+                results[company] = events
+                if self.local_cache is not None:
+                    payload_size = sum(len(member) for member in members if member)
+                    self.local_cache.set(l1_key, events, size=payload_size, tag=company)
+            
+            logger.info(f"Batch cache read: {len(found)}/{len(pending)} companies hit")
+            return results
+            
+        except RedisError as e:
+            logger.error(f"Error retrieving cached events for {len(pending)} companies: {e}")
+            return results
+    
+    async def claim_refresh(self, company: str, generation: int, lock_ms: int = 30000) -> bool:
+        """
+        Claim the refresh of cached events whose soft TTL has passed.
+        
+        Once the fresh marker expires, exactly one caller wins SET NX on it and
+        should refetch and call set_news_events; everyone else keeps serving
+        the stale events. If the refresh never completes, the claim expires
+        after lock_ms and the next caller retries. Fresh markers are remembered
+        locally until their expiry, so hot reads do not pay a round-trip.
+        
+        Args:
+            company: Company name/symbol
+            generation: Company generation the events were read under
+            lock_ms: Milliseconds the claim holds off other refreshers
+            
+        Returns:
+            bool: True if the caller should refresh the events
+        """
+        if not self.enabled:
+            return False
+        
+        memo_key = (company, generation)
+        if self._fresh_until.get(memo_key, 0.0) > time.monotonic():
+            return False
+        
+        try:
+            fresh_key = self._get_fresh_key(company, generation)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.set(fresh_key, 0, nx=True, px=lock_ms)
+            pipe.pttl(fresh_key)
+            claimed, remaining_ms = await pipe.execute()
+            
+            if claimed:
+                logger.info(f"Cached events for {company} are stale; refreshing")
+                return True
+            if remaining_ms and remaining_ms > 0:
+                self._fresh_until[memo_key] = time.monotonic() + remaining_ms / 1000
+            return False
+        except RedisError as e:
+            logger.error(f"Error checking cache freshness for {company}: {e}")
+            return False
+    
+    async def get_event_detail(
+        self, 
+        company: str, 
+        timestamp: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached detail for a specific event.
+        
+        Args:
+            company: Company name/symbol
+            timestamp: Event timestamp
+            
+        Returns:
+            Event detail dict or None if not cached
+        """
+        if not self.enabled:
+            return None
+        
+        generation = await self.get_generation(company)
+        l1_key = ("detail", company, generation, timestamp)
+        if self.local_cache is not None:
+            cached_detail = self.local_cache.get(l1_key)
+            if cached_detail is not None:
+                return cached_detail
+        
+        try:
+            details_key = self._get_event_details_key(company, generation)
+            cached_data = await self.redis_client.hget(details_key, timestamp)
+            
+            if cached_data:
+                logger.debug(f"Cache hit for event at {timestamp}")
+                detail = orjson.loads(self.codec.decode(cached_data))
+                if self.local_cache is not None:
+                    self.local_cache.set(l1_key, detail, size=len(cached_data), tag=company)
+                return detail
+            else:
+                logger.debug(f"Cache miss for event at {timestamp}")
+                return None
+                
+        except RedisError as e:
+            logger.error(f"Error retrieving event detail: {e}")
+            return None
+    
+    async def invalidate_company(self, company: str) -> bool:
+        """
+        Invalidate all cached data for a company.
+        
+        Bumps the company generation (a single INCR) instead of deleting keys.
+        
+        Args:
+            company: Company name/symbol
+            
+        Returns:
+            bool: True if invalidated successfully
+        """
+        if self.local_cache is not None:
+            self.local_cache.invalidate_tag(company)
+        
+        generation = await self.bump_generation(company)
+        if generation is None:
+            return False
+        
+        logger.info(f"Invalidated cache for {company} (generation {generation})")
+        return True
+    
+    async def get_response(
+        self,
+        route: str,
+        company: Optional[str],
+        params_hash: str,
+        generation: int
+    ) -> Optional[bytes]:
+        """
+        Get a cached, pre-serialized API response body.
+        
+        Args:
+            route: Route name
+            company: Company the response belongs to (None for cross-company routes)
+            params_hash: Hash of the normalized query parameters
+            generation: Generation of the company (or global) scope
+            
+        Returns:
+            JSON body bytes or None if not cached
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            key = self._get_response_key(route, self._scope(company), generation, params_hash)
+            body = await self.redis_client.get(key)
+            return self.codec.decode(body) if body is not None else None
+        except RedisError as e:
+            logger.error(f"Error retrieving cached response for {route}: {e}")
+            return None
+    
+    async def get_encoded_response(
+        self,
+        route: str,
+        company: Optional[str],
+        params_hash: str,
+        generation: int,
+        accepted_encodings: Collection[str]
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Get a cached response body, left compressed if the client accepts its encoding.
+        
+        Args:
+            route: Route name
+            company: Company the response belongs to (None for cross-company routes)
+            params_hash: Hash of the normalized query parameters
+            generation: Generation of the company (or global) scope
+            accepted_encodings: Content-Encodings the client accepts
+            
+        Returns:
+            (body, content encoding); the encoding is None for plain JSON and
+            the body is None if not cached
+        """
+        if not self.enabled:
+            return None, None
+        
+        try:
+            key = self._get_response_key(route, self._scope(company), generation, params_hash)
+            stored = await self.redis_client.get(key)
+            if stored is None:
+                return None, None
+            encoding = self.codec.content_encoding(stored)
+            if encoding is not None and encoding in accepted_encodings:
+                return stored[1:], encoding
+            return self.codec.decode(stored), None
+        except RedisError as e:
+            logger.error(f"Error retrieving cached response for {route}: {e}")
+            return None, None
+    
+    async def set_response(
+        self,
+        route: str,
+        company: Optional[str],
+        params_hash: str,
+        generation: int,
+        body: bytes,
+        ttl: int
+    ) -> bool:
+        """
+        Cache a pre-serialized API response body.
+        
+        Args:
+            route: Route name
+            company: Company the response belongs to (None for cross-company routes)
+            params_hash: Hash of the normalized query parameters
+            generation: Generation read before the response was computed
+            body: Serialized JSON body
+            ttl: Time to live in seconds
+            
+        Returns:
+            bool: True if cached successfully
+        """
+        if not self.enabled:
+            return False
+        
+        try:
+            key = self._get_response_key(route, self._scope(company), generation, params_hash)
+            await self.redis_client.setex(key, self._jittered_ttl(ttl), self.codec.encode(body))
+            return True
+        except RedisError as e:
+            logger.error(f"Error caching response for {route}: {e}")
+            return False
+    
+    async def get_responses(
+        self,
+        route: str,
+        entries: List[Tuple[Optional[str], str, int]]
+    ) -> List[Optional[bytes]]:
+        """
+        Get several cached response bodies with one MGET.
+        
+        Args:
+            route: Route name
+            entries: (company, params_hash, generation) per response
+            
+        Returns:
+            JSON body bytes (None where not cached), in request order
+        """
+        if not self.enabled or not entries:
+            return [None] * len(entries)
+        
+        try:
+            keys = [
+                self._get_response_key(route, self._scope(company), generation, params_hash)
+                for company, params_hash, generation in entries
+            ]
+            bodies = await self.redis_client.mget(keys)
+            return [self.codec.decode(body) if body is not None else None for body in bodies]
+        except RedisError as e:
+            logger.error(f"Error retrieving cached responses for {route}: {e}")
+            return [None] * len(entries)
+    
+    async def set_responses(
+        self,
+        route: str,
+        responses: List[Tuple[Optional[str], str, int, bytes]],
+        ttl: int
+    ) -> bool:
+        """
+        Cache several response bodies in one pipelined round-trip.
+        
+        Args:
+            route: Route name
+            responses: (company, params_hash, generation, body) per response
+            ttl: Time to live in seconds
+            
+        Returns:
+            bool: True if cached successfully
+        """
+        if not self.enabled or not responses:
+            return False
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for company, params_hash, generation, body in responses:
+                key = self._get_response_key(route, self._scope(company), generation, params_hash)
+                pipe.setex(key, self._jittered_ttl(ttl), self.codec.encode(body))
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.error(f"Error caching responses for {route}: {e}")
+            return False
+    
+    async def record_access(self, company: str) -> None:
+        """
+        Count a read of a company's data; the cache warmer fills the most read first.
+        
+        Names are counted normalized (like generation scopes), so spellings that
+        differ only in case or surrounding spaces share one counter. Callers count
+        only reads that found events, so unknown names never accumulate.
+        
+        Args:
+            company: Company name as requested
+        """
+        if not self.enabled:
+            return
+        
+        try:
+            await self.redis_client.zincrby(self._get_popularity_key(), 1, self._scope(company))
+        except RedisError as e:
+            logger.error(f"Error recording access for {company}: {e}")
+    
+    async def get_popular_companies(self, limit: int = 50) -> List[str]:
+        """
+        Get the most read companies (normalized names), most popular first.
+        
+        Args:
+            limit: Maximum number of companies to return
+            
+        Returns:
+            List of company names (empty if nothing recorded or Redis unavailable)
+        """
+        if not self.enabled:
+            return []
+        
+        try:
+            members = await self.redis_client.zrevrange(self._get_popularity_key(), 0, limit - 1)
+            return [member.decode() for member in members]
+        except RedisError as e:
+            logger.error(f"Error reading company popularity: {e}")
+            return []
+    
+    async def acquire_lock(self, name: str, ttl_ms: int) -> Optional[str]:
+        """
+        Try to take a short-lived lock (SET NX PX) so one worker fills a cache key.
+        
+        Fails open: if Redis is unavailable a token is still returned, so the
+        caller loads the data itself instead of waiting on a fill that never comes.
+        
+        Args:
+            name: Lock name (e.g. route, company and generation)
+            ttl_ms: Milliseconds before the lock expires on its own
+            
+        Returns:
+            str: Token to pass to release_lock(), or None if another worker
+                holds the lock
+        """
+        token = uuid.uuid4().hex
+        if not self.enabled:
+            return token
+        
+        try:
+            acquired = await self.redis_client.set(self._get_lock_key(name), token, nx=True, px=ttl_ms)
+            return token if acquired else None
+        except RedisError as e:
+            logger.error(f"Error acquiring cache lock {name}: {e}")
+            return token
+    
+    async def release_lock(self, name: str, token: str) -> bool:
+        """
+        Release a lock taken with acquire_lock() if it is still ours.
+        
+        Args:
+            name: Lock name
+            token: Token returned by acquire_lock()
+            
+        Returns:
+            bool: True if the lock was deleted
+        """
+        if not self.enabled:
+            return False
+        
+        try:
+            released = await self.redis_client.eval(RELEASE_LOCK_SCRIPT, 1, self._get_lock_key(name), token)
+            return bool(released)
+        except RedisError as e:
+            logger.error(f"Error releasing cache lock {name}: {e}")
+            return False
+    
+    async def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict with cache and connection pool stats
+        """
+        if not self.enabled:
+            return {"enabled": False}
+        
+        l1_stats = self.local_cache.stats() if self.local_cache is not None else None
+        try:
+            info = await self.redis_client.info()
+            return {
+                "enabled": True,
+                "used_memory_human": info.get("used_memory_human"),
+                "connected_clients": info.get("connected_clients"),
+                "total_commands_processed": info.get("total_commands_processed"),
+                "keyspace_hits": info.get("keyspace_hits", 0),
+                "keyspace_misses": info.get("keyspace_misses", 0),
+                "pool_max_connections": self.pool.max_connections,
+                "compression": self.codec.stats(),
+                "l1": l1_stats,
+            }
+        except RedisError as e:
+            logger.error(f"Error getting cache stats: {e}")
+            return {"enabled": True, "error": str(e), "compression": self.codec.stats(), "l1": l1_stats}
+
+
+# Global cache instances
 _cache_instance: Optional[NewsCache] = None
+_async_cache_instance: Optional[AsyncNewsCache] = None
 
 
-def get_redis_client() -> NewsCache:
+def get_redis_client(async_client: bool = False) -> Union[NewsCache, AsyncNewsCache]:
     """
     Get or create Redis cache client instance.
     
+    Pool settings for the async client are read from REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT and REDIS_HEALTH_CHECK_INTERVAL. REDIS_WRITE_BATCH_SIZE
+    caps the number of events per pipeline round-trip for both clients.
+    The async client's in-process L1 tier is sized by L1_CACHE_MAX_ENTRIES,
+    L1_CACHE_MAX_BYTES and L1_CACHE_TTL (set L1_CACHE_MAX_ENTRIES=0 to disable),
+    and CACHE_GENERATION_CHECK_INTERVAL sets how long it reuses a generation.
+    CACHE_TTL_JITTER (default 0.1) randomly spreads TTLs by that fraction so
+    entries written together do not expire together.
+    CACHE_COMPRESSION (none, zstd or lz4; default none) compresses cached event
+    payloads and response bodies of at least CACHE_COMPRESSION_THRESHOLD bytes
+    (default 256) at CACHE_COMPRESSION_LEVEL (default 3).
+    
+    Args:
+        async_client: Return the asyncio implementation (used by the API).
+            Callers must await connect() on it before use.
+    
     Returns:
-        NewsCache: Redis cache instance
+        NewsCache or AsyncNewsCache: Redis cache instance
     """
-    global _cache_instance
+    global _cache_instance, _async_cache_instance
+    
+    redis_host = os.getenv("REDIS_HOST", "localhost")
+    redis_port = int(os.getenv("REDIS_PORT", "6379"))
+    redis_db = int(os.getenv("REDIS_DB", "0"))
+    write_batch_size = int(os.getenv("REDIS_WRITE_BATCH_SIZE", "500"))
+    ttl_jitter = float(os.getenv("CACHE_TTL_JITTER", "0.1"))
+    codec = PayloadCodec(
+        codec=os.getenv("CACHE_COMPRESSION", "none"),
+        threshold=int(os.getenv("CACHE_COMPRESSION_THRESHOLD", "256")),
+        level=int(os.getenv("CACHE_COMPRESSION_LEVEL", "3"))
+    )
+    
+    if async_client:
+        if _async_cache_instance is None:
+            l1_max_entries = int(os.getenv("L1_CACHE_MAX_ENTRIES", "10000"))
+            local_cache = None
+            if l1_max_entries > 0:
+                local_cache = LocalLRUCache(
+                    max_entries=l1_max_entries,
+                    max_bytes=int(os.getenv("L1_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+                    ttl=float(os.getenv("L1_CACHE_TTL", "30"))
+                )
+            _async_cache_instance = AsyncNewsCache(
+                host=redis_host,
+                port=redis_port,
+                db=redis_db,
+                max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "50")),
+                pool_timeout=float(os.getenv("REDIS_POOL_TIMEOUT", "5")),
+                health_check_interval=int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30")),
+                write_batch_size=write_batch_size,
+                local_cache=local_cache,
+                generation_check_interval=float(os.getenv("CACHE_GENERATION_CHECK_INTERVAL", "1")),
+                ttl_jitter=ttl_jitter,
+                codec=codec
+            )
+        return _async_cache_instance
     
     if _cache_instance is None:
-        redis_host = os.getenv("REDIS_HOST", "localhost")
-        redis_port = int(os.getenv("REDIS_PORT", "6379"))
-        redis_db = int(os.getenv("REDIS_DB", "0"))
-        
         _cache_instance = NewsCache(
             host=redis_host,
             port=redis_port,
-            db=redis_db
+            db=redis_db,
+            write_batch_size=write_batch_size,
+            ttl_jitter=ttl_jitter,
+            codec=codec
         )
     
     return _cache_instance
@@ -0,0 +1,76 @@
+"""
+In-Process Single-Flight Request Coalescing
+
+Purpose:
+    Ensures concurrent identical cache misses inside one worker share a single
+    in-flight load instead of each querying Elasticsearch.
+    Cross-worker coalescing is layered on top with a short Redis lock
+    (see AsyncNewsCache.acquire_lock).
+
+Usage:
+    flight = SingleFlight()
+    events = await flight.do(("chart-events", company, generation), load_events)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key."""
+    
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.followers = 0
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn once for all concurrent callers with the same key.
+        
+        The first caller (leader) runs fn; callers arriving while it is in
+        flight await the same result or exception.
+        
+        Args:
+            key: Identity of the call
+            fn: Coroutine function producing the result
+        
+        Returns:
+            Result of fn
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.followers += 1
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.leaders += 1
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved so an exception with no followers is not logged
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters.
+        
+        Returns:
+            Dict with leader/follower counts and calls currently in flight
+        """
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "followers": self.followers,
+        }
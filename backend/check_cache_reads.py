@@ -0,0 +1,90 @@
+"""
+Check Cached Chart-Event Reads Against Elasticsearch Semantics
+
+Purpose:
+    Fill the chart-event cache for a scratch company with events that share
+    timestamps (GDELT seendates fall on 15-minute marks) and check that every
+    read path - full, date window, impact-only and impact plus limit - returns
+    the events Elasticsearch would: filtered, in time order, then limited.
+    Exits non-zero on any mismatch. The scratch keys are deleted afterwards.
+
+USAGE:
+    python check_cache_reads.py
+    REDIS_HOST=localhost REDIS_PORT=6379 python check_cache_reads.py
+"""
+
+import sys
+import uuid
+
+from cache.redis_client import get_redis_client, to_epoch_ms
+
+EVENTS = [
+    {"timestamp": "2024-01-01T09:45:00", "title": "f", "url": "https://example.com/f", "impact_score": 0.55},
+    {"timestamp": "2024-01-01T10:00:00", "title": "a", "url": "https://example.com/a", "impact_score": 0.9},
+    {"timestamp": "2024-01-01T10:00:00", "title": "b", "url": "https://example.com/b", "impact_score": 0.1},
+    {"timestamp": "2024-01-01T10:15:00", "title": "c", "url": "https://example.com/c", "impact_score": 0.6},
+    {"timestamp": "2024-01-01T10:15:00", "title": "d", "url": "https://example.com/d", "impact_score": 0.7},
+    {"timestamp": "2024-01-01T10:30:00", "title": "e", "url": "https://example.com/e", "impact_score": 0.2},
+]
+
+# (name, start_date, end_date, min_impact_score, limit); limits never split a
+# shared timestamp, whose order Elasticsearch breaks by url
+CASES = [
+    ("all events", None, None, 0.0, None),
+    ("limit", None, None, 0.0, 3),
+    ("date window", "2024-01-01T10:00:00", "2024-01-01T10:15:00", 0.0, None),
+    ("impact only", None, None, 0.5, None),
+    ("impact only, limit", None, None, 0.5, 2),
+    ("window and impact", "2024-01-01T10:00:00", "2024-01-01T10:15:00", 0.5, None),
+]
+
+
+def expected_titles(start_date, end_date, min_impact_score, limit) -> list:
+    """Titles Elasticsearch returns: filter, sort by seendate then url, then limit."""
+    start_ms, end_ms = to_epoch_ms(start_date), to_epoch_ms(end_date, round_up=True)
+    events = [
+        e for e in EVENTS
+        if e["impact_score"] >= min_impact_score
+        and (start_ms is None or to_epoch_ms(e["timestamp"]) >= start_ms)
+        and (end_ms is None or to_epoch_ms(e["timestamp"]) <= end_ms)
+    ]
+    events.sort(key=lambda e: (to_epoch_ms(e["timestamp"]), e["url"]))
+    return [e["title"] for e in events[:limit or None]]
+
+
+def main():
+    cache = get_redis_client()
+    if not cache.enabled:
+        print("Redis not reachable; start it and retry.")
+        sys.exit(1)
+    
+    company = f"__check_cache_reads_{uuid.uuid4().hex[:8]}"
+    failures = 0
+    try:
+        cache.set_news_events(company, EVENTS, ttl=60, generation=0)
+        for name, start_date, end_date, min_impact_score, limit in CASES:
+            events = cache.get_news_events(
+                company,
+                start_ms=to_epoch_ms(start_date),
+                end_ms=to_epoch_ms(end_date, round_up=True),
+                min_impact_score=min_impact_score,
+                limit=limit,
+                generation=0
+            )
+            titles = sorted(e["title"] for e in events or [])
+            expected = expected_titles(start_date, end_date, min_impact_score, limit)
+            times = [to_epoch_ms(e["timestamp"]) for e in events or []]
+            ok = titles == sorted(expected) and times == sorted(times)
+            failures += not ok
+            print(f"{'OK  ' if ok else 'FAIL'} {name:20s} cached={titles} expected={sorted(expected)}")
+    finally:
+        cache.redis_client.delete(*cache._company_keys(company, 0), cache._get_fresh_key(company, 0))
+    
+    if failures:
+        print(f"\n{failures} read path(s) disagree with Elasticsearch")
+        sys.exit(1)
+    print("\nAll cached read paths match")
+
+
+if __name__ == "__main__":
+    main()
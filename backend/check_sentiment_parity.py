@@ -0,0 +1,77 @@
+"""
+Check Sentiment Parity Between FinBERT Backends
+
+Purpose:
+    Score the labeled headline fixture with the PyTorch FinBERT backend and
+    the int8 ONNX Runtime backend, and report how often their labels agree,
+    how far their probabilities drift and each backend's accuracy against the
+    fixture labels. Exits non-zero if agreement is below --min-agreement.
+
+USAGE:
+    python check_sentiment_parity.py
+    python check_sentiment_parity.py --onnx-path models/finbert-int8.onnx --min-agreement 0.95
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+from ingestion.sentiment_backends import FINBERT_LABELS, load_finbert_backend
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "sentiment_headlines.csv"
+
+
+def load_fixture(path: Path = FIXTURE_PATH) -> list:
+    """(title, label) rows of the labeled headline fixture."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [(row["title"], row["label"]) for row in csv.DictReader(f)]
+
+
+def to_labels(probabilities: list) -> list:
+    """Highest-probability FinBERT label per text."""
+    return [FINBERT_LABELS[scores.index(max(scores))] for scores in probabilities]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check FinBERT torch/ONNX parity")
+    parser.add_argument("--model", type=str, default="ProsusAI/finbert")
+    parser.add_argument("--onnx-path", type=str, default="models/finbert-int8.onnx")
+    parser.add_argument("--min-agreement", type=float, default=0.95)
+    args = parser.parse_args()
+    
+    fixture = load_fixture()
+    titles = [title for title, _ in fixture]
+    expected = [label for _, label in fixture]
+    
+    torch_probs = load_finbert_backend("torch", args.model).predict(titles)
+    onnx_probs = load_finbert_backend("onnx", args.model, onnx_path=args.onnx_path).predict(titles)
+    torch_labels = to_labels(torch_probs)
+    onnx_labels = to_labels(onnx_probs)
+    
+    diffs = [abs(a - b) for t, o in zip(torch_probs, onnx_probs) for a, b in zip(t, o)]
+    agreement = sum(1 for a, b in zip(torch_labels, onnx_labels) if a == b) / len(titles)
+    
+    print(f"\nHeadlines: {len(titles)}")
+    print(f"Label agreement (onnx vs torch): {agreement:.1%}")
+    print(f"Probability diff: max {max(diffs):.4f}, mean {sum(diffs) / len(diffs):.4f}")
+    for name, labels in (("torch", torch_labels), ("onnx", onnx_labels)):
+        accuracy = sum(1 for a, b in zip(labels, expected) if a == b) / len(titles)
+        print(f"Accuracy vs fixture labels ({name}): {accuracy:.1%}")
+    
+    disagreements = [
+        (title, a, b) for title, a, b in zip(titles, torch_labels, onnx_labels) if a != b
+    ]
+    if disagreements:
+        print("\nDisagreements (torch -> onnx):")
+        for title, a, b in disagreements:
+            print(f"  {a:>8} -> {b:<8} {title}")
+    
+    if agreement < args.min_agreement:
+        print(f"\nFAIL: agreement {agreement:.1%} is below {args.min_agreement:.1%}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Purpose:
 
 Expected Output:
     - ES client instance configured from environment variables
+    - Async ES client instance for the FastAPI request path
     - Index creation with custom mappings
     - Single and bulk document indexing capabilities
 """
@@ -14,7 +15,7 @@ Expected Output:
 import logging
 import os
 from typing import Dict, List, Optional
-from elasticsearch import Elasticsearch, helpers
+from elasticsearch import AsyncElasticsearch, Elasticsearch, helpers
 from elasticsearch.exceptions import ConnectionError as ESConnectionError, RequestError
 
 logging.basicConfig(level=logging.INFO)
@@ -67,6 +68,55 @@ def get_es_client() -> Elasticsearch:
         raise ValueError(f"Failed to connect to Elasticsearch: {e}")
 
 
+async def get_async_es_client() -> AsyncElasticsearch:
+    """
+    Create and return an AsyncElasticsearch client instance.
+    
+    Used by the API so that searches do not block the event loop. The client
+    keeps a pool of keep-alive connections per node, so concurrent requests
+    overlap their round-trips instead of queuing behind each other.
+    
+    Reads configuration from environment variables:
+        - ES_HOST: Elasticsearch host URL (default: http://localhost:9200)
+        - ES_API_KEY: Optional API key for authentication
+        - ES_MAX_CONNECTIONS: Pooled connections per node (default: 25)
+        - ES_REQUEST_TIMEOUT: Default per-request timeout in seconds (default: 10)
+        - ES_MAX_RETRIES: Retries on connection errors/timeouts (default: 2)
+    
+    Returns:
+        AsyncElasticsearch: Configured async ES client instance
+        
+    Raises:
+        ValueError: If connection to Elasticsearch fails
+    """
+    es_host = os.getenv("ES_HOST", "http://localhost:9200")
+    es_api_key = os.getenv("ES_API_KEY")
+    
+    client_kwargs = {
+        "verify_certs": False,
+        "connections_per_node": int(os.getenv("ES_MAX_CONNECTIONS", "25")),
+        "request_timeout": float(os.getenv("ES_REQUEST_TIMEOUT", "10")),
+        "max_retries": int(os.getenv("ES_MAX_RETRIES", "2")),
+        "retry_on_timeout": True,
+        "http_compress": True,
+    }
+    if es_api_key:
+        client_kwargs["api_key"] = es_api_key
+    
+    es = AsyncElasticsearch(es_host, **client_kwargs)
+    
+    # Test connection
+    try:
+        await es.info()
+        logger.info(f"Successfully connected to Elasticsearch at {es_host} (async)")
+    except Exception as e:
+        logger.error(f"Elasticsearch ping failed: {e}")
+        await es.close()
+        raise ValueError(f"Could not connect to Elasticsearch at {es_host}")
+    
+    return es
+
+
 def create_index_if_not_exists(es: Elasticsearch, index_name: str, mapping: Dict) -> bool:
     """
     Create an Elasticsearch index with the provided mapping if it doesn't exist.
@@ -194,6 +244,8 @@ def get_default_news_mapping() -> Dict:
     """
     return {
         "mappings": {
+            # The embedding stays in _source (partial updates rebuild documents
+            # from it); API searches project _source so hits never carry it
             "properties": {
                 "title": {"type": "text", "analyzer": "english"},
                 "url": {"type": "keyword"},
@@ -13,40 +13,208 @@ Expected Output:
 
 import logging
 import os
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 from urllib.parse import quote
 
+import numpy as np
 import pandas as pd
 import requests
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import torch
+
+from ingestion.sentiment_cache import SentimentCache, title_key
+from ingestion.sentiment_lexicon import score_titles_lexicon
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load FinBERT model at module import for efficient reuse
-# Fallback to simple rule-based sentiment if model loading fails
-try:
-    logger.info("Loading FinBERT sentiment model...")
-    FINBERT_MODEL_NAME = "ProsusAI/finbert"
-    finbert_tokenizer = AutoTokenizer.from_pretrained(FINBERT_MODEL_NAME)
-    finbert_model = AutoModelForSequenceClassification.from_pretrained(FINBERT_MODEL_NAME)
-    finbert_model.eval()
+# Batched inference settings (see get_sentiments_finbert)
+FINBERT_BATCH_SIZE = int(os.getenv("FINBERT_BATCH_SIZE", "64"))
+FINBERT_MAX_LENGTH = int(os.getenv("FINBERT_MAX_LENGTH", "512"))
+# Intra-op threads for CPU inference (0 = PyTorch/ONNX Runtime default)
+FINBERT_NUM_THREADS = int(os.getenv("FINBERT_NUM_THREADS", "0"))
+
+# Inference engine: "torch" or "onnx" (int8-quantized, exported on first use)
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "torch").lower()
+FINBERT_MODEL_NAME = os.getenv("FINBERT_MODEL_NAME", "ProsusAI/finbert")
+FINBERT_ONNX_PATH = os.getenv(
+    "FINBERT_ONNX_PATH",
+    str(Path(__file__).resolve().parent.parent / "models" / "finbert-int8.onnx")
+)
+
+# "finbert" scores every title with FinBERT; "cascade" lets the lexicon settle
+# titles it is confident about (confidence >= SENTIMENT_CASCADE_MARGIN) first
+SENTIMENT_MODE = os.getenv("SENTIMENT_MODE", "finbert").lower()
+SENTIMENT_CASCADE_MARGIN = float(os.getenv("SENTIMENT_CASCADE_MARGIN", "0.6"))
+
+# Persistent sentiment cache: titles already scored by this model are not re-scored
+SENTIMENT_CACHE_ENABLED = os.getenv("SENTIMENT_CACHE_ENABLED", "true").lower() == "true"
+SENTIMENT_CACHE_PATH = os.getenv(
+    "SENTIMENT_CACHE_PATH",
+    str(Path(__file__).resolve().parent.parent / "data" / "sentiment_cache.sqlite3")
+)
+# Share results between machines through Redis as well (REDIS_HOST/REDIS_PORT)
+SENTIMENT_CACHE_REDIS = os.getenv("SENTIMENT_CACHE_REDIS", "false").lower() == "true"
+SENTIMENT_CACHE_REDIS_TTL = int(os.getenv("SENTIMENT_CACHE_REDIS_TTL", str(30 * 86400)))
+# Entries are only reused by the same model and backend (int8 ONNX scores differ slightly)
+SENTIMENT_MODEL_VERSION = os.getenv("SENTIMENT_MODEL_VERSION", f"{FINBERT_MODEL_NAME}@{SENTIMENT_BACKEND}")
+
+# Shared sentiment server (see ingestion/sentiment_server.py), e.g. http://127.0.0.1:8765.
+# When it is reachable this process does not load FinBERT at all.
+SENTIMENT_SERVER_URL = os.getenv("SENTIMENT_SERVER_URL", "").rstrip("/")
+SENTIMENT_SERVER_TIMEOUT = float(os.getenv("SENTIMENT_SERVER_TIMEOUT", "60"))
+# After a failed request, score in-process for this long before trying the server again
+SENTIMENT_SERVER_RETRY_SECONDS = float(os.getenv("SENTIMENT_SERVER_RETRY_SECONDS", "30"))
+
+finbert_backend = None
+finbert_tokenizer = None
+sentiment_cache = None
+FINBERT_AVAILABLE = False
+_finbert_load_attempted = False
+_finbert_load_lock = threading.Lock()
+_server_session = requests.Session()
+# Pipeline workers may call the server from many threads at once
+_server_session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=32))
+_server_retry_at = 0.0
+
+
+def load_finbert() -> bool:
+    """
+    Load FinBERT (and open the sentiment cache) in this process, once.
+    
+    transformers (and torch, for the torch backend) are imported here rather
+    than at module import, so processes scoring through the sentiment server
+    never pay for them.
+    Falls back to simple rule-based sentiment if model loading fails.
+    
+    Returns:
+        bool: True if the model is loaded
+    """
+    global _finbert_load_attempted
+    
+    # Threads falling back at the same time wait for one load
+    with _finbert_load_lock:
+        if _finbert_load_attempted:
+            return finbert_backend is not None
+        _finbert_load_attempted = True
+        return _load_finbert_locked()
+
+
+def _load_finbert_locked() -> bool:
+    global finbert_backend, finbert_tokenizer, sentiment_cache, FINBERT_AVAILABLE
+    
+    try:
+        from ingestion.sentiment_backends import load_finbert_backend
+        
+        logger.info(f"Loading FinBERT sentiment model ({SENTIMENT_BACKEND} backend)...")
+        finbert_backend = load_finbert_backend(
+            SENTIMENT_BACKEND,
+            FINBERT_MODEL_NAME,
+            max_length=FINBERT_MAX_LENGTH,
+            num_threads=FINBERT_NUM_THREADS,
+            onnx_path=FINBERT_ONNX_PATH
+        )
+        finbert_tokenizer = finbert_backend.tokenizer
+        FINBERT_AVAILABLE = True
+        logger.info(f"FinBERT model loaded successfully in {finbert_backend.load_seconds:.1f}s")
+    except Exception as e:
+        logger.warning(f"Failed to load FinBERT model: {e}. Using rule-based fallback.")
+        finbert_backend = None
+        finbert_tokenizer = None
+        FINBERT_AVAILABLE = False
+        return False
+    
+    if SENTIMENT_CACHE_ENABLED:
+        try:
+            redis_client = None
+            if SENTIMENT_CACHE_REDIS:
+                from cache.redis_client import get_redis_client
+                redis_client = get_redis_client().redis_client
+            sentiment_cache = SentimentCache(
+                SENTIMENT_CACHE_PATH,
+                SENTIMENT_MODEL_VERSION,
+                redis_client=redis_client,
+                redis_ttl=SENTIMENT_CACHE_REDIS_TTL
+            )
+            logger.info(f"Sentiment cache at {SENTIMENT_CACHE_PATH} (model version {SENTIMENT_MODEL_VERSION})")
+        except Exception as e:
+            logger.warning(f"Sentiment cache unavailable: {e}. Scoring every title.")
+            sentiment_cache = None
+    return True
+
+
+def sentiment_server_available() -> bool:
+    """
+    Check whether the sentiment server is reachable and has FinBERT loaded.
+    
+    Returns:
+        bool: True if SENTIMENT_SERVER_URL is set and the server is healthy
+    """
+    if not SENTIMENT_SERVER_URL:
+        return False
+    try:
+        response = _server_session.get(f"{SENTIMENT_SERVER_URL}/health", timeout=2)
+        response.raise_for_status()
+        return bool(response.json().get("finbert_available"))
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"Sentiment server at {SENTIMENT_SERVER_URL} not available: {e}")
+        _mark_server_down()
+        return False
+
+
+def _mark_server_down() -> None:
+    global _server_retry_at
+    _server_retry_at = time.monotonic() + SENTIMENT_SERVER_RETRY_SECONDS
+
+
+def get_sentiments_remote(texts: List[str], use_cache: bool = True) -> Optional[List[tuple[str, float]]]:
+    """
+    Score texts on the sentiment server.
+    
+    Args:
+        texts: Input texts
+        use_cache: Let the server read and write its sentiment cache
+        
+    Returns:
+        List of (sentiment_label, sentiment_score), or None if the server is
+        not configured, recently failed or the request failed
+    """
+    if not SENTIMENT_SERVER_URL or time.monotonic() < _server_retry_at:
+        return None
+    try:
+        response = _server_session.post(
+            f"{SENTIMENT_SERVER_URL}/sentiment",
+            json={"texts": [text or "" for text in texts], "use_cache": use_cache},
+            timeout=SENTIMENT_SERVER_TIMEOUT
+        )
+        response.raise_for_status()
+        return [(label, score) for label, score in response.json()["sentiments"]]
+    except (requests.RequestException, ValueError, KeyError) as e:
+        logger.warning(
+            f"Sentiment server request failed: {e}. "
+            f"Using in-process FinBERT for the next {SENTIMENT_SERVER_RETRY_SECONDS:g}s."
+        )
+        _mark_server_down()
+        return None
+
+
+# Load FinBERT at module import for efficient reuse, unless a sentiment server will score for us
+if sentiment_server_available():
+    logger.info(f"Using sentiment server at {SENTIMENT_SERVER_URL}; FinBERT not loaded in this process")
     FINBERT_AVAILABLE = True
-    logger.info("FinBERT model loaded successfully")
-except Exception as e:
-    logger.warning(f"Failed to load FinBERT model: {e}. Using rule-based fallback.")
-    finbert_tokenizer = None
-    finbert_model = None
-    FINBERT_AVAILABLE = False
+else:
+    load_finbert()
 
 
 def get_sentiment_finbert(text: str) -> tuple[str, float]:
     """
     Get sentiment label and score using FinBERT model.
     
+    Uses the sentiment server when SENTIMENT_SERVER_URL is set and falls back
+    to in-process inference if it cannot be reached.
+    
     Args:
         text: Input text (title or summary)
         
@@ -58,25 +226,18 @@ def get_sentiment_finbert(text: str) -> tuple[str, float]:
     if not FINBERT_AVAILABLE or not text:
         return get_sentiment_fallback(text)
     
+    remote = get_sentiments_remote([text])
+    if remote is not None:
+        return remote[0]
+    if not load_finbert():
+        return get_sentiment_fallback(text)
+    
     try:
-        inputs = finbert_tokenizer(
-            text,
-            return_tensors="pt",
-            truncation=True,
-            max_length=512,
-            padding=True
-        )
-        
-        with torch.no_grad():
-            outputs = finbert_model(**inputs)
-            predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-        
         # FinBERT labels: [positive, negative, neutral]
-        scores = predictions[0].tolist()
-        labels = ["positive", "negative", "neutral"]
+        scores = finbert_backend.predict([text])[0]
         
         max_idx = scores.index(max(scores))
-        sentiment_label = labels[max_idx]
+        sentiment_label = finbert_backend.labels[max_idx]
         sentiment_score = scores[max_idx]
         
         return sentiment_label, sentiment_score
@@ -86,6 +247,145 @@ def get_sentiment_finbert(text: str) -> tuple[str, float]:
         return get_sentiment_fallback(text)
 
 
+def get_sentiments_finbert(
+    texts: List[str],
+    batch_size: int = FINBERT_BATCH_SIZE,
+    use_cache: bool = True
+) -> List[tuple[str, float]]:
+    """
+    Get sentiment labels and scores for many texts with batched FinBERT inference.
+    
+    Texts are sorted by token length and split into batches, and each batch is
+    padded only to its own longest text, so short headlines do not pay for long
+    ones. Results match get_sentiment_finbert text by text.
+    
+    With SENTIMENT_SERVER_URL set, texts are scored by the shared sentiment
+    server; if it cannot be reached, FinBERT is loaded in this process instead.
+    
+    With the sentiment cache enabled, texts are looked up by normalized-title
+    hash first (one batched lookup), repeated titles are scored once, and only
+    misses reach the model. New results are written back in one batch;
+    fallback results are never cached.
+    
+    Args:
+        texts: Input texts (titles or summaries)
+        batch_size: Texts per forward pass (default: FINBERT_BATCH_SIZE)
+        use_cache: Read and write the sentiment cache (if enabled)
+        
+    Returns:
+        List of (sentiment_label, sentiment_score), in input order
+    """
+    if not FINBERT_AVAILABLE:
+        return [get_sentiment_fallback(text) for text in texts]
+    
+    remote = get_sentiments_remote(texts, use_cache=use_cache)
+    if remote is not None:
+        return remote
+    if not load_finbert():
+        return [get_sentiment_fallback(text) for text in texts]
+    
+    cache = sentiment_cache if use_cache else None
+    results: List[Optional[tuple[str, float]]] = [None] * len(texts)
+    # Texts sharing a key are scored once; without the cache every text is its own group
+    groups: Dict[str, List[int]] = {}
+    for i, text in enumerate(texts):
+        if text:
+            groups.setdefault(title_key(text) if cache is not None else str(i), []).append(i)
+        else:
+            results[i] = get_sentiment_fallback(text)
+    if not groups:
+        return results
+    
+    if cache is not None:
+        cached = cache.get_many(groups)
+        for key, sentiment in cached.items():
+            for i in groups.pop(key):
+                results[i] = sentiment
+        served = len(texts) - sum(len(group) for group in groups.values())
+        logger.info(
+            f"Sentiment cache: {len(cached)} hits, {len(groups)} misses; "
+            f"{served}/{len(texts)} titles ({served / len(texts):.0%}) served without inference"
+        )
+        if not groups:
+            return results
+    
+    keys = list(groups)
+    indices = [groups[key][0] for key in keys]
+    
+    # Length bucketing: texts of similar token length share a batch. Each text
+    # is tokenized once; the batches reuse these ids.
+    input_ids = finbert_backend.encode([texts[i] for i in indices])
+    order = sorted(range(len(indices)), key=lambda j: len(input_ids[j]))
+    batch_size = max(1, batch_size)
+    scored = {}
+    
+    for start in range(0, len(order), batch_size):
+        batch = order[start:start + batch_size]
+        try:
+            # Dynamic padding: the backend pads to the longest text in this batch only
+            predictions = finbert_backend.predict_encoded([input_ids[j] for j in batch])
+            for j, scores in zip(batch, predictions):
+                max_idx = scores.index(max(scores))
+                scored[keys[j]] = (finbert_backend.labels[max_idx], scores[max_idx])
+        except Exception as e:
+            logger.warning(f"Batched FinBERT sentiment analysis failed: {e}. Using fallback.")
+    
+    for key, group in groups.items():
+        sentiment = scored.get(key) or get_sentiment_fallback(texts[group[0]])
+        for i in group:
+            results[i] = sentiment
+    
+    if cache is not None:
+        cache.set_many(scored)
+    
+    return results
+
+
+def get_sentiments_cascade(
+    titles: pd.Series,
+    margin: float = SENTIMENT_CASCADE_MARGIN,
+    batch_size: int = FINBERT_BATCH_SIZE,
+    use_cache: bool = True
+) -> List[tuple[str, float]]:
+    """
+    Get sentiment with the lexicon first and FinBERT only for uncertain titles.
+    
+    The lexicon scores the whole Series at once; titles whose lexicon
+    confidence is below margin go to batched FinBERT. A margin of 0 trusts the
+    lexicon everywhere, a margin of 1 sends every title to FinBERT. See
+    benchmark_sentiment_cascade.py for agreement and speedup per margin.
+    
+    Args:
+        titles: Title strings
+        margin: Minimum lexicon confidence for a title to skip FinBERT
+        batch_size: Texts per FinBERT forward pass
+        use_cache: Read and write the sentiment cache for FinBERT titles
+        
+    Returns:
+        List of (sentiment_label, sentiment_score), in input order
+    """
+    lexicon = score_titles_lexicon(titles)
+    results = [
+        (label, float(score))
+        for label, score in zip(lexicon["sentiment_label"], lexicon["sentiment_score"])
+    ]
+    if not FINBERT_AVAILABLE:
+        return results
+    
+    uncertain = np.flatnonzero(lexicon["confidence"].to_numpy() < margin)
+    logger.info(f"Sentiment cascade: {len(titles) - len(uncertain)}/{len(titles)} titles settled by lexicon")
+    if len(uncertain):
+        sentiments = get_sentiments_finbert(
+            titles.iloc[uncertain].tolist(),
+            batch_size=batch_size,
+            use_cache=use_cache
+        )
+        for i, sentiment in zip(uncertain, sentiments):
+            results[i] = sentiment
+    
+    return results
+
+
 def get_sentiment_fallback(text: str) -> tuple[str, float]:
     """
     Simple rule-based sentiment fallback (keyword matching).
@@ -192,9 +492,12 @@ def fetch_gdelt_news(
             
             # Enrich with sentiment
             logger.info(f"Computing sentiment for {len(df)} articles...")
-            sentiments = df["title"].apply(get_sentiment_finbert)
-            df["sentiment_label"] = sentiments.apply(lambda x: x[0])
-            df["sentiment_score"] = sentiments.apply(lambda x: x[1])
+            if SENTIMENT_MODE == "cascade":
+                sentiments = get_sentiments_cascade(df["title"])
+            else:
+                sentiments = get_sentiments_finbert(df["title"].tolist())
+            df["sentiment_label"] = [label for label, _ in sentiments]
+            df["sentiment_score"] = [score for _, score in sentiments]
             
             # Convert seendate to datetime (GDELT format: 20251108T003000Z)
             df["seendate"] = pd.to_datetime(df["seendate"], format="ISO8601", errors="coerce")
@@ -0,0 +1,262 @@
+"""
+FinBERT Inference Backends
+
+Purpose:
+    Runs FinBERT on either PyTorch or ONNX Runtime behind one interface, so
+    the ingestion pipeline can pick the engine by configuration
+    (SENTIMENT_BACKEND=torch|onnx).
+    The ONNX backend exports FinBERT once, quantizes its weights to int8
+    (dynamic quantization) and reuses the saved model on later runs.
+
+Usage:
+    backend = load_finbert_backend("onnx", "ProsusAI/finbert", onnx_path="models/finbert-int8.onnx")
+    probabilities = backend.predict(["Infosys raises revenue guidance"])
+    # [[positive, negative, neutral]] per text
+
+Requires:
+    torch backend: pip install torch
+    onnx backend: pip install onnxruntime onnx (plus torch for the one-time export)
+"""
+
+import inspect
+import logging
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from transformers import AutoTokenizer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# FinBERT output order
+FINBERT_LABELS = ["positive", "negative", "neutral"]
+
+ONNX_INPUT_NAMES = ["input_ids", "attention_mask", "token_type_ids"]
+
+
+class FinBERTBackend(ABC):
+    """Tokenizer plus inference engine returning FinBERT class probabilities."""
+    
+    name = "base"
+    labels = FINBERT_LABELS
+    
+    def __init__(self, model_name: str, max_length: int = 512):
+        """
+        Args:
+            model_name: Hugging Face model name or local path (tokenizer source)
+            max_length: Tokens kept per text before truncation
+        """
+        self.model_name = model_name
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        # Seconds spent loading the model/engine (set by subclasses)
+        self.load_seconds = 0.0
+    
+    def encode(self, texts: List[str]) -> List[List[int]]:
+        """
+        Tokenize texts without padding.
+        
+        Args:
+            texts: Non-empty input texts
+        
+        Returns:
+            Token ids per text, truncated to max_length
+        """
+        return self.tokenizer(texts, truncation=True, max_length=self.max_length)["input_ids"]
+    
+    def pad(self, input_ids: List[List[int]]) -> Dict[str, np.ndarray]:
+        """Pad token ids to the longest in the batch (BERT inputs, int64)."""
+        longest = max(len(ids) for ids in input_ids)
+        padded = np.full((len(input_ids), longest), self.tokenizer.pad_token_id, dtype=np.int64)
+        attention_mask = np.zeros((len(input_ids), longest), dtype=np.int64)
+        for row, ids in enumerate(input_ids):
+            padded[row, :len(ids)] = ids
+            attention_mask[row, :len(ids)] = 1
+        return {
+            "input_ids": padded,
+            "attention_mask": attention_mask,
+            "token_type_ids": np.zeros_like(padded)
+        }
+    
+    def predict(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get class probabilities for a batch of texts.
+        
+        Args:
+            texts: Non-empty input texts
+        
+        Returns:
+            [positive, negative, neutral] probabilities per text
+        """
+        return self.predict_encoded(self.encode(texts))
+    
+    @abstractmethod
+    def predict_encoded(self, input_ids: List[List[int]]) -> List[List[float]]:
+        """
+        Get class probabilities for a batch of texts already encoded by encode().
+        
+        Callers that tokenize anyway (e.g. to bucket texts by length) pass the
+        ids here instead of tokenizing twice. The batch is padded to its own
+        longest text.
+        
+        Args:
+            input_ids: Token ids per text, from encode()
+        
+        Returns:
+            [positive, negative, neutral] probabilities per text
+        """
+
+
+class TorchFinBERT(FinBERTBackend):
+    """FinBERT on PyTorch (the reference backend)."""
+    
+    name = "torch"
+    
+    def __init__(self, model_name: str, max_length: int = 512, num_threads: int = 0):
+        """
+        Args:
+            model_name: Hugging Face model name or local path
+            max_length: Tokens kept per text before truncation
+            num_threads: PyTorch intra-op threads (0 = PyTorch default)
+        """
+        # Imported here so the ONNX backend runs without PyTorch
+        import torch
+        from transformers import AutoModelForSequenceClassification
+        
+        super().__init__(model_name, max_length)
+        if num_threads > 0:
+            torch.set_num_threads(num_threads)
+        self.torch = torch
+        start = time.perf_counter()
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        self.model.eval()
+        self.load_seconds = time.perf_counter() - start
+    
+    def predict_encoded(self, input_ids: List[List[int]]) -> List[List[float]]:
+        inputs = {name: self.torch.from_numpy(array) for name, array in self.pad(input_ids).items()}
+        with self.torch.inference_mode():
+            return self.torch.nn.functional.softmax(self.model(**inputs).logits, dim=-1).tolist()
+
+
+class OnnxFinBERT(FinBERTBackend):
+    """int8-quantized FinBERT on ONNX Runtime (CPU)."""
+    
+    name = "onnx"
+    
+    def __init__(self, model_name: str, onnx_path: str, max_length: int = 512, num_threads: int = 0):
+        """
+        Args:
+            model_name: Hugging Face model name or local path
+            onnx_path: Quantized model file; exported from model_name if missing
+            max_length: Tokens kept per text before truncation
+            num_threads: ONNX Runtime intra-op threads (0 = runtime default)
+        """
+        import onnxruntime as ort
+        
+        super().__init__(model_name, max_length)
+        onnx_path = Path(onnx_path)
+        if not onnx_path.exists():
+            export_finbert_onnx(model_name, onnx_path)
+        
+        start = time.perf_counter()
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(str(onnx_path), options, providers=["CPUExecutionProvider"])
+        self.input_names = [node.name for node in self.session.get_inputs()]
+        self.load_seconds = time.perf_counter() - start
+    
+    def predict_encoded(self, input_ids: List[List[int]]) -> List[List[float]]:
+        inputs = self.pad(input_ids)
+        feed = {name: inputs[name] for name in self.input_names}
+        logits = self.session.run(["logits"], feed)[0]
+        exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+        return (exp / exp.sum(axis=-1, keepdims=True)).tolist()
+
+
+def export_finbert_onnx(model_name: str, onnx_path: Path, opset: int = 17) -> Path:
+    """
+    Export FinBERT to ONNX and quantize its weights to int8.
+    
+    Batch and sequence dimensions stay dynamic, so the exported model serves
+    any batch size and padded length.
+    
+    Args:
+        model_name: Hugging Face model name or local path
+        onnx_path: Where to write the quantized model
+        opset: ONNX opset version
+    
+    Returns:
+        Path of the quantized model
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModelForSequenceClassification
+    
+    start = time.perf_counter()
+    onnx_path = Path(onnx_path)
+    onnx_path.parent.mkdir(parents=True, exist_ok=True)
+    fp32_path = onnx_path.with_name(f"{onnx_path.stem}-fp32.onnx")
+    
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+    sample = tokenizer(["Sample headline for export"], return_tensors="pt")
+    
+    export_kwargs = {}
+    # Newer PyTorch defaults to the dynamo exporter; dynamic_axes needs the TorchScript one
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs["dynamo"] = False
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in ONNX_INPUT_NAMES}
+    dynamic_axes["logits"] = {0: "batch"}
+    
+    with torch.inference_mode():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in ONNX_INPUT_NAMES),
+            str(fp32_path),
+            input_names=ONNX_INPUT_NAMES,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            **export_kwargs
+        )
+    quantize_dynamic(str(fp32_path), str(onnx_path), weight_type=QuantType.QInt8)
+    fp32_path.unlink()
+    
+    logger.info(
+        f"Exported int8 ONNX FinBERT to {onnx_path} "
+        f"({onnx_path.stat().st_size / 1e6:.0f} MB) in {time.perf_counter() - start:.1f}s"
+    )
+    return onnx_path
+
+
+def load_finbert_backend(
+    name: str,
+    model_name: str,
+    max_length: int = 512,
+    num_threads: int = 0,
+    onnx_path: str = "models/finbert-int8.onnx"
+) -> FinBERTBackend:
+    """
+    Create the FinBERT backend selected by name.
+    
+    Args:
+        name: "torch" or "onnx"
+        model_name: Hugging Face model name or local path
+        max_length: Tokens kept per text before truncation
+        num_threads: Intra-op threads for the engine (0 = default)
+        onnx_path: Quantized model file for the ONNX backend
+    
+    Returns:
+        FinBERTBackend: Loaded backend
+    """
+    if name == "onnx":
+        return OnnxFinBERT(model_name, onnx_path, max_length=max_length, num_threads=num_threads)
+    if name == "torch":
+        return TorchFinBERT(model_name, max_length=max_length, num_threads=num_threads)
+    raise ValueError(f"Unknown sentiment backend '{name}' (expected 'torch' or 'onnx')")
@@ -0,0 +1,192 @@
+"""
+Persistent Sentiment Cache
+
+Purpose:
+    Remembers FinBERT results across pipeline runs so a headline is scored
+    only once per model version. GDELT returns the same headline for
+    overlapping date ranges, repeated runs and companies sharing an article.
+    Entries are keyed by a hash of the normalized title plus the model version
+    and stored in SQLite, optionally backed by a shared Redis tier so several
+    ingestion boxes reuse each other's results.
+
+Usage:
+    cache = SentimentCache("data/sentiment_cache.sqlite3", model_version="ProsusAI/finbert@torch")
+    found = cache.get_many(titles)          # {title_key: (label, score)}
+    cache.set_many({title_key(t): result for t, result in scored})
+    cache.stats()                           # hits, misses, hit rate
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Stay below SQLite's host-parameter limit on older builds (999)
+SQLITE_BATCH_SIZE = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(text: str) -> str:
+    """
+    Canonical form of a title for cache keys.
+    
+    Unicode-normalized, case-folded and whitespace-collapsed, so trivially
+    different copies of a headline share an entry (FinBERT is uncased).
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip().casefold()
+
+
+def title_key(text: str) -> str:
+    """SHA-1 of the normalized title."""
+    return hashlib.sha1(normalize_title(text).encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """SQLite (plus optional Redis) cache of (label, score) by title hash and model version."""
+    
+    def __init__(
+        self,
+        path: str,
+        model_version: str,
+        redis_client=None,
+        redis_ttl: int = 30 * 86400
+    ):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: SQLite file
+            model_version: Identifies the model/backend that produced the scores;
+                entries of other versions are never returned
+            redis_client: Optional sync Redis client shared between machines
+            redis_ttl: Seconds Redis entries live
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_version = model_version
+        self.redis_client = redis_client
+        self.redis_ttl = redis_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        # WAL lets several pipeline processes read while one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sentiment (
+                model_version TEXT NOT NULL,
+                title_hash TEXT NOT NULL,
+                label TEXT NOT NULL,
+                score REAL NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (model_version, title_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+    
+    def _redis_key(self, key: str) -> str:
+        return f"sentiment:{self.model_version}:{key}"
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Tuple[str, float]]:
+        """
+        Look up cached results; SQLite first, then Redis for what is left.
+        
+        Args:
+            keys: Title keys (see title_key)
+        
+        Returns:
+            Dict of found keys to (label, score)
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Tuple[str, float]] = {}
+        
+        with self._lock:
+            for start in range(0, len(keys), SQLITE_BATCH_SIZE):
+                chunk = keys[start:start + SQLITE_BATCH_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT title_hash, label, score FROM sentiment "
+                    f"WHERE model_version = ? AND title_hash IN ({','.join('?' * len(chunk))})",
+                    [self.model_version, *chunk]
+                ).fetchall()
+                for title_hash, label, score in rows:
+                    found[title_hash] = (label, score)
+        
+        remaining = [key for key in keys if key not in found]
+        if remaining and self.redis_client is not None:
+            from_redis = {}
+            try:
+                values = self.redis_client.mget([self._redis_key(key) for key in remaining])
+                for key, value in zip(remaining, values):
+                    if value:
+                        label, _, score = (value.decode() if isinstance(value, bytes) else value).partition(":")
+                        from_redis[key] = (label, float(score))
+            except RedisError as e:
+                logger.warning(f"Sentiment cache Redis lookup failed: {e}")
+            if from_redis:
+                found.update(from_redis)
+                # Keep a local copy so the next run does not need Redis
+                self._write_sqlite(from_redis)
+        
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+    
+    def set_many(self, results: Dict[str, Tuple[str, float]]) -> None:
+        """
+        Store results in SQLite (one transaction) and Redis (one pipeline).
+        
+        Args:
+            results: Title key -> (label, score)
+        """
+        if not results:
+            return
+        self._write_sqlite(results)
+        if self.redis_client is not None:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, (label, score) in results.items():
+                    pipe.set(self._redis_key(key), f"{label}:{score!r}", ex=self.redis_ttl)
+                pipe.execute()
+            except RedisError as e:
+                logger.warning(f"Sentiment cache Redis write failed: {e}")
+    
+    def _write_sqlite(self, results: Dict[str, Tuple[str, float]]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sentiment (model_version, title_hash, label, score, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(self.model_version, key, label, score, now) for key, (label, score) in results.items()]
+            )
+    
+    def stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get lookup counters since the cache was opened.
+        
+        Returns:
+            Dict with hits, misses and hit rate (None before any lookup)
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else None,
+        }
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
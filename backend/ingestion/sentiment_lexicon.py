@@ -0,0 +1,86 @@
+"""
+Lexicon Sentiment Scorer
+
+Purpose:
+    Fast first stage of the sentiment cascade. Counts financial positive,
+    negative and neutral (corporate calendar) terms in every title of a Series
+    with vectorized regex matching, and turns the counts into a label plus a
+    confidence in [0, 1). Titles the lexicon is confident about skip FinBERT;
+    the rest are scored by the transformer (see get_sentiments_cascade).
+
+Usage:
+    scored = score_titles_lexicon(df["title"])
+    # columns: sentiment_label, sentiment_score, confidence
+    uncertain = scored["confidence"] < 0.6
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Stems match their inflections ("surg" -> surge, surges, surged)
+POSITIVE_TERMS = [
+    r"surg\w*", r"soar\w*", r"jump\w*", r"rall(?:y|ies|ied)", r"gain\w*", r"climb\w*",
+    r"beat\w*", r"profit (?:rise|rises|jumps|grows|up)", r"record (?:high|profit|revenue|deal)\w*",
+    r"upgrad\w*", r"outperform\w*", r"raises? (?:\w+ )?(?:guidance|outlook|forecast)",
+    r"strong\w*", r"robust", r"boost\w*", r"expan(?:d|ds|ded|sion)", r"wins?", r"bags?",
+    r"secur(?:es|ed) (?:\w+ )?(?:order|contract|deal)", r"approv(?:al|es|ed) for",
+    r"dividend hike", r"growth", r"rebound\w*", r"improv\w*", r"buy rating",
+]
+NEGATIVE_TERMS = [
+    r"slump\w*", r"plung\w*", r"crash\w*", r"tumbl\w*", r"drop\w*", r"fall\w*", r"fell",
+    r"declin\w*", r"slid\w*", r"sink\w*", r"sank", r"loss\w*", r"weak\w*", r"slow\w*",
+    r"cuts? (?:\w+ )?(?:guidance|outlook|forecast|jobs)", r"downgrad\w*", r"miss(?:es|ed)",
+    r"falls? short", r"penalt\w*", r"fine[sd]?", r"probe", r"fraud\w*", r"default\w*",
+    r"recall\w*", r"warn\w*", r"layoffs?", r"bad loans", r"overruns?", r"shortage\w*",
+    r"bars?", r"curbs?", r"lapses?", r"defect\w*", r"short seller", r"underperform\w*",
+    r"sell rating", r"resign\w*",
+]
+NEUTRAL_TERMS = [
+    r"board meeting", r"(?:to )?consider", r"record date", r"annual general meeting", r"agm",
+    r"appoints?", r"names? new", r"to hold", r"to participate",
+    r"memorandum of understanding", r"to present", r"released", r"step down",
+]
+
+SENTIMENT_CLASSES = ["positive", "negative", "neutral"]
+
+
+def _compile(terms: list) -> re.Pattern:
+    return re.compile(r"\b(?:" + "|".join(terms) + r")\b", re.IGNORECASE)
+
+
+PATTERNS = [_compile(POSITIVE_TERMS), _compile(NEGATIVE_TERMS), _compile(NEUTRAL_TERMS)]
+
+
+def score_titles_lexicon(titles: pd.Series) -> pd.DataFrame:
+    """
+    Score every title with the lexicon.
+    
+    Confidence is (top count - runner-up count) / (total count + 1): one
+    unopposed term gives 0.5, two give 0.67, and titles without terms or with
+    conflicting terms get 0 (labelled neutral).
+    
+    Args:
+        titles: Title strings (missing values are treated as empty)
+    
+    Returns:
+        DataFrame indexed like titles with sentiment_label, sentiment_score
+        (0.5 + confidence / 2, comparable to the fallback scores) and confidence
+    """
+    text = titles.fillna("").astype(str)
+    counts = np.column_stack([text.str.count(pattern).to_numpy() for pattern in PATTERNS])
+    
+    ranked = np.sort(counts, axis=1)
+    confidence = (ranked[:, -1] - ranked[:, -2]) / (counts.sum(axis=1) + 1)
+    # Ties (including no terms at all) are neutral
+    label_idx = np.where(confidence > 0, counts.argmax(axis=1), SENTIMENT_CLASSES.index("neutral"))
+    
+    return pd.DataFrame(
+        {
+            "sentiment_label": np.array(SENTIMENT_CLASSES, dtype=object)[label_idx],
+            "sentiment_score": 0.5 + confidence / 2,
+            "confidence": confidence,
+        },
+        index=titles.index,
+    )
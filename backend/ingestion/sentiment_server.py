@@ -0,0 +1,219 @@
+"""
+Sentiment Inference Server
+
+PURPOSE:
+    Keeps FinBERT loaded in one long-lived process on localhost, so pipeline
+    runs, verification scripts and ad-hoc jobs do not each spend seconds and a
+    full model's RAM loading it. Concurrent requests are gathered into
+    micro-batches: the first request opens a short window (default 10 ms),
+    everything arriving within it (up to a text budget) runs in one batched
+    FinBERT call, and requests arriving while the model is busy form the next
+    batch. The server uses the same backend settings and sentiment cache as
+    in-process inference.
+
+ENDPOINTS:
+    GET  /health    - Model status and batching counters
+    POST /sentiment - {"texts": [...], "use_cache": true} -> {"sentiments": [[label, score], ...]}
+
+USAGE:
+    python -m ingestion.sentiment_server --port 8765
+    SENTIMENT_SERVER_URL=http://127.0.0.1:8765 python run_pipeline.py --companies nifty50 ...
+    
+    Clients (get_sentiment_finbert / get_sentiments_finbert) fall back to
+    in-process inference whenever the server cannot be reached.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+# This process serves the model itself and must not forward to another server
+os.environ.pop("SENTIMENT_SERVER_URL", None)
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from ingestion import news_ingestor
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SENTIMENT_SERVER_BATCH_WINDOW_MS = float(os.getenv("SENTIMENT_SERVER_BATCH_WINDOW_MS", "10"))
+SENTIMENT_SERVER_MAX_BATCH = int(os.getenv("SENTIMENT_SERVER_MAX_BATCH", "256"))
+
+
+class MicroBatcher:
+    """Gathers concurrent scoring requests into batched calls on one worker thread."""
+    
+    def __init__(self, score_fn: Callable, window_ms: float = 10.0, max_batch: int = 256):
+        """
+        Args:
+            score_fn: Batched scorer, called as score_fn(texts, use_cache=...)
+            window_ms: How long the first request of a batch waits for others
+            max_batch: Texts after which a batch is closed early
+        """
+        self.score_fn = score_fn
+        self.window = window_ms / 1000
+        self.max_batch = max(1, max_batch)
+        self.requests = 0
+        self.texts = 0
+        self.batches = 0
+        self._queue = None
+        self._task = None
+        # One thread: the model runs one batch at a time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentiment")
+    
+    def start(self) -> None:
+        """Start the batching loop (call from the running event loop)."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the batching loop and the worker thread."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False)
+    
+    async def submit(self, texts: List[str], use_cache: bool = True) -> List[tuple]:
+        """
+        Score texts as part of the next micro-batch.
+        
+        Args:
+            texts: Texts to score
+            use_cache: Read and write the sentiment cache
+        
+        Returns:
+            (sentiment_label, sentiment_score) per text
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, use_cache, future))
+        return await future
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            size = len(pending[0][0])
+            deadline = loop.time() + self.window
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                size += len(item[0])
+            
+            try:
+                results = await loop.run_in_executor(self._executor, self._score, pending)
+            except Exception as e:
+                logger.error(f"Sentiment batch of {size} texts failed: {e}")
+                for _, _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            self.requests += len(pending)
+            self.texts += size
+            self.batches += 1
+            for (_, _, future), sentiments in zip(pending, results):
+                if not future.done():
+                    future.set_result(sentiments)
+    
+    def _score(self, pending: list) -> List[List[tuple]]:
+        """Score all pending requests, one call per cache setting, and split per request."""
+        results = [None] * len(pending)
+        for use_cache in (True, False):
+            members = [i for i, (_, flag, _) in enumerate(pending) if flag == use_cache]
+            if not members:
+                continue
+            sentiments = self.score_fn(
+                [text for i in members for text in pending[i][0]],
+                use_cache=use_cache
+            )
+            offset = 0
+            for i in members:
+                count = len(pending[i][0])
+                results[i] = sentiments[offset:offset + count]
+                offset += count
+        return results
+    
+    def stats(self) -> dict:
+        """Requests, texts and batches served, and the mean texts per batch."""
+        return {
+            "requests": self.requests,
+            "texts": self.texts,
+            "batches": self.batches,
+            "mean_batch_texts": round(self.texts / self.batches, 2) if self.batches else None,
+        }
+
+
+class SentimentRequest(BaseModel):
+    texts: List[str]
+    use_cache: bool = True
+
+
+app = FastAPI(title="Sentiment Inference Server")
+batcher = MicroBatcher(
+    news_ingestor.get_sentiments_finbert,
+    window_ms=SENTIMENT_SERVER_BATCH_WINDOW_MS,
+    max_batch=SENTIMENT_SERVER_MAX_BATCH
+)
+started_at = time.time()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Start the micro-batching loop"""
+    batcher.start()
+    logger.info(
+        f"Sentiment server ready ({news_ingestor.SENTIMENT_BACKEND} backend, "
+        f"window {SENTIMENT_SERVER_BATCH_WINDOW_MS:g} ms, max batch {SENTIMENT_SERVER_MAX_BATCH})"
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the micro-batching loop"""
+    await batcher.stop()
+
+
+@app.get("/health")
+async def health():
+    """Model status and batching counters"""
+    return {
+        "status": "ok",
+        "finbert_available": news_ingestor.FINBERT_AVAILABLE,
+        "backend": news_ingestor.SENTIMENT_BACKEND,
+        "model_version": news_ingestor.SENTIMENT_MODEL_VERSION,
+        "uptime_seconds": round(time.time() - started_at, 1),
+        "batching": batcher.stats(),
+    }
+
+
+@app.post("/sentiment")
+async def score_sentiment(request: SentimentRequest):
+    """Score texts; concurrent calls share FinBERT batches"""
+    sentiments = await batcher.submit(request.texts, use_cache=request.use_cache)
+    return {"sentiments": [[label, float(score)] for label, score in sentiments]}
+
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    parser = argparse.ArgumentParser(description="Serve FinBERT sentiment on localhost")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    
+    uvicorn.run(app, host=args.host, port=args.port, workers=1)
@@ -0,0 +1,39 @@
+"""
+Migrate Legacy Event Detail Cache Keys
+
+Purpose:
+    Event details used to be cached as one key per event
+    ('news:event:{company}:{timestamp}'). They now live in one hash per company
+    and cache generation ('news:event_details:{company}:g{n}'), so lookups are
+    a single HGET. Invalidation does not delete anything: the pipeline bumps
+    the company's generation counter ('news:gen:{company}'), readers move to
+    the new generation's keys and the old ones expire with their TTL.
+    
+    This script moves any remaining legacy keys into the hash of the company's
+    current generation (keeping their remaining TTL) and deletes them. Safe to
+    run while the API is serving; legacy keys also expire on their own within
+    the cache TTL.
+
+USAGE:
+    python migrate_cache_keys.py
+"""
+
+from dotenv import load_dotenv
+
+from cache.redis_client import get_redis_client
+
+
+def main():
+    load_dotenv()
+    cache = get_redis_client()
+    
+    if not cache.enabled:
+        print("Redis not available. Nothing to migrate.")
+        return
+    
+    migrated = cache.migrate_legacy_event_keys()
+    print(f"Migrated {migrated} legacy event detail keys")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,8 @@ EXPECTED BEHAVIOR:
        - Enriches with FinBERT sentiment
        - Optionally fetches stock prices and computes event metrics
        - Indexes enriched documents into Elasticsearch
-    3. Prints summary: companies processed, documents indexed, time taken
+    3. Warms the API cache, most read companies first (skip with --no-warm-cache)
+    4. Prints summary: companies processed, documents indexed, time taken
 
 TESTING:
     # Test with single company
@@ -29,9 +30,21 @@ REQUIREMENTS:
     - Elasticsearch running at localhost:9200 (or set ES_HOST in .env)
     - company_tickers.json in project root
     - .env file with configuration (optional)
+    - SENTIMENT_BACKEND=onnx (environment) scores sentiment with int8-quantized
+      FinBERT on ONNX Runtime instead of PyTorch (needs onnxruntime and onnx)
+    - Sentiment results are cached in data/sentiment_cache.sqlite3, so re-running
+      a processed window skips inference (SENTIMENT_CACHE_ENABLED=false to turn off,
+      SENTIMENT_CACHE_REDIS=true to share results through Redis)
+    - SENTIMENT_MODE=cascade lets a lexicon scorer label the titles it is confident
+      about and sends only the rest to FinBERT (SENTIMENT_CASCADE_MARGIN, default 0.6;
+      see benchmark_sentiment_cascade.py to pick a margin for large backfills)
+    - SENTIMENT_SERVER_URL=http://127.0.0.1:8765 scores sentiment on a shared
+      `python -m ingestion.sentiment_server` process instead of loading FinBERT
+      here; falls back to in-process inference if the server is unreachable
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
@@ -51,6 +64,7 @@ from ingestion.news_ingestor import fetch_gdelt_news
 from ingestion.stock_data import get_stock_ohlcv
 from ingestion.enrich import enrich_news_with_price
 from ingestion.es_loader import index_dataframe
+from cache.redis_client import get_redis_client
 
 # Configure logging
 logging.basicConfig(
@@ -238,7 +252,8 @@ def run_pipeline(
     end_date: str,
     index_name: str = "stock_news",
     with_prices: bool = False,
-    max_records: int = 250
+    max_records: int = 250,
+    warm_cache: bool = True
 ):
     """
     Run the complete news ingestion pipeline.
@@ -250,6 +265,7 @@ def run_pipeline(
         index_name: Elasticsearch index name (default: stock_news)
         with_prices: Whether to fetch and enrich with price data (default: False)
         max_records: Max records per company (default: 250)
+        warm_cache: Pre-populate the API cache after indexing (default: True)
     """
     start_time = time.time()
     
@@ -269,9 +285,13 @@ def run_pipeline(
         logger.error(f"Failed to connect to Elasticsearch: {e}")
         return
     
+    # API caches are keyed on per-company generations bumped after each index
+    cache = get_redis_client()
+    
     total_docs_indexed = 0
     total_docs_failed = 0
     companies_processed = 0
+    companies_updated = []
     
     for company in companies:
         try:
@@ -324,6 +344,14 @@ def run_pipeline(
             total_docs_failed += result["failed"]
             companies_processed += 1
             
+            # Move API readers to fresh cache keys for this company. Refresh
+            # first, so a read racing the bump cannot cache pre-ingest results
+            # under the new generation.
+            if result["success"] > 0:
+                es.indices.refresh(index=index_name)
+                cache.bump_generation(company)
+                companies_updated.append(company)
+            
             logger.info(f"✓ {company}: {result['success']} docs indexed")
             
             # Rate limiting between companies
@@ -333,6 +361,16 @@ def run_pipeline(
             logger.error(f"Error processing {company}: {e}")
             continue
     
+    # Refill the API cache for the companies whose generation moved
+    warm_stats = None
+    if warm_cache and cache.enabled and companies_updated:
+        try:
+            # Imported here so runs that skip the warm-up never load the API stack
+            from api.warmer import warm_cache_standalone
+            warm_stats = asyncio.run(warm_cache_standalone(companies_updated))
+        except Exception as e:
+            logger.error(f"Cache warm-up failed: {e}")
+    
     # Print summary
     elapsed_time = time.time() - start_time
     
@@ -342,6 +380,11 @@ def run_pipeline(
     logger.info(f"Companies processed: {companies_processed}/{len(companies)}")
     logger.info(f"Documents indexed: {total_docs_indexed}")
     logger.info(f"Documents failed: {total_docs_failed}")
+    if warm_stats is not None:
+        logger.info(
+            f"Cache warmed: {warm_stats['companies_warmed']} companies, "
+            f"{sum(warm_stats['filled'].values())} entries in {warm_stats['elapsed_seconds']:.2f}s"
+        )
     logger.info(f"Time taken: {elapsed_time:.2f} seconds")
     logger.info("=" * 80)
 
@@ -412,6 +455,12 @@ Examples:
         help="Max records per company (default: 250)"
     )
     
+    parser.add_argument(
+        "--no-warm-cache",
+        action="store_true",
+        help="Skip pre-populating the API cache after indexing"
+    )
+    
     args = parser.parse_args()
     
     # Parse companies
@@ -428,7 +477,8 @@ Examples:
         end_date=args.end_date,
         index_name=args.index,
         with_prices=args.with_prices,
-        max_records=args.max_records
+        max_records=args.max_records,
+        warm_cache=not args.no_warm_cache
     )
 
 